@@ -0,0 +1,70 @@
+"Benchmark for reading the device list at different numbers of devices."
+import os
+import timeit
+from ctypes import create_string_buffer
+
+os.environ["THORLABS_KINESIS_BACKEND"] = "sim"
+
+from thorlabs_kinesis import benchtop_stepper_motor as bsm  # noqa: E402
+from thorlabs_kinesis.ext import DeviceListReader  # noqa: E402
+from thorlabs_kinesis.sim import engine  # noqa: E402
+
+COUNTS = [1, 50, 500]
+
+# What the examples do: a buffer of fixed size allocated on every call.
+FIXED_SIZE = 250
+
+
+def parse(buffer):
+    return [serial for serial in buffer.value.decode().split(",") if serial]
+
+
+def read_fixed():
+    buffer = create_string_buffer(FIXED_SIZE)
+    bsm.TLI_GetDeviceListExt(buffer, FIXED_SIZE)
+    return parse(buffer)
+
+
+def read_sized():
+    size = bsm.TLI_GetDeviceListSize() * 9 + 1
+    buffer = create_string_buffer(size)
+    bsm.TLI_GetDeviceListExt(buffer, size)
+    return parse(buffer)
+
+
+def best(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def measure_fresh(size: int, read, number: int):
+    buffer = create_string_buffer(size)
+    bsm.TLI_GetDeviceListExt(buffer, size)
+    return (f"{best(lambda: create_string_buffer(size), number):.2f}",
+            best(lambda: parse(buffer), number), best(read, number),
+            len(read()))
+
+
+def measure_reader(number: int):
+    reader = DeviceListReader(bsm)
+    found = reader.read()
+    return ("reused", best(reader._parse, number), best(reader.read, number),
+            len(found))
+
+
+if __name__ == "__main__":
+    print(f"{'devices':>8}{'buffer':>10}{'alloc [us]':>12}{'parse [us]':>12}"
+          f"{'read [us]':>11}{'found':>7}")
+    for count in COUNTS:
+        engine.reset()
+        engine.add_devices(45, count)
+        bsm.TLI_BuildDeviceList()
+        number = max(20000 // count, 100)
+
+        rows = [
+            ("fixed", measure_fresh(FIXED_SIZE, read_fixed, number)),
+            ("sized", measure_fresh(count * 9 + 1, read_sized, number)),
+            ("reader", measure_reader(number)),
+        ]
+        for i, (name, (alloc, parsed, read, found)) in enumerate(rows):
+            print(f"{count if i == 0 else '':>8}{name:>10}{alloc:>12}"
+                  f"{parsed:>12.2f}{read:>11.2f}{found:>7}")
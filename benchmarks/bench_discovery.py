@@ -0,0 +1,34 @@
+"Benchmark for discovering the devices of every binding module at once."
+import os
+
+os.environ["THORLABS_KINESIS_BACKEND"] = "sim"
+
+from thorlabs_kinesis.ext import discover  # noqa: E402
+from thorlabs_kinesis.sim import engine  # noqa: E402
+
+# How long enumerating the USB bus takes for a single DLL.
+SCAN_TIME = 0.2
+
+BENCH = {
+    40: 4,
+    70: 4,
+    45: 6,
+    55: 4,
+    49: 4,
+}
+
+
+if __name__ == "__main__":
+    for prefix, count in BENCH.items():
+        engine.add_devices(prefix, count)
+    engine.scan_time = SCAN_TIME
+    print(f"{sum(BENCH.values())} controllers, {SCAN_TIME * 1e3:.0f} ms "
+          f"per bus scan\n")
+
+    print(f"{'workers':<12}{'devices':>10}{'total [ms]':>12}  per module [ms]")
+    for workers in (1, None):
+        found = discover(max_workers=workers)
+        timings = ", ".join(f"{name} {elapsed * 1e3:.0f}"
+                            for name, elapsed in found.timings.items())
+        print(f"{workers or 'one each':<12}{len(found.devices):>10}"
+              f"{found.elapsed * 1e3:>12.1f}  {timings}")
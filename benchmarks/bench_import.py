@@ -0,0 +1,57 @@
+"Benchmark for the cold import cost of the binding modules."
+import subprocess
+import sys
+
+MODULES = [
+    "benchtop_brushless_motor",
+    "benchtop_piezo",
+    "benchtop_stepper_motor",
+    "integrated_stepper_motors",
+    "kcube_dcservo",
+]
+
+# Runs in a fresh interpreter so nothing is cached between measurements.
+PROBE = """
+import time
+import thorlabs_kinesis
+from thorlabs_kinesis._utils import LazyFunction
+
+start = time.perf_counter()
+module = __import__("thorlabs_kinesis.{name}", fromlist=["lib"])
+imported = time.perf_counter() - start
+
+pending = [name for name in dir(module)
+           if name not in vars(module) or isinstance(getattr(module, name), LazyFunction)]
+print(imported, int(module.lib.loaded), len(pending))
+
+start = time.perf_counter()
+try:
+    for name in pending:
+        getattr(module, name)
+except OSError:
+    print("nan")
+else:
+    print(time.perf_counter() - start)
+"""
+
+
+def measure(name: str, repeat: int=5):
+    best_import, best_bind = float("inf"), float("inf")
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-W", "ignore", "-c",
+                              PROBE.format(name=name)],
+                             check=True, capture_output=True, text=True)
+        first, second = out.stdout.splitlines()
+        imported, loaded, deferred = first.split()
+        best_import = min(best_import, float(imported))
+        best_bind = min(best_bind, float(second))
+    return best_import, bool(int(loaded)), int(deferred), best_bind
+
+
+if __name__ == "__main__":
+    print(f"{'module':<28}{'import [ms]':>12}{'dll loaded':>12}"
+          f"{'deferred':>10}{'bind all [ms]':>15}")
+    for name in MODULES:
+        imported, loaded, deferred, bound = measure(name)
+        print(f"{name:<28}{imported * 1e3:>12.2f}{str(loaded):>12}"
+              f"{deferred:>10}{bound * 1e3:>15.2f}")
@@ -0,0 +1,60 @@
+"Benchmark for taking messages off the queue one by one and in bulk."
+import os
+import time
+from ctypes import byref
+
+os.environ["THORLABS_KINESIS_BACKEND"] = "sim"
+
+from thorlabs_kinesis import integrated_stepper_motors as isc  # noqa: E402
+from thorlabs_kinesis._utils import (  # noqa: E402
+    c_dword,
+    c_word,
+)
+from thorlabs_kinesis.ext import (  # noqa: E402
+    MessageDrain,
+    Motor,
+)
+from thorlabs_kinesis.sim import engine  # noqa: E402
+
+COUNTS = [10, 100, 1000]
+SERIAL = b"45000001"
+
+
+def drain_loop():
+    # What the examples do: new out-parameters for every message.
+    messages = []
+    while True:
+        message_type, message_id, data = c_word(), c_word(), c_dword()
+        if not isc.ISC_GetNextMessage(SERIAL, byref(message_type),
+                                      byref(message_id), byref(data)):
+            return messages
+        messages.append((message_type.value, message_id.value, data.value))
+
+
+def measure(drain, channel, count: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        for i in range(count):
+            channel.push_message(2, 1, i)
+        start = time.perf_counter()
+        drain()
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def main():
+    engine.add_devices(45, 1)
+    motor = Motor(SERIAL.decode())
+    motor.open()
+    channel = engine.device(SERIAL.decode()).channels[1]
+    drain = MessageDrain(motor, capacity=max(COUNTS))
+    drain()
+
+    print(f"{'messages':>8} {'loop us/msg':>12} {'drain us/msg':>13}")
+    for count in COUNTS:
+        print(f"{count:>8} {measure(drain_loop, channel, count):>12.2f} "
+              f"{measure(drain, channel, count):>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
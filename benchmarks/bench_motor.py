@@ -0,0 +1,76 @@
+"Benchmark for the per-call overhead of Motor against the module functions."
+import ctypes.util
+import os
+import sys
+import timeit
+from functools import partial
+from ctypes import (
+    CDLL,
+    CFUNCTYPE,
+    POINTER,
+    c_char,
+    c_char_p,
+    c_int,
+    c_short,
+    cast,
+)
+
+os.environ["THORLABS_KINESIS_BACKEND"] = "sim"
+
+from thorlabs_kinesis import benchtop_stepper_motor as bsm  # noqa: E402
+from thorlabs_kinesis.ext import Motor  # noqa: E402
+from thorlabs_kinesis.sim import engine  # noqa: E402
+
+SERIAL = "40000001"
+NUMBER = 200000
+FUNCTIONS = ["GetPosition", "GetStatusBits", "RequestPosition"]
+
+
+def best(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=7)) / NUMBER * 1e6
+
+
+def c_stub():
+    """A C function with the SBC_GetPosition prototype that returns at once,
+    so only the Python side of a call is measured. strlen ignores the extra
+    channel argument, the caller cleans up the stack.
+    """
+    libc = CDLL("msvcrt" if sys.platform == "win32"
+                else ctypes.util.find_library("c"))
+    return CFUNCTYPE(c_int, POINTER(c_char), c_short)(
+        cast(libc.strlen, ctypes.c_void_p).value)
+
+
+def measure(functions, handles):
+    serial = SERIAL.encode()
+    for name in handles:
+        func = functions[name]
+        examples = best(lambda: func(c_char_p(bytes(SERIAL, "utf-8")),
+                                     c_short(1)))
+        raw = best(lambda: func(serial, 1))
+        handle = best(handles[name])
+        print(f"{name:<18}{examples:>10.3f}{raw:>10.3f}{handle:>10.3f}")
+
+
+if __name__ == "__main__":
+    engine.add_device(SERIAL)
+    motor = Motor(SERIAL)
+    motor.open()
+    # "examples" converts the arguments on every call like the examples do,
+    # "raw" passes bytes and an int to the module function.
+    header = f"{'examples':>10}{'raw':>10}{'Motor':>10}"
+
+    print(f"{'simulator [us]':<18}{header}")
+    measure({name: getattr(bsm, "SBC_" + name) for name in FUNCTIONS},
+            {"GetPosition": motor.get_position,
+             "GetStatusBits": motor.get_status_bits,
+             "RequestPosition": motor.request_position})
+
+    # Motor's getters with their DLL function swapped for the stub. The
+    # stub returns 8, which the request functions would take for an error.
+    stub = c_stub()
+    channel = motor.channel(1)
+    print(f"\n{'C stub [us]':<18}{header}")
+    measure({name: stub for name in FUNCTIONS},
+            {"GetPosition": partial(stub, *channel._args),
+             "GetStatusBits": partial(stub, *channel._args)})
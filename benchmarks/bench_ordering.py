@@ -0,0 +1,37 @@
+"Benchmark for ordering scan points by move time."
+import time
+
+import numpy as np
+
+from thorlabs_kinesis.ext import (
+    MoveProfile,
+    order_points,
+    plan_time,
+)
+
+# Two Long Travel Stages (LTS150) in device units: 409600 counts per mm,
+# 20 mm/s and 10 mm/s^2, as simulated.
+PROFILE = MoveProfile(velocity=8.192e6, acceleration=4.096e6)
+TRAVEL = 150 * 409600
+SIZES = [100, 1000, 10000]
+
+
+def main():
+    profiles = [PROFILE, PROFILE]
+    start = [0, 0]
+    rng = np.random.default_rng(0)
+    print(f"{'points':>8} {'given s':>10} {'ordered s':>10} {'saved':>7} "
+          f"{'optimize s':>11}")
+    for size in SIZES:
+        plan = rng.integers(0, TRAVEL, (size, 2))
+        given = plan_time(profiles, plan, start).sum()
+        begin = time.perf_counter()
+        order = order_points(plan, profiles, start)
+        optimize = time.perf_counter() - begin
+        ordered = plan_time(profiles, plan[order], start).sum()
+        print(f"{size:>8} {given:>10.1f} {ordered:>10.1f} "
+              f"{1 - ordered / given:>7.0%} {optimize:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"Benchmark for a grid scan, hand-written loop against the pipelined Scan."
+import os
+import time
+
+import numpy as np
+
+os.environ["THORLABS_KINESIS_BACKEND"] = "sim"
+
+from thorlabs_kinesis.ext import (  # noqa: E402
+    Motor,
+    Scan,
+)
+from thorlabs_kinesis.sim import engine  # noqa: E402
+
+SERIAL = "70000001"
+# 8 x 8 grid with 5 um steps of an HS DRV001 stage.
+STEP = 2730
+SIZE = 8
+# Time the host spends on every point, e.g. saving an image.
+PROCESSING = 0.02
+
+
+def grid() -> np.ndarray:
+    x, y = np.meshgrid(np.arange(SIZE) * STEP, np.arange(SIZE) * STEP)
+    return np.column_stack([x.ravel(), y.ravel()]).astype(np.int32)
+
+
+def acquire(index, target):
+    return index
+
+
+def loop_scan(channels, plan) -> float:
+    # What the examples do: one channel after the other, then the work.
+    start = time.perf_counter()
+    for index, target in enumerate(plan.tolist()):
+        for channel, position in zip(channels, target):
+            if channel.get_position() != position:
+                channel.move_to(position)
+                channel.wait_for_move()
+        acquire(index, target)
+        time.sleep(PROCESSING)
+    return time.perf_counter() - start
+
+
+def pipelined_scan(channels, plan) -> float:
+    scan = Scan(channels, plan, acquire=acquire)
+    for point in scan.run():
+        time.sleep(PROCESSING)
+    return scan.elapsed
+
+
+def main():
+    engine.add_devices(70, 1)
+    motor = Motor(SERIAL)
+    motor.open()
+    channels = [motor[1], motor[2]]
+    for channel in channels:
+        channel.start_polling(20)
+        channel.home()
+        channel.wait_for_home()
+    plan = grid()
+
+    for name, scan in [("loop", loop_scan), ("pipelined", pipelined_scan)]:
+        for channel in channels:
+            channel.move_to(0)
+            channel.wait_for_move()
+        elapsed = scan(channels, plan)
+        print(f"{name:>10}: {len(plan)} points in {elapsed:.2f} s, "
+              f"{len(plan) / elapsed:.1f} points/s")
+
+
+if __name__ == "__main__":
+    main()
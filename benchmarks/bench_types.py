@@ -0,0 +1,63 @@
+"Benchmark for the cost of the enums and structures shared by the binding modules."
+import subprocess
+import sys
+
+FAMILIES = 5
+
+# Creating the types once per family is what every binding module did when
+# each carried its own copy.
+PROBE = """
+import time
+import tracemalloc
+import thorlabs_kinesis._utils
+from thorlabs_kinesis import _types
+
+code = compile(open(_types.__file__).read(), _types.__file__, "exec")
+tracemalloc.start()
+start = time.perf_counter()
+for _ in range({copies}):
+    exec(code, {{"__name__": "copy"}})
+elapsed = time.perf_counter() - start
+print(elapsed, tracemalloc.get_traced_memory()[0])
+"""
+
+# Importing every binding module, checking that they share their structures.
+IMPORT_ALL = """
+import time
+import tracemalloc
+import thorlabs_kinesis
+
+tracemalloc.start()
+start = time.perf_counter()
+from thorlabs_kinesis import (benchtop_brushless_motor, benchtop_piezo,
+    benchtop_stepper_motor, integrated_stepper_motors, kcube_dcservo)
+elapsed = time.perf_counter() - start
+modules = [benchtop_brushless_motor, benchtop_piezo, benchtop_stepper_motor,
+           integrated_stepper_motors, kcube_dcservo]
+print(elapsed, tracemalloc.get_traced_memory()[0],
+      len({id(module.TLI_DeviceInfo) for module in modules}))
+"""
+
+
+def run(code: str, repeat: int=5):
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-W", "ignore", "-c", code],
+                             check=True, capture_output=True, text=True)
+        values = [float(value) for value in out.stdout.split()]
+        if best is None or values[0] < best[0]:
+            best = values
+    return best
+
+
+if __name__ == "__main__":
+    once, memory_once = run(PROBE.format(copies=1))
+    per_family, memory_per_family = run(PROBE.format(copies=FAMILIES))
+    print(f"{'types created':<28}{'time [ms]':>12}{'memory [kB]':>14}")
+    print(f"{'once per family':<28}{per_family * 1e3:>12.2f}"
+          f"{memory_per_family / 1024:>14.1f}")
+    print(f"{'once, shared':<28}{once * 1e3:>12.2f}{memory_once / 1024:>14.1f}")
+
+    elapsed, memory, classes = run(IMPORT_ALL)
+    print(f"\nimporting all {FAMILIES} binding modules: {elapsed * 1e3:.2f} ms, "
+          f"{memory / 1024:.1f} kB, {int(classes)} TLI_DeviceInfo class(es)")
@@ -0,0 +1,54 @@
+"Benchmark for converting scan plans between real and device units."
+import time
+
+import numpy as np
+
+from thorlabs_kinesis.ext import (
+    UnitConverter,
+    device_to_real_units,
+    real_to_device_units,
+)
+
+MOTOR_TYPE = "HS DRV001 8mm"
+SIZES = [1000, 100000, 1000000]
+
+
+def best(func, *args) -> float:
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def per_value_to_device(real):
+    return [real_to_device_units(MOTOR_TYPE, value) for value in real]
+
+
+def per_value_to_real(device):
+    return [device_to_real_units(MOTOR_TYPE, value) for value in device]
+
+
+def main():
+    converter = UnitConverter(MOTOR_TYPE)
+    print(f"{'points':>8} {'direction':>10} {'per value ms':>13} "
+          f"{'converter ms':>13} {'speedup':>8}")
+    for size in SIZES:
+        real = np.random.uniform(0, 8, size)
+        device = converter.to_device(real)
+        cases = [
+            ("to device", per_value_to_device, real.tolist(),
+             converter.to_device, real),
+            ("to real", per_value_to_real, device.tolist(),
+             converter.to_real, device),
+        ]
+        for name, slow, slow_arg, fast, fast_arg in cases:
+            slow_time = best(slow, slow_arg)
+            fast_time = best(fast, fast_arg)
+            print(f"{size:>8} {name:>10} {slow_time * 1e3:>13.2f} "
+                  f"{fast_time * 1e3:>13.3f} {slow_time / fast_time:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ from ctypes.wintypes import (
 #     steps_per_mm = 34304
 
 from thorlabs_kinesis import kcube_dcservo as kcdc
+from thorlabs_kinesis.ext import is_moving
 
 if kcdc.TLI_BuildDeviceList() == 0:
     print("Device list built (no errors).")
@@ -111,7 +112,8 @@ if kcdc.TLI_BuildDeviceList() == 0:
 
     # Test CC_MoveJog
     kcdc.CC_MoveJog(serialno, kcdc.MOT_Reverse)
-    kcdc.is_moving(serialno)
+    time.sleep(0.4)
+    print("Moving:", is_moving(kcdc.CC_GetStatusBits(serialno)))
 
     # Get position again.
     kcdc.CC_RequestPosition(serialno)
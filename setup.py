@@ -49,6 +49,7 @@ setup_args = dict(
     keywords="laboratory instrumentation hardware science motion control ThorLabs",
     platforms=["Windows",],
     packages=setuptools.find_packages(),
+    package_data={"thorlabs_kinesis.ext": ["stages.json"]},
     classifiers=[
         "License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)",
         "Operating System :: Microsoft :: Windows",
@@ -63,6 +64,9 @@ setup_args = dict(
         "Topic :: Scientific/Engineering",
     ],
     python_requires=">=3.6",
+    extras_require={
+        "numpy": ["numpy"],
+    },
 )
 
 setuptools.setup(**setup_args)
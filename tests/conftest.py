@@ -0,0 +1,19 @@
+"The tests run against the simulated devices of the ``sim`` backend."
+import os
+
+os.environ["THORLABS_KINESIS_BACKEND"] = "sim"
+
+import pytest  # noqa: E402
+
+import thorlabs_kinesis  # noqa: E402
+from thorlabs_kinesis.sim import engine as sim_engine  # noqa: E402
+
+thorlabs_kinesis.config.backend = "sim"
+
+
+@pytest.fixture
+def engine():
+    "The shared simulation engine, without devices before and after a test."
+    sim_engine.reset()
+    yield sim_engine
+    sim_engine.reset()
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from thorlabs_kinesis.ext import aio
+
+# A 0.1 mm move of an LTS150 at 10 mm/s², triangular: about 0.2 s.
+DISTANCE = 40960
+
+
+@pytest.fixture
+def stage(engine):
+    engine.add_device("45000001")
+    motor = aio.Motor("45000001")
+    motor.open()
+    yield motor
+    motor.close()
+
+
+def test_move(stage):
+    async def main():
+        assert await stage.move_to(DISTANCE, timeout=5)
+        assert await stage.move_by(-DISTANCE, timeout=5)
+        stage.motor.request_position()
+        return stage.motor.get_position()
+
+    assert asyncio.run(main()) == 0
+    assert not stage.channel(1)._pending
+
+
+def test_home(stage):
+    async def main():
+        await stage.move_to(DISTANCE, timeout=5)
+        return await stage.home(timeout=5)
+
+    assert asyncio.run(main())
+
+
+def test_stop(stage):
+    async def main():
+        move = asyncio.ensure_future(stage.move_to(10 * DISTANCE))
+        await asyncio.sleep(0.05)
+        stage.stop(profiled=False)
+        return await move
+
+    assert not asyncio.run(main())
+
+
+def test_timeout_forgets_future(stage):
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await stage.move_to(10 * DISTANCE, timeout=0.05)
+        assert not stage.channel(1)._pending
+        stage.stop(profiled=False)
+
+    asyncio.run(main())
+
+
+def test_failed_command_forgets_future(stage):
+    async def main():
+        with pytest.raises(OSError):
+            await stage.move_to(10000 * DISTANCE)
+
+    asyncio.run(main())
+    assert not stage.channel(1)._pending
+
+
+def test_watch(stage):
+    async def main():
+        statuses = []
+        move = asyncio.ensure_future(stage.move_to(DISTANCE))
+        async for status in stage.watch(interval=0.02):
+            statuses.append(status)
+            if move.done():
+                break
+        return statuses
+
+    statuses = asyncio.run(main())
+    assert len(statuses) > 2
+    assert statuses[-1].position == DISTANCE
+
+
+def test_other_loop(stage):
+    asyncio.run(stage.move_to(DISTANCE, timeout=5))
+    with pytest.raises(RuntimeError):
+        asyncio.run(stage.move_to(0, timeout=5))
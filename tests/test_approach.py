@@ -0,0 +1,116 @@
+import pytest
+
+from thorlabs_kinesis.ext import (
+    ApproachPlanner,
+    Motor,
+    backlash_disabled,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def check(planner, plan, approach, start=None):
+    "Every point is measured, in order, reached moving in its direction."
+    waypoints = approach.waypoints
+    assert waypoints.dtype == np.int32
+    assert waypoints[approach.measured].tolist() == \
+        np.reshape(plan, (len(plan), -1)).tolist()
+    previous = np.concatenate((
+        [start if start is not None
+         else np.full(len(planner), np.iinfo(np.int32).min)],
+        waypoints[:-1]))
+    for row in np.flatnonzero(approach.measured):
+        delta = (waypoints[row] - previous[row]).astype(np.int64)
+        if start is None and row == 0:
+            continue
+        assert ((delta * planner.direction >= 0)
+                | (planner.backlash == 0)).all()
+    # Overshoots are each followed by their point.
+    assert approach.measured[-1] if len(waypoints) else True
+    assert not (~approach.measured[:-1] & ~approach.measured[1:]).any()
+
+
+def test_doctest_plan():
+    planner = ApproachPlanner([2000, 2000])
+    plan = [[0, 0], [1000, 5000], [500, 6000]]
+    approach = planner.plan(plan, start=[0, 0])
+    assert approach.waypoints.tolist() == [[0, 0], [1000, 5000],
+                                           [-1500, 6000], [500, 6000]]
+    check(planner, plan, approach, start=[0, 0])
+
+
+def test_without_start():
+    planner = ApproachPlanner([100, 200])
+    approach = planner.plan([[10, 20], [30, 40]])
+    assert approach.waypoints.tolist() == [[-90, -180], [10, 20], [30, 40]]
+    assert approach.measured.tolist() == [False, True, True]
+
+
+def test_reverse_direction():
+    planner = ApproachPlanner([100, 100], direction=[1, -1])
+    plan = [[0, 0], [50, 50], [0, 100]]
+    approach = planner.plan(plan, start=[0, 0])
+    # Axis 1 overshoots going up, then both axes on the last move.
+    assert approach.waypoints.tolist() == [[0, 0], [50, 150], [50, 50],
+                                           [-100, 200], [0, 100]]
+    check(planner, plan, approach, start=[0, 0])
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("direction", [1, -1, [1, -1, 1]])
+def test_random(seed, direction):
+    rng = np.random.default_rng(seed)
+    planner = ApproachPlanner(rng.integers(0, 500, 3), direction)
+    plan = rng.integers(-10000, 10000, (50, 3))
+    start = rng.integers(-10000, 10000, 3)
+    check(planner, plan, planner.plan(plan, start=start), start)
+    check(planner, plan, planner.plan(plan))
+
+
+def test_no_backlash():
+    planner = ApproachPlanner(0)
+    approach = planner.plan([5, 1, 3], start=0)
+    assert approach.waypoints.tolist() == [[5], [1], [3]]
+    assert approach.measured.all()
+
+
+def test_vector_and_empty():
+    planner = ApproachPlanner(10)
+    approach = planner.plan(np.array([5, 1], np.uint16), start=0)
+    assert approach.waypoints.tolist() == [[5], [-9], [1]]
+    approach = planner.plan(np.zeros((0, 1), np.int32))
+    assert approach.waypoints.shape == (0, 1)
+    assert approach.measured.shape == (0,)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        ApproachPlanner([-1])
+    with pytest.raises(ValueError):
+        ApproachPlanner([1, 1], direction=0)
+    with pytest.raises(ValueError):
+        ApproachPlanner([[1]])
+    planner = ApproachPlanner([1, 1])
+    with pytest.raises(ValueError):
+        planner.plan([[0, 0, 0]])
+    with pytest.raises(TypeError):
+        planner.plan([[0.5, 0.0]])
+    with pytest.raises(ValueError):
+        ApproachPlanner(10).plan([-2 ** 31 + 5])
+    assert repr(planner) == \
+        "<ApproachPlanner backlash [1, 1], direction [1, 1]>"
+
+
+def test_channels(engine):
+    engine.add_device("70000001")
+    with Motor("70000001") as bsc:
+        for number, distance in [(1, 300), (2, 0), (3, 50)]:
+            engine.device("70000001").channels[number].backlash = distance
+        planner = ApproachPlanner.from_channels([bsc[1], bsc[2], bsc[3]])
+        assert planner.backlash.tolist() == [300, 0, 50]
+        with backlash_disabled([bsc[1], bsc[3]]) as previous:
+            assert previous == [300, 50]
+            assert [engine.device("70000001").channels[number].backlash
+                    for number in (1, 2, 3)] == [0, 0, 0]
+        assert [engine.device("70000001").channels[number].backlash
+                for number in (1, 2, 3)] == [300, 0, 50]
@@ -0,0 +1,113 @@
+import os
+import pickle
+import subprocess
+import sys
+from ctypes import (
+    ArgumentError,
+    CFUNCTYPE,
+    c_int,
+    c_short,
+    cast,
+)
+
+import pytest
+
+import thorlabs_kinesis.benchtop_stepper_motor as sbc
+from thorlabs_kinesis._types import (
+    MOT_MotorTypes,
+    MOT_TravelDirection,
+)
+from thorlabs_kinesis._utils import LazyFunction
+
+
+def test_star_import_exports_functions():
+    namespace = {}
+    exec("from thorlabs_kinesis.benchtop_stepper_motor import *", namespace)
+    assert "SBC_Open" in namespace
+    assert "MOT_VelocityParameters" in namespace
+    assert not isinstance(namespace["SBC_Open"], LazyFunction)
+
+
+def test_all_lists_pending_functions():
+    assert "SBC_MoveToPosition" in sbc.__all__
+    assert "SBC_MoveToPosition" in dir(sbc)
+    assert not any(name.startswith("_") for name in sbc.__all__)
+
+
+def test_bound_on_first_access():
+    function = sbc.SBC_GetPosition
+    assert sbc.__dict__["SBC_GetPosition"] is function
+
+
+def test_unknown_attribute():
+    assert not hasattr(sbc, "SBC_Teleport")
+
+
+def test_missing_library_raises_attribute_error():
+    # The DLL backend can't load its libraries off Windows.
+    code = ("import sys, thorlabs_kinesis\n"
+            "thorlabs_kinesis.system = 'linux'\n"
+            "import thorlabs_kinesis.kcube_dcservo as cc\n"
+            "assert getattr(cc, 'CC_Open', None) is None\n"
+            "try:\n"
+            "    cc.CC_Close\n"
+            "except AttributeError as e:\n"
+            "    assert isinstance(e.__cause__, OSError)\n"
+            "else:\n"
+            "    sys.exit(1)\n")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, THORLABS_KINESIS_BACKEND="dll", PYTHONPATH=root)
+    result = subprocess.run([sys.executable, "-c", code], env=env)
+    assert result.returncode == 0
+
+
+def test_enum_members():
+    forwards = MOT_TravelDirection.MOT_Forwards
+    assert forwards == 1
+    assert isinstance(forwards, int)
+    assert forwards.name == "MOT_Forwards"
+    assert forwards.value == 1 and type(forwards.value) is int
+    assert repr(forwards) == "<MOT_TravelDirection.MOT_Forwards: 1>"
+    assert str(forwards) == "1"
+    assert MOT_TravelDirection(2) is MOT_TravelDirection.MOT_Reverse
+    with pytest.raises(ValueError):
+        MOT_TravelDirection(3)
+    assert 2 in MOT_TravelDirection
+    assert 3 not in MOT_TravelDirection
+    assert pickle.loads(pickle.dumps(forwards)) is forwards
+
+
+def test_enum_aliases():
+    "Members with the same value are one object, named after the first."
+    undefined = MOT_TravelDirection.MOT_TravelDirectionUndefined
+    assert MOT_TravelDirection.MOT_TravelDirectionDisabled is undefined
+    assert MOT_TravelDirection(0) is undefined
+    assert undefined.name == "MOT_TravelDirectionUndefined"
+    assert list(MOT_TravelDirection) == [0, 1, 2]
+    assert len(MOT_TravelDirection) == 3
+    assert list(MOT_TravelDirection.__members__) == [
+        "MOT_TravelDirectionUndefined", "MOT_TravelDirectionDisabled",
+        "MOT_Forwards", "MOT_Reverse"]
+
+
+def test_enum_immutable():
+    with pytest.raises(AttributeError):
+        MOT_TravelDirection.MOT_Forwards = 5
+    with pytest.raises(AttributeError):
+        MOT_TravelDirection.MOT_Forwards.name = "MOT_Backwards"
+    with pytest.raises(TypeError):
+        MOT_TravelDirection.__members__["MOT_Forwards"] = 5
+    assert MOT_TravelDirection.MOT_Forwards == 1
+
+
+def test_enum_from_param():
+    "Enums in argtypes convert like their C type."
+    assert MOT_TravelDirection.ctype is c_short
+    assert MOT_MotorTypes.ctype is c_int
+    assert MOT_TravelDirection.from_param == c_short.from_param
+    double = CFUNCTYPE(c_int, c_int)(lambda value: 2 * value)
+    call = cast(double, CFUNCTYPE(c_int, MOT_MotorTypes))
+    assert call(MOT_MotorTypes.MOT_StepperMotor) == 4
+    assert call(3) == 6
+    with pytest.raises(ArgumentError):
+        call("MOT_StepperMotor")
@@ -0,0 +1,70 @@
+import pytest
+
+from thorlabs_kinesis import benchtop_stepper_motor
+from thorlabs_kinesis.ext import DeviceListReader
+from thorlabs_kinesis.ext._device_list import ENTRY_SIZE
+
+
+def build():
+    assert benchtop_stepper_motor.TLI_BuildDeviceList() == 0
+
+
+def test_empty(engine):
+    build()
+    reader = DeviceListReader()
+    assert reader.module is benchtop_stepper_motor
+    assert reader.read() == ()
+    assert reader.size == 1
+
+
+def test_growth(engine):
+    reader = DeviceListReader(benchtop_stepper_motor)
+    engine.add_devices(45, 3)
+    build()
+    assert reader.read() == ("45000001", "45000002", "45000003")
+    assert reader.size == 3 * ENTRY_SIZE + 1
+    engine.add_devices(70, 200)
+    build()
+    serials = reader.read()
+    assert len(serials) == 203
+    assert serials[-1] == "70000200"
+    assert reader.size == 203 * ENTRY_SIZE + 1
+    # Fewer devices keep the buffer, without stale entries.
+    engine.reset()
+    engine.add_device("27000001")
+    build()
+    assert reader.read() == ("27000001",)
+    assert reader.size == 203 * ENTRY_SIZE + 1
+
+
+def test_not_built(engine):
+    "The list is the one of the last build."
+    build()
+    reader = DeviceListReader("benchtop_stepper_motor", size=100)
+    engine.add_device("45000001")
+    assert reader.read() == ()
+    build()
+    assert reader.read() == ("45000001",)
+    assert reader.size == 100
+
+
+def test_type_ids(engine):
+    engine.add_devices(45, 2)
+    engine.add_devices(70, 2)
+    engine.add_device("27000001")
+    build()
+    reader = DeviceListReader()
+    assert reader.read([45]) == ("45000001", "45000002")
+    assert reader.read([70, 27]) == ("70000001", "70000002", "27000001")
+    assert reader.read(iter([27])) == ("27000001",)
+    assert reader.read([55]) == ()
+    assert reader.read([]) == ()
+    assert len(reader.read()) == 5
+
+
+def test_error(engine, monkeypatch):
+    build()
+    monkeypatch.setattr(benchtop_stepper_motor, "TLI_GetDeviceListExt",
+                        lambda buffer, size: 4)
+    with pytest.raises(OSError):
+        DeviceListReader().read()
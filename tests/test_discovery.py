@@ -0,0 +1,112 @@
+import importlib
+
+import pytest
+
+from thorlabs_kinesis import (
+    benchtop_stepper_motor,
+    kcube_dcservo,
+)
+from thorlabs_kinesis.ext import discover
+from thorlabs_kinesis.ext._device import serial_prefix
+from thorlabs_kinesis.ext._discovery import module_types
+
+SERIALS = ["45000001", "55000001", "70000001", "40000001", "27000001",
+           "71000001"]
+
+
+@pytest.fixture
+def devices(engine):
+    for serial in SERIALS:
+        engine.add_device(serial)
+    return engine
+
+
+def unloadable(monkeypatch, module):
+    "Makes the library of a binding module fail to load, like without DLL."
+    def fail():
+        try:
+            raise OSError(f"Can't load the library of {module.__name__}.")
+        except OSError as err:
+            raise AttributeError("can't bind 'TLI_BuildDeviceList'") \
+                from err
+
+    monkeypatch.setattr(module, "TLI_BuildDeviceList", fail)
+
+
+def test_module_types():
+    types = module_types()
+    assert types["benchtop_stepper_motor"] == [40, 70]
+    assert types["kcube_dcservo"] == [27]
+    assert sorted(types["integrated_stepper_motors"]) == [45, 46, 49, 55]
+
+
+def test_merged(devices):
+    found = discover()
+    assert sorted(found.devices) == sorted(SERIALS)
+    for serial, device in found.devices.items():
+        assert device is serial_prefix[int(serial[:2])]
+    assert found.devices["45000001"].module == "integrated_stepper_motors"
+    assert found.devices["70000001"].module == "benchtop_stepper_motor"
+    assert found.devices["71000001"].module == "benchtop_piezo"
+    assert set(found.timings) == set(module_types())
+    assert found.errors == {}
+    assert found.elapsed >= max(found.timings.values())
+
+
+def test_modules(devices):
+    found = discover(["kcube_dcservo", "benchtop_stepper_motor",
+                      "benchtop_brushless_motor"])
+    assert sorted(found.devices) == ["27000001", "40000001", "70000001"]
+    # Modules without known types aren't asked.
+    assert set(found.timings) == {"kcube_dcservo", "benchtop_stepper_motor"}
+    assert discover([])[:3] == ({}, {}, {})
+
+
+def test_nothing_connected(engine):
+    found = discover(max_workers=1)
+    assert found.devices == {}
+    assert found.errors == {}
+
+
+def test_library_fails(devices, monkeypatch):
+    unloadable(monkeypatch, kcube_dcservo)
+    found = discover()
+    assert "27000001" not in found.devices
+    assert sorted(found.devices) == sorted(set(SERIALS) - {"27000001"})
+    assert set(found.errors) == {"kcube_dcservo"}
+    assert isinstance(found.errors["kcube_dcservo"], OSError)
+    assert "kcube_dcservo" in found.timings
+
+
+def test_build_fails(devices, monkeypatch):
+    monkeypatch.setattr(benchtop_stepper_motor, "TLI_BuildDeviceList",
+                        lambda: 3)
+    found = discover()
+    assert "70000001" not in found.devices
+    assert "45000001" in found.devices
+    assert str(found.errors["benchtop_stepper_motor"]) == \
+        "Can't build device list, error 3."
+
+
+def test_import_fails(devices, monkeypatch):
+    import_module = importlib.import_module
+
+    def failing(name, *args):
+        if name == "thorlabs_kinesis.benchtop_piezo":
+            raise ImportError(f"No module named {name!r}")
+        return import_module(name, *args)
+
+    monkeypatch.setattr(importlib, "import_module", failing)
+    found = discover()
+    assert isinstance(found.errors["benchtop_piezo"], ImportError)
+    assert "71000001" not in found.devices
+    assert "70000001" in found.devices
+
+
+def test_other_errors_raise(devices, monkeypatch):
+    def broken():
+        raise AttributeError("broken")
+
+    monkeypatch.setattr(kcube_dcservo, "TLI_BuildDeviceList", broken)
+    with pytest.raises(AttributeError):
+        discover()
@@ -0,0 +1,155 @@
+import gc
+from ctypes import (
+    c_void_p,
+    cast,
+)
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    DeviceHandle,
+    MessageDispatcher,
+    Motor,
+)
+from thorlabs_kinesis.ext import _callbacks
+from thorlabs_kinesis.ext._wait import (
+    HOMED,
+    MOVED,
+)
+
+# A 0.1 mm move of an LTS150 at 10 mm/s², triangular: about 0.2 s.
+DISTANCE = 40960
+
+
+def address(callback) -> int:
+    return cast(callback, c_void_p).value
+
+
+def registered(engine, serial: str="45000001") -> int:
+    "Address of the callback the simulated channel calls, if any."
+    callback = engine.device(serial).channels[1].callback
+    return None if callback is None else address(callback)
+
+
+@pytest.fixture
+def stage(engine):
+    engine.add_device("45000001")
+    motor = Motor("45000001")
+    motor.open()
+    yield motor
+    motor.close()
+
+
+def test_subscribe(stage):
+    with MessageDispatcher() as dispatcher:
+        moves = dispatcher.subscribe(stage, messages=[MOVED])
+        everything = dispatcher.subscribe(stage, maxlen=1)
+        stage.move_to(DISTANCE)
+        message = moves.get(timeout=5)
+        assert message[:3] == (2, 1, DISTANCE)
+        assert len(everything) == 1
+        # With the SettingsInitialized message of opening the device.
+        assert dispatcher.received() == {("45000001",): 2}
+        with pytest.raises(TimeoutError):
+            moves.get(timeout=0.05)
+
+
+def test_bounded_queue(stage, engine):
+    "Subscribers that don't read keep the last messages."
+    channel = engine.device("45000001").channels[1]
+    with MessageDispatcher() as dispatcher:
+        default = dispatcher.subscribe(stage)
+        small = dispatcher.subscribe(stage, maxlen=3)
+        unbounded = dispatcher.subscribe(stage, maxlen=None)
+        count = _callbacks.QUEUE_SIZE + 10
+        for data in range(count):
+            channel.push_message(2, 3, data)
+        assert len(default) == _callbacks.QUEUE_SIZE
+        assert default.poll().data == count - _callbacks.QUEUE_SIZE
+        assert default.dropped >= 10
+        assert [message.data for message in small.drain()] == \
+            [count - 3, count - 2, count - 1]
+        assert small.dropped >= count - 3
+        assert len(unbounded) >= count
+        assert unbounded.dropped == 0
+
+
+def test_channel_key(engine):
+    engine.add_device("70000001")
+    with DeviceHandle("70000001") as bsc, MessageDispatcher() as dispatcher:
+        subscription = dispatcher.subscribe(bsc, channel=2)
+        assert subscription.key == ("70000001", 2)
+        assert ("70000001", 2) in _callbacks._routes
+
+
+def test_shared_callback(stage, engine):
+    "The waits and the dispatchers don't replace each other's callback."
+    with MessageDispatcher() as first, MessageDispatcher() as second:
+        moves = first.subscribe(stage, messages=[MOVED])
+        homes = second.subscribe(stage.channel(1), messages=[HOMED])
+        stage.move_to(DISTANCE)
+        assert stage.wait_for_move(timeout=5)
+        assert moves.get(timeout=5).data == DISTANCE
+        stage.home()
+        assert stage.wait_for_home(timeout=5)
+        assert homes.get(timeout=5).data == 0
+        route = _callbacks._routes[("45000001",)]
+        assert len(route.subscriptions) == 3
+        assert registered(engine) == address(route.callback)
+
+
+def test_thunk_kept(stage, engine):
+    "The callback outlives the dispatcher that registered it."
+    subscription = MessageDispatcher().subscribe(stage, messages=[MOVED])
+    gc.collect()
+    stage.move_to(DISTANCE)
+    assert subscription.get(timeout=5).data == DISTANCE
+    subscription.close()
+
+
+def test_close_registers_no_callback(engine):
+    engine.add_device("45000001")
+    with DeviceHandle("45000001") as stage:
+        dispatcher = MessageDispatcher()
+        dispatcher.subscribe(stage)
+        dispatcher.close()
+        assert ("45000001",) not in _callbacks._routes
+        channel = engine.device("45000001").channels[1]
+        assert registered(engine) == address(_callbacks._no_callback)
+        stage.MoveToPosition(DISTANCE)
+        # The messages stay in the queue again, after the one of opening
+        # the device.
+        assert channel.next_message() == (0, 0, 0)
+        assert channel.next_message(wait=True) == (2, 1, DISTANCE)
+        assert dispatcher.received() == {}
+
+
+def test_callback_registered_again(stage, engine):
+    waiter = stage.channel(1).waiter
+    route = _callbacks._routes[("45000001",)]
+    stage.Close()
+    assert registered(engine) is None
+    stage.open()
+    assert registered(engine) == address(route.callback)
+    assert stage.channel(1).waiter is waiter
+    stage.move_to(DISTANCE)
+    assert stage.wait_for_move(timeout=5)
+
+
+def test_motor_close_releases(stage):
+    stage.channel(1).waiter
+    assert ("45000001",) in _callbacks._routes
+    stage.close()
+    assert ("45000001",) not in _callbacks._routes
+    stage.open()
+    stage.move_to(DISTANCE)
+    assert stage.wait_for_move(timeout=5)
+
+
+def test_piezo(engine):
+    engine.add_device("71000001")
+    with DeviceHandle("71000001") as piezo, \
+            MessageDispatcher() as dispatcher:
+        subscription = dispatcher.subscribe(piezo, channel=1)
+        piezo.SetZero(1)
+        assert subscription.get(timeout=5).type == 0
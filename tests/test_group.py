@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    ChannelGroup,
+    Motor,
+)
+
+# 0.02 mm of the HS DRV001 stages, at 2 mm/s²: about 0.2 s.
+STEP = 10922
+
+
+@pytest.fixture
+def bsc(engine):
+    engine.add_device("70000001")
+    motor = Motor("70000001")
+    motor.open()
+    yield motor
+    motor.close()
+
+
+def positions(engine, serial="70000001"):
+    channels = engine.device(serial).channels
+    return [channels[number].rest for number in sorted(channels)]
+
+
+def test_move_to(bsc, engine):
+    group = ChannelGroup([bsc[1], bsc[2], bsc[3]])
+    assert len(group) == 3
+    move = group.move_to([STEP, 2 * STEP, 0], timeout=5)
+    assert move.targets == (STEP, 2 * STEP, 0)
+    assert move.completed == (True, True, True)
+    assert move.started[0] <= move.started[1] <= move.started[2]
+    assert move.skew == move.started[-1] < 0.05
+    # The longest move finishes last, the channel already there at once.
+    assert move.finished[1] == move.elapsed
+    assert move.finished[2] < move.finished[0] < move.finished[1]
+    assert positions(engine) == [STEP, 2 * STEP, 0]
+
+
+def test_motors_and_controllers(engine, bsc):
+    engine.add_device("40000001")
+    with Motor("40000001") as other:
+        group = ChannelGroup([other, bsc[3]])
+        assert group.channels == (other.channel(1), bsc[3])
+        assert group.move_to([STEP, STEP], timeout=5).completed == \
+            (True, True)
+    assert positions(engine, "40000001") == [STEP]
+
+
+def test_earlier_messages_ignored(bsc):
+    "A Moved message left by an earlier move doesn't end the next one."
+    bsc[1].move_to(STEP)
+    time.sleep(0.4)
+    move = ChannelGroup([bsc[1]]).move_to([0], timeout=5)
+    assert move.elapsed > 0.15
+
+
+def test_stopped(bsc):
+    group = ChannelGroup([bsc[1], bsc[2]])
+    stop = threading.Timer(0.05, bsc[1].stop, [False])
+    stop.start()
+    move = group.move_to([10 * STEP, STEP], timeout=5)
+    stop.join()
+    assert move.completed == (False, True)
+
+
+def test_timeout(bsc):
+    group = ChannelGroup([bsc[1], bsc[2]])
+    with pytest.raises(TimeoutError) as info:
+        group.move_to([0, 10 * STEP], timeout=0.05)
+    assert "70000001 channel 2" in str(info.value)
+    assert "channel 1" not in str(info.value)
+    bsc[2].stop(False)
+
+
+def test_fire(bsc, engine):
+    group = ChannelGroup([bsc[1], bsc[2]])
+    group.stage([STEP, STEP])
+    started = group.fire()
+    assert len(started) == 2
+    assert positions(engine)[:2] == [STEP, STEP]
+
+
+def test_invalid(bsc):
+    with pytest.raises(ValueError):
+        ChannelGroup([])
+    with pytest.raises(ValueError):
+        ChannelGroup([bsc[1], bsc[2]]).stage([STEP])
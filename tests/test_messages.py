@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    DeviceHandle,
+    MessageDrain,
+    Motor,
+    message_name,
+    message_names,
+)
+from thorlabs_kinesis.sim._engine import MESSAGE_QUEUE_SIZE
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def stage(engine):
+    engine.add_device("45000001")
+    motor = Motor("45000001")
+    motor.open()
+    yield motor
+    motor.close()
+
+
+def queue(engine, serial="45000001", number=1):
+    return engine.device(serial).channels[number]
+
+
+def test_drain(stage, engine):
+    drain = MessageDrain(stage, capacity=4)
+    # The SettingsInitialized message of opening the device.
+    first = drain()
+    assert first[["type", "id", "data"]].tolist() == [(0, 0, 0)]
+    for data in range(10):
+        queue(engine).push_message(2, 1, data)
+    queue(engine).push_message(2, 2, 0xFFFFFFFF)
+    assert drain.pending() == 11
+    before = time.time()
+    messages = drain()
+    assert drain.capacity == 11
+    assert messages.dtype.names == ("type", "id", "data", "time")
+    assert messages["type"].tolist() == [2] * 11
+    assert messages["id"].tolist() == [1] * 10 + [2]
+    assert messages["data"].tolist() == list(range(10)) + [0xFFFFFFFF]
+    assert (messages["time"] >= before).all()
+    assert drain.pending() == 0
+
+
+def test_empty(stage):
+    drain = MessageDrain(stage)
+    drain()
+    messages = drain()
+    assert len(messages) == 0
+    assert messages.dtype.names == ("type", "id", "data", "time")
+    assert message_names(messages) == []
+
+
+def test_full_queue(stage, engine):
+    drain = MessageDrain(stage.channel(1))
+    for data in range(MESSAGE_QUEUE_SIZE + 10):
+        queue(engine).push_message(2, 3, data)
+    # The queue keeps the newest messages.
+    assert drain.pending() == MESSAGE_QUEUE_SIZE
+    messages = drain()
+    assert len(messages) == MESSAGE_QUEUE_SIZE
+    assert drain.capacity == MESSAGE_QUEUE_SIZE
+    assert messages["data"][0] == 10
+    assert messages["data"][-1] == MESSAGE_QUEUE_SIZE + 9
+    assert len(drain()) == 0
+    # The arrays are kept for the next drains.
+    queue(engine).push_message(2, 0, 0)
+    assert drain()["id"].tolist() == [0]
+    assert drain.capacity == MESSAGE_QUEUE_SIZE
+
+
+def test_handle_and_channel(engine):
+    engine.add_device("70000001")
+    with DeviceHandle("70000001") as bsc:
+        drain = MessageDrain(bsc, channel=2)
+        drain()
+        queue(engine, "70000001", 2).push_message(2, 0, 0)
+        queue(engine, "70000001", 3).push_message(2, 1, 0)
+        assert message_names(drain()) == ["GenericMotor.Homed"]
+        # Channel 3 wasn't drained since opening.
+        assert message_names(MessageDrain(bsc, channel=3)()) == [
+            "GenericDevice.SettingsInitialized", "GenericMotor.Moved"]
+
+
+def test_names():
+    assert message_name(0, 0) == "GenericDevice.SettingsInitialized"
+    assert message_name(1, 2) == "GenericPiezo.StatusChanged"
+    assert message_name(2, 1) == "GenericMotor.Moved"
+    assert message_name(3, 0) == "GenericDCMotor.Error"
+    assert message_name(2, 9) == "GenericMotor.9"
+    assert message_name(42, 1) == "42.1"
+    messages = np.zeros(4, dtype=[("type", "u2"), ("id", "u2")])
+    messages["type"] = [2, 2, 0, 42]
+    messages["id"] = [1, 1, 2, 7]
+    assert message_names(messages) == ["GenericMotor.Moved",
+                                       "GenericMotor.Moved",
+                                       "GenericDevice.Error", "42.7"]
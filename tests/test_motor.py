@@ -0,0 +1,68 @@
+import pytest
+
+from thorlabs_kinesis.ext import (
+    Channel,
+    Motor,
+)
+
+
+@pytest.fixture
+def bsc(engine):
+    engine.add_device("70000001")
+    motor = Motor("70000001")
+    motor.open()
+    yield motor
+    motor.close()
+
+
+def test_channels(bsc):
+    assert bsc[2] is bsc.channel(2)
+    assert bsc[1].number == 1
+    assert bsc.has_channels
+    assert repr(bsc[3]) == "<Channel 70000001 channel 3>"
+
+
+def test_single_channel(engine):
+    engine.add_device("45000001")
+    stage = Motor("45000001")
+    assert stage.channel(1).number is None
+    with pytest.raises(ValueError):
+        stage.channel(2)
+
+
+def test_not_a_motor():
+    with pytest.raises(ValueError):
+        Motor("41000001")
+
+
+def test_move(bsc, engine):
+    channel = bsc[2]
+    channel.move_to(54610)
+    assert channel.wait_for_move(timeout=5)
+    channel.request_position()
+    assert channel.get_position() == 54610
+    assert engine.device("70000001").channels[1].rest == 0
+
+
+def test_move_absolute(bsc):
+    bsc.set_move_absolute_position(10000)
+    bsc.move_absolute()
+    assert bsc.wait_for_move(timeout=5)
+    bsc.request_position()
+    assert bsc.get_position() == 10000
+
+
+def test_errors_raise(bsc):
+    with pytest.raises(OSError):
+        bsc.move_to(100 * 546100)
+
+
+def test_units_invalidated(bsc):
+    units = bsc.units
+    assert units.to_device(1.0) == 546100
+    bsc.set_motor_params(409600, 1.0, 1.0)
+    assert not units.calibrated
+    assert units.to_device(1.0) == 409600
+    bsc.open()
+    assert not units.calibrated
+    assert isinstance(bsc[1], Channel)
@@ -0,0 +1,106 @@
+import itertools
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    MoveProfile,
+    order_points,
+    plan_time,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def path_cost(points, order, start=None, profiles=None):
+    "Cost of visiting the points in order, like order_points counts it."
+    path = points[list(order)]
+    if start is not None:
+        path = np.concatenate((np.reshape(start, (1, -1)), path))
+    if profiles is None:
+        return np.abs(np.diff(path, axis=0)).max(axis=1).sum()
+    return plan_time(profiles, path).sum()
+
+
+def best_cost(points, start=None, profiles=None):
+    return min(path_cost(points, order, start, profiles)
+               for order in itertools.permutations(range(len(points))))
+
+
+def check_order(order, count):
+    assert sorted(order.tolist()) == list(range(count))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_brute_force(seed):
+    points = np.random.default_rng(seed).uniform(0, 100, (7, 2))
+    order = order_points(points)
+    check_order(order, 7)
+    # A heuristic, but small sets come out optimal or very close.
+    assert path_cost(points, order) <= 1.05 * best_cost(points)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_brute_force_start(seed):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(0, 100, (7, 2))
+    start = rng.uniform(0, 100, 2)
+    order = order_points(points, start=start)
+    check_order(order, 7)
+    assert path_cost(points, order, start) <= \
+        1.05 * best_cost(points, start)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_brute_force_profiles(seed):
+    points = np.random.default_rng(seed).uniform(0, 10, (6, 2))
+    # A slow axis, so the order follows it rather than the distances.
+    profiles = [MoveProfile(1.0, 2.0), MoveProfile(10.0, 20.0)]
+    order = order_points(points, profiles)
+    check_order(order, 6)
+    assert path_cost(points, order, profiles=profiles) <= \
+        1.05 * best_cost(points, profiles=profiles)
+
+
+def test_line():
+    points = np.array([3.0, 0.0, 4.0, 1.0, 2.0])
+    assert points[order_points(points)].tolist() in ([0, 1, 2, 3, 4],
+                                                     [4, 3, 2, 1, 0])
+    assert points[order_points(points, start=4.5)].tolist() == \
+        [4, 3, 2, 1, 0]
+
+
+def test_grid_better_than_given():
+    rng = np.random.default_rng(1)
+    grid = np.array([(x, y) for x in range(20) for y in range(20)], float)
+    points = grid[rng.permutation(len(grid))]
+    order = order_points(points)
+    check_order(order, len(points))
+    # The optimum is 399 unit steps.
+    assert path_cost(points, order) < 1.1 * 399
+    assert path_cost(points, order) < path_cost(points, range(len(points)))
+
+
+def test_small():
+    assert order_points(np.zeros((0, 2))).tolist() == []
+    assert order_points([[1.0, 2.0]]).tolist() == [0]
+    assert sorted(order_points([[0.0], [1.0]], neighbours=20).tolist()) == \
+        [0, 1]
+
+
+@pytest.mark.parametrize("time_limit", [0.05, 0.3])
+def test_time_limit(time_limit):
+    points = np.random.default_rng(0).uniform(0, 100, (10000, 2))
+    start = time.perf_counter()
+    order = order_points(points, time_limit=time_limit)
+    assert time.perf_counter() - start < time_limit + 0.15
+    check_order(order, len(points))
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        order_points(np.zeros((2, 2, 2)))
+    with pytest.raises(ValueError):
+        order_points(np.zeros((3, 2)), [MoveProfile(1.0, 1.0)])
+    with pytest.raises(ValueError):
+        order_points(np.zeros((3, 2)), neighbours=0)
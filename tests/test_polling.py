@@ -0,0 +1,133 @@
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    Motor,
+    PollingManager,
+)
+
+# 0.1 mm of the HS DRV001 stages, at 2 mm/s²: about 0.45 s.
+STEP = 54610
+
+
+@pytest.fixture
+def bscs(engine):
+    engine.add_device("70000001")
+    engine.add_device("70000002")
+    motors = [Motor("70000001"), Motor("70000002")]
+    for motor in motors:
+        motor.open()
+    yield motors
+    for motor in motors:
+        motor.close()
+
+
+def polled(engine, channel):
+    "The period the simulated channel polls at, in milliseconds."
+    channels = engine.device(channel.motor.serial_no).channels
+    # Integrated stages have one channel, without a number.
+    return channels[channel.number or 1].polling
+
+
+def test_periods(bscs, engine):
+    channels = [bscs[0][1], bscs[0][2]]
+    polling = PollingManager(channels, active=20, idle=500)
+    polling.update()
+    assert polling.periods == {channels[0]: 500, channels[1]: 500}
+    polling.activate(channels[1])
+    assert polling.is_active(channels[1])
+    assert polling.periods[channels[1]] == 20
+    assert polled(engine, channels[1]) == 20
+    assert polling.load == pytest.approx(2 + 50)
+
+
+def test_budget_shared_by_active(bscs):
+    channels = [motor[number] for motor in bscs for number in (1, 2, 3)]
+    polling = PollingManager(channels, active=20, idle=500, budget=20)
+    for channel in channels[:2]:
+        polling.activate(channel)
+    # 8 polls/s for the idle channels, 6 each for the active ones.
+    assert polling.periods[channels[0]] == 167
+    assert polling.periods[channels[5]] == 500
+    assert polling.load <= 20
+
+
+def test_budget_below_idle(bscs, engine):
+    "Active channels squeezed slower than idle ones poll like them."
+    channels = [motor[number] for motor in bscs for number in (1, 2, 3)]
+    polling = PollingManager(channels, active=20, idle=500, budget=10)
+    # 4 idle channels take 8 polls/s, leaving 1 s periods for 2 active ones.
+    for channel in channels[:2]:
+        polling.activate(channel)
+    assert set(polling.periods.values()) == {600}
+    assert polling.load <= 10
+    assert [polled(engine, channel) for channel in channels] == [600] * 6
+
+
+def test_budget_without_idle_share(bscs):
+    channels = [motor[number] for motor in bscs for number in (1, 2, 3)]
+    polling = PollingManager(channels, idle=500, budget=8)
+    polling.update()
+    assert set(polling.periods.values()) == {750}
+    assert polling.load <= 8
+
+
+def test_linger(bscs):
+    channel = bscs[0][1]
+    polling = PollingManager([channel], active=20, idle=500, linger=0.2)
+    polling.activate(channel)
+    polling.update()
+    assert polling.periods[channel] == 20
+    time.sleep(0.25)
+    assert not polling.is_active(channel)
+    polling.update()
+    assert polling.periods[channel] == 500
+
+
+def test_moving_channels_active(bscs):
+    channel = bscs[0][2]
+    polling = PollingManager([channel], active=20, idle=50, linger=0.1)
+    polling.update()
+    channel.move_to(STEP)
+    time.sleep(0.1)
+    polling.update()
+    assert polling.periods[channel] == 20
+    assert channel.wait_for_move(timeout=5)
+    time.sleep(0.15)
+    polling.update()
+    assert polling.periods[channel] == 50
+
+
+def test_start_stop(bscs):
+    channel = bscs[0][3]
+    polling = PollingManager([channel], active=20, idle=50, linger=0.1,
+                             interval=0.02)
+    with polling:
+        thread = polling._thread
+        assert thread.is_alive()
+        polling.start()
+        assert polling._thread is thread
+        assert polling.periods[channel] == 50
+        channel.move_to(STEP)
+        time.sleep(0.15)
+        assert polling.periods[channel] == 20
+        assert channel.wait_for_move(timeout=5)
+        time.sleep(0.2)
+        assert polling.periods[channel] == 50
+    assert polling._thread is None
+    assert not thread.is_alive()
+    # Stopped, moves no longer change the periods.
+    channel.move_to(0)
+    time.sleep(0.15)
+    assert polling.periods[channel] == 50
+    assert channel.wait_for_move(timeout=5)
+
+
+def test_motors(engine):
+    engine.add_device("45000001")
+    with Motor("45000001") as stage:
+        polling = PollingManager([stage], idle=200)
+        polling.update()
+        assert polling.periods == {stage: 200}
+        assert polled(engine, stage.channel(1)) == 200
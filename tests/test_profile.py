@@ -0,0 +1,164 @@
+import math
+import time
+
+import pytest
+
+from thorlabs_kinesis._types import (
+    MOT_VelocityParameters,
+    MOT_VelocityProfileModes,
+    MOT_VelocityProfileParameters,
+)
+from thorlabs_kinesis.ext import (
+    MoveProfile,
+    Motor,
+    UnitConverter,
+    bow_jerk,
+    plan_time,
+)
+
+np = pytest.importorskip("numpy")
+
+V, A, J = 2.0, 4.0, 40.0
+
+
+def trapezoid(distance):
+    "Closed-form time of a trapezoidal move from rest to rest."
+    if distance <= V * V / A:
+        return 2 * math.sqrt(distance / A)
+    return distance / V + V / A
+
+
+def s_curve(distance):
+    "Closed-form time of an S-curve move from rest to rest."
+    if distance <= 2 * A ** 3 / J ** 2:
+        # Only jerk phases.
+        return 4 * (distance / (2 * J)) ** (1 / 3)
+    # Cruising, after ramps with a constant acceleration phase.
+    assert V * J >= A * A and distance >= V * (V / A + A / J)
+    return distance / V + V / A + A / J
+
+
+DISTANCES = [0.01, 0.25, 0.5, 1.0, 1.5, 10.0]
+
+
+@pytest.mark.parametrize("distance", DISTANCES)
+def test_trapezoid(distance):
+    profile = MoveProfile(V, A)
+    assert profile.move_time(distance) == pytest.approx(trapezoid(distance))
+    assert profile.move_time(-distance) == profile.move_time(distance)
+
+
+@pytest.mark.parametrize("distance", [0.001, 0.002, 3.0, 10.0])
+def test_s_curve(distance):
+    profile = MoveProfile(V, A, J)
+    assert profile.move_time(distance) == pytest.approx(s_curve(distance))
+
+
+def test_s_curve_slower():
+    trapezoidal, curved = MoveProfile(V, A), MoveProfile(V, A, J)
+    distances = np.linspace(0.001, 5.0, 200)
+    assert (curved.move_time(distances)
+            > trapezoidal.move_time(distances)).all()
+    # Continuous at the switch between the branches.
+    switch = 2 * A ** 3 / J ** 2
+    assert curved.move_time(switch * (1 - 1e-9)) == pytest.approx(
+        curved.move_time(switch * (1 + 1e-9)))
+
+
+@pytest.mark.parametrize("distance", [1, np.int32(1), np.int64(1),
+                                      np.float32(1.0), np.array(1.0),
+                                      np.array(1, np.int32)])
+def test_scalars(distance):
+    result = MoveProfile(V, A).move_time(distance)
+    assert type(result) is float
+    assert result == pytest.approx(trapezoid(1.0))
+    assert MoveProfile(V, A).move_time(distance * 0) == 0.0
+
+
+@pytest.mark.parametrize("jerk", [None, J])
+def test_arrays(jerk):
+    profile = MoveProfile(V, A, jerk)
+    distances = np.array([[0.0, 0.3], [-1.0, 7.0]])
+    times = profile.move_time(distances)
+    assert times.shape == (2, 2)
+    assert times == pytest.approx(np.array(
+        [[profile.move_time(float(d)) for d in row]
+         for row in distances.tolist()]))
+    assert profile.move_time([]).shape == (0,)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        MoveProfile(0.0, 1.0)
+    with pytest.raises(ValueError):
+        MoveProfile(1.0, 1.0, 0.0)
+    assert bow_jerk(0, J) is None
+    assert bow_jerk(1, J) == J
+    assert bow_jerk(3, J) == 4 * J
+    with pytest.raises(ValueError):
+        bow_jerk(19, J)
+
+
+def test_plan_time():
+    x, y = MoveProfile(V, A), MoveProfile(2 * V, 2 * A)
+    plan = [[0.0, 0.0], [1.0, 0.0], [1.0, 4.0], [0.0, 0.0]]
+    times = plan_time([x, y], plan)
+    assert times.tolist() == pytest.approx([
+        0.0, trapezoid(1.0), y.move_time(4.0),
+        max(trapezoid(1.0), y.move_time(4.0))])
+    assert plan_time([x, y], plan, start=[1.0, 0.0])[0] == \
+        pytest.approx(trapezoid(1.0))
+    assert plan_time([x], [1.0, 2.0], start=0.0).tolist() == pytest.approx(
+        [trapezoid(1.0), trapezoid(1.0)])
+
+
+def test_plan_time_invalid():
+    x = MoveProfile(V, A)
+    with pytest.raises(ValueError, match="2 columns"):
+        plan_time([x, x], [[0.0, 0.0, 0.0]])
+    with pytest.raises(ValueError, match="2 positions"):
+        plan_time([x, x], [[0.0, 0.0]], start=0.0)
+    with pytest.raises(ValueError, match="2 positions"):
+        plan_time([x, x], [[0.0, 0.0]], start=[[0.0, 0.0]])
+
+
+def test_from_channel(engine):
+    engine.add_device("45000001")
+    with Motor("45000001") as stage:
+        profile = MoveProfile.from_channel(stage)
+        assert profile.jerk is None
+        assert profile.velocity == pytest.approx(20 * 409600)
+        assert profile.acceleration == pytest.approx(10 * 409600, rel=1e-3)
+        expected = profile.move_time(409600)
+        assert expected == pytest.approx(2 * math.sqrt(0.1), rel=1e-3)
+        start = time.monotonic()
+        stage.move_to(409600)
+        assert stage.wait_for_move(timeout=5)
+        assert time.monotonic() - start == pytest.approx(expected, abs=0.05)
+
+
+def test_bow_index(engine):
+    engine.add_device("45000001")
+    with Motor("45000001") as stage:
+        stage.channel(1).motor.function("SetBowIndex")(
+            *stage.channel(1)._args, 2)
+        with pytest.raises(ValueError, match="bow_base"):
+            MoveProfile.from_channel(stage)
+        profile = MoveProfile.from_channel(stage, bow_base=1e6)
+        assert profile.jerk == 2e6
+        assert profile.velocity == pytest.approx(20 * 409600)
+
+
+def test_brushless_jerk():
+    "The BBD scales of the APT protocol: 92.2337 jerk units per mm/s^3."
+    units = UnitConverter.from_scales(20000, 134217.73, 13.744)
+    params = MOT_VelocityParameters(0, 13744, 134217730)
+    s_curve = MOT_VelocityProfileParameters(
+        MOT_VelocityProfileModes.MOT_SCurve, int(92.2337 * 5000))
+    profile = MoveProfile.from_params(params, units, s_curve)
+    assert profile.velocity == pytest.approx(1000 * 20000)
+    assert profile.acceleration == pytest.approx(1000 * 20000)
+    assert profile.jerk == pytest.approx(5000 * 20000, rel=1e-4)
+    trapezoidal = MOT_VelocityProfileParameters(
+        MOT_VelocityProfileModes.MOT_Trapezoidal, int(92.2337 * 5000))
+    assert MoveProfile.from_params(params, units, trapezoidal).jerk is None
@@ -0,0 +1,109 @@
+import pytest
+
+from thorlabs_kinesis import benchtop_stepper_motor
+from thorlabs_kinesis.ext import DeviceRegistry
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    "Counts the scans of the bus."
+    calls = []
+    build = benchtop_stepper_motor.TLI_BuildDeviceList
+
+    def counted():
+        calls.append(None)
+        return build()
+
+    monkeypatch.setattr(benchtop_stepper_motor, "TLI_BuildDeviceList",
+                        counted)
+    return calls
+
+
+def test_lookups(engine):
+    engine.add_devices(45, 2)
+    engine.add_device("70000001")
+    registry = DeviceRegistry()
+    assert registry.serials() == ("45000001", "45000002", "70000001")
+    assert len(registry) == 3
+    assert list(registry) == ["45000001", "45000002", "70000001"]
+    assert "70000001" in registry
+    assert "70000002" not in registry
+    assert registry.by_type(45) == ("45000001", "45000002")
+    assert registry.by_type(27) == ()
+    assert registry.by_module("benchtop_stepper_motor") == ("70000001",)
+    info = registry.info("45000002")
+    assert info.serialNo == b"45000002"
+    assert info.typeID == 45
+    with pytest.raises(KeyError):
+        registry.info("70000002")
+
+
+def test_ttl(engine, scans):
+    engine.add_device("45000001")
+    registry = DeviceRegistry(ttl=3600)
+    assert registry.serials() == ("45000001",)
+    assert len(scans) == 1
+    engine.add_device("45000002")
+    # Not scanned again before the TTL.
+    assert registry.serials() == ("45000001",)
+    assert not registry.refresh()
+    assert len(scans) == 1
+    registry.invalidate()
+    assert registry.expired
+    assert registry.serials() == ("45000001", "45000002")
+    assert len(scans) == 2
+    assert registry.refresh(force=True)
+    assert len(scans) == 3
+
+
+def test_ttl_expired(engine, scans):
+    engine.add_device("45000001")
+    registry = DeviceRegistry(ttl=0)
+    registry.serials()
+    engine.add_device("45000002")
+    assert registry.serials() == ("45000001", "45000002")
+    assert len(scans) == 2
+
+
+def test_rebuilt_elsewhere(engine, scans):
+    engine.add_device("45000001")
+    registry = DeviceRegistry(ttl=3600)
+    first = registry.info("45000001")
+    engine.add_device("27000001")
+    # Someone else scanned; the list size changed.
+    benchtop_stepper_motor.TLI_BuildDeviceList()
+    assert registry.serials() == ("45000001", "27000001")
+    assert len(scans) == 2
+    # Info is only requested for new devices.
+    assert registry.info("45000001") is first
+    # The same size again: the list isn't read again.
+    engine.disconnect("27000001")
+    engine.add_device("45000002")
+    benchtop_stepper_motor.TLI_BuildDeviceList()
+    assert not registry.refresh()
+    assert "45000002" not in registry
+
+
+def test_device_info_fails(engine):
+    engine.add_devices(45, 2)
+    registry = DeviceRegistry(ttl=3600)
+    registry.serials()
+    engine.add_device("27000001")
+    benchtop_stepper_motor.TLI_BuildDeviceList()
+    # Gone before its info was read.
+    engine.remove_device("27000001")
+    assert registry.refresh()
+    assert registry.serials() == ("45000001", "45000002")
+    assert "27000001" not in registry
+    assert registry.by_type(27) == ()
+    # Read again with the next scan.
+    engine.add_device("27000001")
+    registry.invalidate()
+    assert registry.info("27000001").serialNo == b"27000001"
+
+
+def test_build_fails(engine, monkeypatch):
+    monkeypatch.setattr(benchtop_stepper_motor, "TLI_BuildDeviceList",
+                        lambda: 2)
+    with pytest.raises(OSError):
+        DeviceRegistry().serials()
@@ -0,0 +1,119 @@
+import pytest
+
+from thorlabs_kinesis.ext import (
+    Motor,
+    RotationalAxis,
+    UnitConverter,
+    stage_info,
+)
+from thorlabs_kinesis.ext._rotation import (
+    FORWARDS,
+    QUICKEST,
+    REVERSE,
+)
+
+np = pytest.importorskip("numpy")
+
+# Device units of a turn of the K10CR1, and of 3 degrees.
+TURN = 49152000
+STEP = TURN // 120
+
+
+@pytest.fixture
+def rotator(engine):
+    engine.add_device("55000001")
+    with Motor("55000001") as motor:
+        yield RotationalAxis(motor)
+
+
+def test_period(rotator):
+    assert rotator.period == TURN
+    assert repr(rotator) == f"<RotationalAxis {rotator.channel}, " \
+        f"period {TURN}>"
+    # A whole turn of the rounded scale falls short of the period.
+    assert round(360 * stage_info("K10CR1").position) != TURN
+
+
+def test_linear_stage(engine):
+    engine.add_device("45000001")
+    with Motor("45000001") as motor:
+        with pytest.raises(ValueError):
+            RotationalAxis(motor)
+        assert RotationalAxis(motor, period=1000).period == 1000
+        with pytest.raises(ValueError):
+            RotationalAxis(motor, period=0)
+
+
+def test_normalize(rotator):
+    assert rotator.normalize(-STEP) == TURN - STEP
+    assert rotator.normalize(TURN + 5) == 5
+    assert rotator.normalize([-1, TURN, 2 * TURN + 1]).tolist() == \
+        [TURN - 1, 0, 1]
+
+
+def test_plan_quickest(rotator):
+    degrees = UnitConverter.from_scales(TURN / 360, 1.0, 1.0)
+    angles = degrees.to_device([348, 12, 30, 339, 171])
+    plan = rotator.plan(angles, start=0)
+    assert plan.dtype == np.int32
+    assert degrees.to_real(plan) == pytest.approx(
+        np.array([-12, 12, 30, -21, -189]))
+    assert (plan % STEP == 0).all()
+
+
+@pytest.mark.parametrize("direction", [FORWARDS, REVERSE])
+def test_plan_direction(rotator, direction):
+    angles = np.array([116, 4, 4, 10, 113]) * STEP
+    plan = rotator.plan(angles, start=0, direction=direction)
+    moves = np.diff(plan, prepend=0)
+    assert (moves * (1 if direction == FORWARDS else -1) >= 0).all()
+    assert (np.abs(moves) < TURN).all()
+    assert rotator.normalize(plan).tolist() == angles.tolist()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_plan_random(rotator, seed):
+    rng = np.random.default_rng(seed)
+    angles = rng.integers(0, TURN, 100)
+    start = int(rng.integers(-TURN, TURN))
+    plan = rotator.plan(angles, start=start).astype(np.int64)
+    assert rotator.normalize(plan).tolist() == angles.tolist()
+    # The quickest way never turns more than half a turn.
+    assert (np.abs(np.diff(plan, prepend=start)) <= TURN // 2).all()
+
+
+def test_plan_from_position(rotator):
+    rotator.channel.move_to(STEP)
+    assert rotator.channel.wait_for_move(timeout=5)
+    assert rotator.plan([TURN - STEP]).tolist() == [-STEP]
+
+
+def test_plan_invalid(rotator):
+    with pytest.raises(ValueError):
+        rotator.plan([[0]], start=0)
+    with pytest.raises(TypeError):
+        rotator.plan([0.5], start=0)
+    with pytest.raises(ValueError):
+        rotator.plan([TURN // 3] * 2, start=0, direction=-2)
+    # A third of a turn forwards at a time, 66 turns in all.
+    thirds = np.arange(200) % 3 * (TURN // 3)
+    with pytest.raises(ValueError):
+        rotator.plan(thirds, start=0, direction=FORWARDS)
+    assert rotator.plan(thirds[:100], start=0, direction=FORWARDS)[-1] == \
+        99 * (TURN // 3)
+
+
+def test_rotation_modes(rotator, engine):
+    channel = engine.device("55000001").channels[1]
+    rotator.move_to(TURN + STEP, REVERSE)
+    assert channel.rotation_modes == (2, REVERSE)
+    assert rotator.channel.wait_for_move(timeout=5)
+    rotator.unlimited()
+    assert channel.rotation_modes == (1, QUICKEST)
+    # Unchanged modes aren't set again.
+    channel.rotation_modes = None
+    rotator.unlimited()
+    assert channel.rotation_modes is None
+    rotator.invalidate()
+    rotator.unlimited()
+    assert channel.rotation_modes == (1, QUICKEST)
@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    ChannelGroup,
+    Motor,
+    Scan,
+)
+
+np = pytest.importorskip("numpy")
+
+# 0.01 mm of the HS DRV001 stages, at 2 mm/s²: about 0.14 s.
+STEP = 5461
+
+
+@pytest.fixture
+def bsc(engine):
+    engine.add_device("70000001")
+    motor = Motor("70000001")
+    motor.open()
+    yield motor
+    motor.close()
+
+
+def test_scan(bsc, engine):
+    plan = np.array([[STEP, 0], [STEP, STEP], [2 * STEP, STEP],
+                     [2 * STEP, STEP]])
+    acquired = []
+
+    def acquire(index, target):
+        channels = engine.device("70000001").channels
+        acquired.append((index, target, channels[1].rest, channels[2].rest))
+        return index * 10
+
+    scan = Scan([bsc[1], bsc[2]], plan, acquire, timeout=5)
+    assert len(scan) == 4
+    points = list(scan.run())
+    assert [point.index for point in points] == [0, 1, 2, 3]
+    assert [point.target for point in points] == [tuple(row)
+                                                  for row in plan.tolist()]
+    assert [point.result for point in points] == [0, 10, 20, 30]
+    # The channels were at the point when acquiring.
+    assert [entry[2:] for entry in acquired] == [tuple(row)
+                                                 for row in plan.tolist()]
+    assert acquired[0][1] == [STEP, 0]
+    # Nothing moves to the last point, the same as the one before.
+    assert points[3].move_time == 0.0
+    assert all(point.move_time > 0.1 for point in points[:3])
+    assert [point.time for point in points] == sorted(point.time
+                                                      for point in points)
+    assert scan.completed == 4
+    assert scan.rate == pytest.approx(4 / scan.elapsed)
+
+
+def test_moving_channels(bsc):
+    plan = np.array([[0, 0], [STEP, 0], [STEP, STEP]])
+    scan = Scan(ChannelGroup([bsc[1], bsc[2]]), plan)
+    assert scan._moves() == [[0, 1], [0], [1]]
+
+
+def test_vector_plan(bsc):
+    scan = Scan([bsc[3]], [STEP, 2 * STEP, STEP], timeout=5)
+    assert scan.plan.shape == (3, 1)
+    assert scan.plan.dtype == np.int32
+    points = list(scan.run())
+    assert [point.target for point in points] == [(STEP,), (2 * STEP,),
+                                                  (STEP,)]
+    assert [point.result for point in points] == [None] * 3
+    bsc[3].request_position()
+    time.sleep(0.05)
+    assert bsc[3].get_position() == STEP
+
+
+def test_overlap(bsc):
+    "The next move runs while the caller handles a point."
+    scan = Scan([bsc[1]], [STEP, 2 * STEP], timeout=5)
+    points = scan.run()
+    next(points)
+    time.sleep(0.3)
+    start = time.perf_counter()
+    point = next(points)
+    assert time.perf_counter() - start < 0.1
+    assert point.move_time > 0.1
+
+
+def test_empty(bsc):
+    scan = Scan([bsc[1]], np.zeros((0, 1), dtype=np.int32))
+    assert list(scan.run()) == []
+    assert scan.rate == 0.0
+
+
+def test_stopped(bsc):
+    scan = Scan([bsc[1]], [20 * STEP], timeout=5)
+    stop = threading.Timer(0.05, bsc[1].stop, [False])
+    stop.start()
+    with pytest.raises(RuntimeError):
+        list(scan.run())
+    stop.join()
+
+
+@pytest.mark.parametrize("plan,error", [
+    (np.zeros((2, 3), dtype=np.int32), ValueError),
+    (np.zeros((2, 2, 2), dtype=np.int32), ValueError),
+    (np.zeros((2, 2)), TypeError),
+    (np.array([[0, 2 ** 31]]), ValueError),
+])
+def test_invalid_plan(bsc, plan, error):
+    with pytest.raises(error):
+        Scan([bsc[1], bsc[2]], plan)
@@ -0,0 +1,172 @@
+import time
+from ctypes import (
+    byref,
+    c_int,
+    c_int64,
+)
+
+import pytest
+
+from thorlabs_kinesis import (
+    benchtop_stepper_motor as sbc,
+    integrated_stepper_motors as isc,
+    kcube_dcservo as cc,
+)
+from thorlabs_kinesis._utils import (
+    c_dword,
+    c_word,
+)
+from thorlabs_kinesis.sim import Engine
+
+LTS = b"45000001"
+# An LTS150 moves 1 mm, 409600 counts, in 2 * sqrt(1 mm / 10 mm/s^2).
+MM = 409600
+MOVE_TIME = 2 * (1 / 10) ** 0.5
+
+
+def next_message(module, serial, wait=False):
+    message = (c_word(), c_word(), c_dword())
+    get = module.ISC_WaitForMessage if wait else module.ISC_GetNextMessage
+    if not get(serial, *(byref(value) for value in message)):
+        return None
+    return tuple(value.value for value in message)
+
+
+@pytest.fixture
+def lts(engine):
+    engine.add_device(LTS.decode())
+    assert isc.ISC_Open(LTS) == 0
+    assert next_message(isc, LTS) == (0, 0, 0)
+    yield LTS
+    isc.ISC_Close(LTS)
+
+
+def test_device_list(engine):
+    engine.add_devices(45, 2)
+    engine.add_device("27000001")
+    assert isc.TLI_BuildDeviceList() == 0
+    assert isc.TLI_GetDeviceListSize() == 3
+    engine.disconnect("45000002")
+    isc.TLI_BuildDeviceList()
+    assert isc.TLI_GetDeviceListSize() == 2
+
+
+def test_errors(engine):
+    engine.add_device("45000001")
+    assert isc.ISC_Open(b"45000009") == 0x02
+    assert isc.ISC_MoveToPosition(LTS, 0) == 0x03
+    engine.add_device("40000001")
+    assert sbc.SBC_Open(b"40000001") == 0
+    assert sbc.SBC_MoveToPosition(b"40000001", 2, 0) == 0x2B
+    assert cc.CC_Open(LTS) == 0x08
+
+
+def test_unknown_devices():
+    engine = Engine()
+    with pytest.raises(ValueError):
+        engine.add_device("12000001")
+    with pytest.raises(ValueError):
+        engine.add_device("4500001")
+    engine.add_device("45000001")
+    with pytest.raises(ValueError):
+        engine.add_device("45000001")
+
+
+def test_move_timing(lts):
+    start = time.monotonic()
+    assert isc.ISC_MoveToPosition(lts, MM) == 0
+    assert next_message(isc, lts, wait=True) == (2, 1, MM)
+    assert time.monotonic() - start == pytest.approx(MOVE_TIME, abs=0.05)
+    assert isc.ISC_RequestPosition(lts) == 0
+    assert isc.ISC_GetPosition(lts) == MM
+
+
+def test_move_out_of_travel(lts):
+    assert isc.ISC_MoveToPosition(lts, 200 * MM) == 0x26
+
+
+def test_position_follows_polling(lts, engine):
+    isc.ISC_MoveToPosition(lts, MM)
+    time.sleep(MOVE_TIME / 2)
+    # Without polling or requests the cached position is the one at open.
+    assert isc.ISC_GetPosition(lts) == 0
+    isc.ISC_StartPolling(lts, 10)
+    time.sleep(0.05)
+    assert 0 < isc.ISC_GetPosition(lts) < MM
+    assert isc.ISC_GetStatusBits(lts) & 0x10
+    assert isc.ISC_PollingDuration(lts) == 10
+    next_message(isc, lts, wait=True)
+    time.sleep(0.05)
+    assert isc.ISC_GetPosition(lts) == MM
+    assert not isc.ISC_GetStatusBits(lts) & 0x30
+
+
+def test_stop(lts):
+    isc.ISC_MoveToPosition(lts, 10 * MM)
+    time.sleep(0.1)
+    assert isc.ISC_StopImmediate(lts) == 0
+    message = next_message(isc, lts, wait=True)
+    assert message[:2] == (2, 2)
+    assert 0 < message[2] < 10 * MM
+
+
+def test_home(lts):
+    isc.ISC_MoveToPosition(lts, MM // 10)
+    next_message(isc, lts, wait=True)
+    assert isc.ISC_NeedsHoming(lts)
+    isc.ISC_Home(lts)
+    assert next_message(isc, lts, wait=True) == (2, 0, 0)
+    assert not isc.ISC_NeedsHoming(lts)
+
+
+def test_message_callback(lts):
+    calls = []
+    callback = isc.CFUNCTYPE(None)(lambda: calls.append(time.monotonic()))
+    isc.ISC_RegisterMessageCallback(lts, callback)
+    isc.ISC_MoveToPosition(lts, MM // 10)
+    deadline = time.monotonic() + 2
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 1
+    assert isc.ISC_MessageQueueSize(lts) == 1
+    isc.ISC_ClearMessageQueue(lts)
+    assert isc.ISC_MessageQueueSize(lts) == 0
+
+
+def test_disconnect(lts, engine):
+    isc.ISC_EnableLastMsgTimer(lts, True, 50)
+    isc.ISC_StartPolling(lts, 10)
+    time.sleep(0.1)
+    assert not isc.ISC_HasLastMsgTimerOverrun(lts)
+    engine.disconnect(lts.decode())
+    time.sleep(0.1)
+    assert isc.ISC_HasLastMsgTimerOverrun(lts)
+    assert not isc.ISC_CheckConnection(lts)
+    milliseconds = c_int64()
+    isc.ISC_TimeSinceLastMsgReceived(lts, byref(milliseconds))
+    assert milliseconds.value >= 50
+    engine.reconnect(lts.decode())
+    assert isc.ISC_RequestPosition(lts) == 0x03
+    assert isc.ISC_Open(lts) == 0
+
+
+def test_unit_conversion(lts):
+    real = isc.c_double()
+    isc.ISC_GetRealValueFromDeviceUnit(lts, MM, byref(real), 0)
+    assert real.value == 1.0
+    device = c_int()
+    isc.ISC_GetDeviceUnitFromRealValue(lts, 2.5, byref(device), 0)
+    assert device.value == 2.5 * MM
+
+
+def test_bus_capacity(engine):
+    engine.bus_capacity = 100
+    try:
+        engine.add_devices(45, 2)
+        for serial in (b"45000001", b"45000002"):
+            isc.ISC_Open(serial)
+            isc.ISC_StartPolling(serial, 10)
+        # Twice the polls the bus carries stretch every period twice.
+        assert isc.ISC_PollingDuration(b"45000001") == 20
+    finally:
+        engine.bus_capacity = None
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    DeviceHandle,
+    Motor,
+    StageDatabase,
+    UnitConverter,
+    detect_stage,
+    device_to_real_units,
+    load_stages,
+    real_to_device_units,
+    stage_info,
+)
+from thorlabs_kinesis.ext import _device
+from thorlabs_kinesis.ext._stages import stages
+
+LTS150 = {
+    "position": 500000, "velocity": 25000000, "acceleration": 5000,
+    "travel": [0, 150], "rotational": False, "units": "mm",
+}
+
+
+@pytest.fixture
+def stage_file(tmp_path):
+    path = tmp_path / "stages.json"
+    path.write_text(json.dumps({"LTS150": LTS150,
+                                "HS DRV001 8mm": dict(LTS150, position=1)}))
+    yield str(path)
+    # Back to the bundled stages.
+    stages._stages = None
+    stages._detected.clear()
+    _device._stage_settings.clear()
+
+
+def test_lookup():
+    info = stage_info("lts150/m")
+    assert info.part_number == "LTS150"
+    assert info.position == 409600.0
+    assert not info.rotational
+    assert stage_info(b"Z825B\0\0\0").part_number == "Z825"
+    assert stage_info("K10CR1").rotational
+    assert stage_info("K10CR1").revolution == 49152000
+    assert stage_info("PRM1Z8").revolution == 691071
+    assert info.revolution is None
+    with pytest.raises(KeyError):
+        stage_info("XYZ")
+    assert "LTS150" in stages.part_numbers()
+
+
+def test_load_replaces_cached_scales(stage_file):
+    assert device_to_real_units("LTS150", 409600) == 1.0
+    assert UnitConverter("LTS150").to_device(1.0) == 409600
+    load_stages(stage_file)
+    assert stage_info("LTS150").position == 500000.0
+    assert device_to_real_units("LTS150", 500000) == 1.0
+    assert real_to_device_units("LTS150", 1.0) == 500000
+    assert UnitConverter("LTS150").to_device(1.0) == 500000
+    # Aliases of the bundled entry stay.
+    assert stage_info("LTS150/M").position == 409600.0
+
+
+def test_loaded_files_take_precedence(stage_file):
+    assert real_to_device_units("HS DRV001 8mm", 1.0) == 546100
+    load_stages(stage_file)
+    assert real_to_device_units("HS DRV001 8mm", 1.0) == 1
+
+
+def test_motor_encoder_lib():
+    _device.motor_encoder_lib["custom"] = _device.MotorEncoderSettings(
+        1000, 2000, 3000)
+    try:
+        assert device_to_real_units("custom", 1000) == 1.0
+    finally:
+        del _device.motor_encoder_lib["custom"]
+    with pytest.raises(ValueError):
+        device_to_real_units("custom", 1000)
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "stages.json"
+    path.write_text(json.dumps({"XYZ": {"position": 1}}))
+    database = StageDatabase([str(path)])
+    with pytest.raises(ValueError):
+        database.get("XYZ")
+
+
+def test_detect(engine):
+    engine.add_device("45000001")
+    engine.add_device("70000001")
+    with Motor("45000001") as stage, DeviceHandle("70000001") as bsc:
+        assert detect_stage(stage).part_number == "LTS150"
+        assert detect_stage(stage.channel(1)) is detect_stage(stage)
+        with pytest.raises(ValueError):
+            detect_stage(bsc, channel=1)
@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    Motor,
+    MotorStatus,
+    PiezoStatus,
+    decode_status,
+    decode_status_array,
+    has_error,
+    is_homed,
+    is_homing,
+    is_moving,
+    status_flags,
+)
+from thorlabs_kinesis.ext import _status
+
+
+def test_flags():
+    flags = status_flags()
+    assert list(flags) == list(MotorStatus._fields)
+    assert flags["homed"] == 0x400
+    assert status_flags("PBC")["closed_loop"] == 0x400
+    assert list(status_flags("PBC")) == list(PiezoStatus._fields)
+    # A copy.
+    flags["homed"] = 0
+    assert status_flags()["homed"] == 0x400
+    with pytest.raises(ValueError):
+        status_flags("XYZ")
+
+
+@pytest.mark.parametrize("name,mask", sorted(_status.MOTOR_FLAGS.items()))
+def test_decode_single_bit(name, mask):
+    status = decode_status(mask)
+    assert [field for field in status._fields if getattr(status, field)] \
+        == [name]
+
+
+def test_decode():
+    status = decode_status(0x80000410)
+    assert isinstance(status, MotorStatus)
+    assert status.enabled and status.homed and status.moving_forward
+    assert not status.moving_reverse
+    assert decode_status(0) == MotorStatus(*[False] * len(MotorStatus._fields))
+    piezo = decode_status(0x00000411, "PBC")
+    assert isinstance(piezo, PiezoStatus)
+    assert piezo.connected and piezo.zeroed and piezo.closed_loop
+    assert not piezo.zeroing
+
+
+def test_checks():
+    assert is_moving(0x10) and is_moving(0x20) and is_moving(0x40) \
+        and is_moving(0x80)
+    assert not is_moving(0x80000500)
+    assert is_homing(0x200) and not is_homing(0x400)
+    assert is_homed(0x400) and not is_homed(0x200)
+    assert has_error(0x4000) and has_error(0x01000000)
+    assert not has_error(0x80000410)
+
+
+def test_decode_array():
+    np = pytest.importorskip("numpy")
+    words = np.array([[0x80000410, 0x80000400], [0x00004000, 0]],
+                     dtype=np.uint32)
+    status = decode_status_array(words)
+    assert status.shape == (2, 2)
+    assert status["moving_forward"].tolist() == [[True, False],
+                                                 [False, False]]
+    assert status["motion_error"].tolist() == [[False, False], [True, False]]
+    for index in np.ndindex(words.shape):
+        assert tuple(status[index]) == decode_status(int(words[index]))
+    assert is_moving(words).tolist() == [[True, False], [False, False]]
+    # Plain lists and the piezo flags.
+    piezo = decode_status_array([0x411, 0x20], "PBC")
+    assert piezo["zeroing"].tolist() == [False, True]
+
+
+def test_decode_device_status(engine):
+    engine.add_device("45000001")
+    stage = Motor("45000001")
+    stage.open()
+    try:
+        stage.request_status_bits()
+        status = decode_status(stage.get_status_bits())
+        assert status.connected and status.enabled and not status.homed
+        stage.move_to(409600)
+        time.sleep(0.1)
+        stage.request_status_bits()
+        bits = stage.get_status_bits()
+        assert is_moving(bits) and decode_status(bits).moving_forward
+        assert stage.wait_for_move(timeout=5)
+        stage.request_status_bits()
+        assert not is_moving(stage.get_status_bits())
+    finally:
+        stage.close()
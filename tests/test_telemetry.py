@@ -0,0 +1,160 @@
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    Motor,
+    TelemetryBuffer,
+    TelemetrySampler,
+)
+
+np = pytest.importorskip("numpy")
+
+# A 0.1 mm move of an LTS150 at 10 mm/s², triangular: about 0.2 s.
+DISTANCE = 40960
+
+
+@pytest.fixture
+def stage(engine):
+    engine.add_device("45000001")
+    motor = Motor("45000001")
+    motor.open()
+    motor.start_polling(20)
+    yield motor
+    motor.close()
+
+
+def fill(buffer, count, first=0):
+    for sample in range(first, first + count):
+        buffer.append(float(sample), sample, -sample, sample % 7)
+
+
+def joined(snapshot):
+    return np.concatenate(snapshot[:2])["position"].tolist()
+
+
+def test_buffer():
+    buffer = TelemetryBuffer(5)
+    assert len(buffer) == 0
+    assert joined(buffer.snapshot()) == []
+    fill(buffer, 3)
+    assert len(buffer) == 3
+    snapshot = buffer.snapshot()
+    assert snapshot.start == 0
+    assert joined(snapshot) == [0, 1, 2]
+    assert len(snapshot.newer) == 0
+    assert joined(buffer.snapshot(2)) == [1, 2]
+    assert joined(buffer.snapshot(10)) == [0, 1, 2]
+    assert buffer.snapshot(1).older[0].tolist() == (2.0, 2, -2, 2)
+
+
+def test_wrap_around():
+    buffer = TelemetryBuffer(5)
+    fill(buffer, 8)
+    assert len(buffer) == 5
+    assert buffer.count == 8
+    snapshot = buffer.snapshot()
+    assert snapshot.start == 3
+    # Oldest first, across the end of the memory.
+    assert snapshot.older["position"].tolist() == [3, 4]
+    assert snapshot.newer["position"].tolist() == [5, 6, 7]
+    assert joined(buffer.snapshot(3)) == [5, 6, 7]
+    assert joined(buffer.snapshot(4)) == [4, 5, 6, 7]
+    fill(buffer, 2, 8)
+    assert joined(buffer.snapshot()) == [5, 6, 7, 8, 9]
+    assert len(buffer.snapshot().newer) == 0
+
+
+def test_views():
+    buffer = TelemetryBuffer(4)
+    fill(buffer, 4)
+    snapshot = buffer.snapshot()
+    assert snapshot.older.base is buffer.data
+
+
+def test_intact():
+    buffer = TelemetryBuffer(5)
+    fill(buffer, 6)
+    snapshot = buffer.snapshot(3)
+    assert buffer.intact(snapshot)
+    fill(buffer, 2, 6)
+    # The 2 overwritten samples were older than the snapshot.
+    assert buffer.intact(snapshot)
+    assert joined(snapshot) == [3, 4, 5]
+    fill(buffer, 1, 8)
+    assert not buffer.intact(snapshot)
+    assert joined(snapshot) == [8, 4, 5]
+    assert buffer.intact(buffer.snapshot())
+
+
+def test_sampler(stage, engine):
+    sampler = TelemetrySampler([stage], capacity=1000)
+    assert sampler.rate == pytest.approx(50)
+    buffer = sampler.buffers[stage]
+    with sampler:
+        assert sampler.running
+        thread = sampler._thread
+        stage.move_to(DISTANCE)
+        assert stage.wait_for_move(timeout=5)
+        time.sleep(0.1)
+    assert not sampler.running
+    assert not thread.is_alive()
+    count = buffer.count
+    assert 10 < count < 50
+    time.sleep(0.1)
+    assert buffer.count == count
+
+    samples = np.concatenate(buffer.snapshot()[:2])
+    assert (np.diff(samples["time"]) > 0).all()
+    assert (np.diff(samples["position"]) >= 0).all()
+    assert samples["position"][0] == 0
+    assert samples["position"][-1] == DISTANCE
+    assert (samples["encoder"] == samples["position"]).all()
+    assert samples["status"].any()
+    assert sampler.errors == 0
+
+
+def test_sampler_restart(stage):
+    sampler = TelemetrySampler([stage], rate=100, capacity=10)
+    sampler.start()
+    thread = sampler._thread
+    sampler.start()
+    assert sampler._thread is thread
+    time.sleep(0.2)
+    sampler.stop()
+    assert len(sampler.buffers[stage]) == 10
+    count = sampler.buffers[stage].count
+    assert count > 10
+    sampler.stop()
+    with sampler:
+        time.sleep(0.05)
+    assert sampler.buffers[stage].count > count
+
+
+def test_request_errors(stage, monkeypatch):
+    channel = stage.channel(1)
+
+    def fail():
+        raise OSError("Can't request position.")
+
+    monkeypatch.setattr(channel, "request_position", fail)
+    with TelemetrySampler([stage], rate=100, request=True) as sampler:
+        time.sleep(0.1)
+    assert sampler.errors > 0
+    assert sampler.dropped >= sampler.errors
+    assert sampler.buffers[stage].count == 0
+
+
+def test_overruns(stage, monkeypatch):
+    channel = stage.channel(1)
+    get_position = channel.get_position
+
+    def slow():
+        time.sleep(0.03)
+        return get_position()
+
+    monkeypatch.setattr(channel, "get_position", slow)
+    with TelemetrySampler([stage], rate=100) as sampler:
+        time.sleep(0.2)
+    assert sampler.overruns > 0
+    assert sampler.dropped >= sampler.overruns
@@ -0,0 +1,136 @@
+from ctypes import (
+    byref,
+    c_double,
+    c_int,
+)
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    Motor,
+    UnitConverter,
+    device_to_real_units,
+    real_to_device_units,
+)
+from thorlabs_kinesis.ext._units import UNIT_TYPES
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def converter():
+    return UnitConverter("HS DRV001 8mm")
+
+
+def test_scalars(converter):
+    assert converter.to_device(1.0) == 546100
+    assert converter.to_device(1) == 546100
+    assert converter.to_real(546100) == 1.0
+    assert converter.to_device(1.0, "velocity") == \
+        real_to_device_units("HS DRV001 8mm", 1.0, "velocity")
+    assert converter.to_real(546100) == \
+        device_to_real_units("HS DRV001 8mm", 546100)
+
+
+@pytest.mark.parametrize("real", [np.float32(1.5), np.float64(1.5),
+                                  np.array(1.5), np.array(1.5, np.float32)])
+def test_numpy_scalars(converter, real):
+    device = converter.to_device(real)
+    assert device == 819150
+    assert type(device) is int
+    assert converter.to_real(np.int32(device)) == 1.5
+
+
+@pytest.mark.parametrize("device", [np.int64(2), np.int32(2), np.array(2),
+                                    np.uint16(2)])
+def test_numpy_integers(converter, device):
+    assert converter.to_device(device) == 1092200
+    real = converter.to_real(device)
+    assert type(real) is float
+    assert real == 2 / 546100
+
+
+def test_arrays(converter):
+    real = np.linspace(-8.0, 8.0, 101)
+    device = converter.to_device(real)
+    assert device.dtype == np.int32
+    assert device.tolist() == [round(x * 546100) for x in real.tolist()]
+    back = converter.to_real(device)
+    assert back.dtype == np.float64
+    assert np.abs(back - real).max() <= 0.5 / 546100
+    assert converter.to_device([0.5, 1.0]).tolist() == [273050, 546100]
+    assert converter.to_device(np.float32([0.5])).tolist() == [273050]
+    assert converter.to_device([]).shape == (0,)
+
+
+def test_round_half_to_even():
+    converter = UnitConverter.from_scales(1.0, 1.0, 1.0)
+    assert converter.to_device(2.5) == 2
+    assert converter.to_device([0.5, 1.5, 2.5]).tolist() == [0, 2, 2]
+
+
+def test_out_of_range(converter):
+    with pytest.raises(ValueError):
+        converter.to_device(1e4)
+    with pytest.raises(ValueError):
+        converter.to_device(np.array(1e4))
+    with pytest.raises(ValueError):
+        converter.to_device([0.0, 1e4])
+    with pytest.raises(ValueError):
+        converter.to_device([0.0, float("nan")])
+
+
+def test_dimension(converter):
+    with pytest.raises(TypeError):
+        converter.to_device(1.0, "jerk")
+    assert repr(converter) == "<UnitConverter HS DRV001 8mm>"
+    assert repr(UnitConverter.from_scales(1.0, 1.0, 1.0)) == \
+        "<UnitConverter custom scales>"
+
+
+def dll_to_device(channel, real: float, dimension: str) -> int:
+    device = c_int()
+    channel.motor.function("GetDeviceUnitFromRealValue")(
+        *channel._args, real, byref(device), UNIT_TYPES[dimension])
+    return device.value
+
+
+def dll_to_real(channel, device: int, dimension: str) -> float:
+    real = c_double()
+    channel.motor.function("GetRealValueFromDeviceUnit")(
+        *channel._args, device, byref(real), UNIT_TYPES[dimension])
+    return real.value
+
+
+@pytest.mark.parametrize("serial,number", [("45000001", 1), ("70000001", 2),
+                                           ("27000001", 1), ("55000001", 1)])
+@pytest.mark.parametrize("dimension", list(UNIT_TYPES))
+def test_channel_units(engine, serial, number, dimension):
+    engine.add_device(serial)
+    with Motor(serial) as motor:
+        channel = motor.channel(number)
+        units = channel.units
+        assert not units.calibrated
+        reals = [0.0, 0.001, 1.0, 2.5, -3.75, 12.345678]
+        devices = [dll_to_device(channel, real, dimension) for real in reals]
+        assert units.to_device(reals, dimension).tolist() == devices
+        assert [units.to_device(np.float32(real), dimension)
+                for real in reals] == [
+            dll_to_device(channel, float(np.float32(real)), dimension)
+            for real in reals]
+        for device in devices:
+            assert units.to_real(device, dimension) == pytest.approx(
+                dll_to_real(channel, device, dimension), rel=1e-12)
+        assert units.calibrated
+        assert repr(units) == f"<ChannelUnits of {channel}>"
+
+
+def test_channel_units_recalibrate(engine):
+    engine.add_device("27000001")
+    with Motor("27000001") as kcube:
+        units = kcube.units
+        assert units.to_device(1.0) == dll_to_device(kcube.channel(1), 1.0,
+                                                     "position")
+        kcube.set_motor_params(512, 67.49, 1.0)
+        assert units.to_device(1.0) == dll_to_device(kcube.channel(1), 1.0,
+                                                     "position")
@@ -0,0 +1,114 @@
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    Motor,
+    wait_for_home,
+    wait_for_move,
+)
+from thorlabs_kinesis.ext._status import MOVING
+from thorlabs_kinesis.ext._wait import (
+    HOMED,
+    MOVED,
+    STOPPED,
+    WAITER_QUEUE_SIZE,
+    StatusCompletion,
+    _poll_status,
+)
+
+# A 0.1 mm move of an LTS150 at 10 mm/s², triangular: about 0.2 s.
+DISTANCE = 40960
+
+
+@pytest.fixture
+def stage(engine):
+    engine.add_device("45000001")
+    motor = Motor("45000001")
+    motor.open()
+    yield motor
+    motor.close()
+
+
+def test_wait_for_move(stage):
+    assert stage.channel(1).waiter.has_callback
+    stage.move_to(DISTANCE)
+    assert wait_for_move(stage, timeout=5)
+    stage.request_position()
+    assert stage.get_position() == DISTANCE
+
+
+def test_wait_without_timeout(stage):
+    stage.move_by(DISTANCE)
+    assert wait_for_move(stage.channel(1))
+
+
+def test_stopped_move(stage):
+    stage.move_to(10 * DISTANCE)
+    stage.stop(profiled=False)
+    assert not wait_for_move(stage, timeout=5)
+
+
+def test_timeout(stage):
+    stage.move_to(10 * DISTANCE)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        wait_for_move(stage, timeout=0.1)
+    assert time.monotonic() - start < 0.5
+    assert wait_for_move(stage, timeout=5)
+
+
+def test_wait_for_home(stage):
+    stage.move_to(DISTANCE)
+    assert wait_for_move(stage, timeout=5)
+    stage.home()
+    assert wait_for_home(stage, timeout=5)
+    stage.request_status_bits()
+    assert stage.get_status_bits() & 0x400
+
+
+def test_waiter_messages(stage):
+    waiter = stage.channel(1).waiter
+    stage.move_to(DISTANCE)
+    assert waiter.wait(frozenset((MOVED, STOPPED)), timeout=5) == MOVED
+    assert waiter.next_message() is None
+
+
+def test_waiter_queue(stage, engine):
+    "Waiters only keep the last few completion messages."
+    waiter = stage.channel(1).waiter
+    waiter.clear()
+    channel = engine.device("45000001").channels[1]
+    channel.push_message(2, 3, 0)  # LimitUpdated
+    channel.push_message(0, 1, 0)  # SettingsUpdated
+    for data in range(2 * WAITER_QUEUE_SIZE):
+        channel.push_message(*MOVED, data)
+    channel.push_message(*HOMED, 0)
+    messages = []
+    while True:
+        message = waiter.next_message()
+        if message is None:
+            break
+        messages.append(message)
+    assert len(messages) == WAITER_QUEUE_SIZE
+    assert messages[-1] == (2, 0, 0)
+    assert messages[0] == (2, 1, WAITER_QUEUE_SIZE + 1)
+    with pytest.raises(ValueError):
+        waiter.wait(frozenset([(2, 3)]), timeout=0.1)
+
+
+def test_poll_status(stage):
+    stage.start_polling(20)
+    stage.move_to(DISTANCE)
+    start = time.monotonic()
+    assert _poll_status(stage.channel(1), MOVING, 0, 5)
+    assert time.monotonic() - start > 0.1
+    stage.request_position()
+    assert stage.get_position() == DISTANCE
+
+
+def test_status_completion():
+    completion = StatusCompletion(MOVING, 0, 10.0)
+    assert not completion.done(0)
+    assert not completion.done(MOVING)
+    assert completion.done(0)
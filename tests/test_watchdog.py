@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from thorlabs_kinesis.ext import (
+    DeviceHandle,
+    Motor,
+    Watchdog,
+)
+
+# A 0.1 mm move of an LTS150 at 10 mm/s², triangular: about 0.2 s.
+DISTANCE = 40960
+
+
+@pytest.fixture
+def stage(engine):
+    engine.add_device("45000001")
+    motor = Motor("45000001")
+    motor.open()
+    motor.start_polling(20)
+    yield motor
+    motor.close()
+
+
+def check_until(watchdog, state, serial="45000001", timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while watchdog.health[serial] != state:
+        assert time.monotonic() < deadline, watchdog.history[serial]
+        time.sleep(0.02)
+        watchdog.check()
+
+
+def test_needs_timeout(engine):
+    engine.add_device("45000001")
+    with DeviceHandle("45000001") as stage:
+        with pytest.raises(ValueError):
+            Watchdog([stage])
+        assert Watchdog([stage], timeout=100).interval == 0.05
+
+
+def test_healthy(stage):
+    watchdog = Watchdog([stage], backoff=0.0)
+    watchdog.arm()
+    time.sleep(0.1)
+    watchdog.check()
+    assert watchdog.health == {"45000001": "healthy"}
+    assert not watchdog.history["45000001"]
+
+
+def test_reconnect(stage, engine):
+    stage.move_to(DISTANCE)
+    assert stage.wait_for_move(timeout=5)
+    units = stage.units
+    assert units.to_device(1.0) == 409600
+    assert units.calibrated
+
+    watchdog = Watchdog([stage], backoff=0.0)
+    watchdog.arm()
+    engine.disconnect("45000001")
+    check_until(watchdog, "disconnected")
+    watchdog.check()
+    assert "reconnect failed" in watchdog.history["45000001"][-1].detail
+
+    engine.reconnect("45000001")
+    check_until(watchdog, "healthy")
+    assert "reconnected" in watchdog.history["45000001"][-1].detail
+    assert not units.calibrated
+
+    # The message callback was registered again.
+    stage.move_to(0)
+    assert stage.wait_for_move(timeout=5)
+    stage.request_position()
+    assert stage.get_position() == 0
+
+
+def test_thread(stage, engine):
+    with Watchdog([stage.channel(1)], backoff=0.0) as watchdog:
+        engine.disconnect("45000001")
+        deadline = time.monotonic() + 2
+        while watchdog.health["45000001"] == "healthy":
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+        engine.reconnect("45000001")
+        deadline = time.monotonic() + 2
+        while watchdog.health["45000001"] != "healthy":
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+    stage.move_by(DISTANCE)
+    assert stage.wait_for_move(timeout=5)
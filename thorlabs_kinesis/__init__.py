@@ -29,6 +29,8 @@ import platform
 import sys
 from pathlib import Path
 
+from thorlabs_kinesis._backend import get_backend
+
 if sys.version_info < (3, 6, 0):
     raise Exception(
         "Thorlabs-Kinesis requires Python 3.6+ (version "
@@ -49,6 +51,7 @@ __project_url__ = "https://github.com/BYUCamachoLab/thorlabs-kinesis"
 class Configuration:
     def __init__(self):
         self._libdir = ""
+        self._backend = None
 
     @property
     def libdir(self):
@@ -59,6 +62,22 @@ class Configuration:
         self._libdir = dirs
         os.environ['PATH'] = dirs + ";" + os.environ['PATH']
 
+    @property
+    def backend(self):
+        """Backend the libraries are loaded from, ``"dll"`` unless the
+        THORLABS_KINESIS_BACKEND environment variable says otherwise. Can be
+        set to a backend name or instance any time before the first function
+        of a library is used.
+        """
+        if self._backend is None:
+            self._backend = get_backend(
+                os.environ.get("THORLABS_KINESIS_BACKEND", "dll"))
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend):
+        self._backend = get_backend(backend)
+
 config = Configuration()
 
 
@@ -77,18 +96,18 @@ if sys.platform.startswith('java'):
 else:
     system = sys.platform
 
-if system != 'win32':
-    raise Exception('Thorlabs-Kinesis only runs on Windows machines.')
-
-_DEFAULT_DIR = Path('C:/Program Files/Thorlabs/Kinesis')
-_DEFAULT_USER_DIR = Path('')
-if _DEFAULT_DIR.exists():
-    config.libdir = str(_DEFAULT_DIR)
-elif _DEFAULT_USER_DIR.exists():
-    config.libdir = str(_DEFAULT_USER_DIR)
-else:
-    import warnings
-    warnings.warn('ThorLabs Kinesis installation not located, be sure to \
-        add the required DLLs to the system path or set the \
-        `thorlabs_kinesis.config.libdir` attribute BEFORE importing any \
-        submodules from thorlabs_kinesis')
+# The DLLs only exist on Windows, elsewhere only the simulator backend can be
+# used, see thorlabs_kinesis._backend.
+if system == 'win32':
+    _DEFAULT_DIR = Path('C:/Program Files/Thorlabs/Kinesis')
+    _DEFAULT_USER_DIR = Path('')
+    if _DEFAULT_DIR.exists():
+        config.libdir = str(_DEFAULT_DIR)
+    elif _DEFAULT_USER_DIR.exists():
+        config.libdir = str(_DEFAULT_USER_DIR)
+    else:
+        import warnings
+        warnings.warn('ThorLabs Kinesis installation not located, be sure to \
+            add the required DLLs to the system path or set the \
+            `thorlabs_kinesis.config.libdir` attribute BEFORE calling any \
+            functions from the thorlabs_kinesis submodules')
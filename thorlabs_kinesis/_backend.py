@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Thorlabs-Kinesis Project Contributors
+# Licensed under the terms of the GNU GPLv3+ License
+# (see thorlabs_kinesis/__init__.py for details)
+
+"""
+Backends
+--------
+
+Backends provide the libraries the binding modules call into. The ``dll``
+backend loads the Thorlabs Kinesis DLLs, the ``sim`` backend serves every
+library from the pure-Python device simulator in ``thorlabs_kinesis.sim``.
+"""
+
+from ctypes import (
+    CDLL,
+    CFUNCTYPE,
+    cdll,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Union,
+)
+
+
+class Library:
+    """Library provided by a backend other than the DLL one. ``bind`` turns
+    a function name and its prototype into something callable like a ctypes
+    function pointer.
+    """
+
+    def bind(self, func: str,
+             argtypes: List[Any]=None, restype: Any=None) -> CFUNCTYPE:
+        raise NotImplementedError
+
+
+class Backend:
+    "Source of the libraries the binding modules call into."
+    name = ""
+
+    def load_library(self, name: str) -> Union[CDLL, Library]:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class DLLBackend(Backend):
+    "Loads the Thorlabs Kinesis DLLs."
+    name = "dll"
+
+    def load_library(self, name: str) -> CDLL:
+        import thorlabs_kinesis
+
+        if thorlabs_kinesis.system != 'win32':
+            raise OSError(f"Can't load {name}: the Thorlabs Kinesis DLLs "
+                          "only run on Windows machines. Use the 'sim' "
+                          "backend on other platforms.")
+        return cdll.LoadLibrary(name)
+
+
+class SimBackend(Backend):
+    """Serves every library from a simulated device engine, by default the
+    shared ``thorlabs_kinesis.sim.engine``.
+    """
+    name = "sim"
+
+    def __init__(self, engine=None):
+        self._engine = engine
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from thorlabs_kinesis.sim import engine
+            self._engine = engine
+        return self._engine
+
+    def load_library(self, name: str) -> Library:
+        from thorlabs_kinesis.sim import SimulatedLibrary
+        return SimulatedLibrary(self.engine, name)
+
+
+backends = {
+    DLLBackend.name: DLLBackend,
+    SimBackend.name: SimBackend,
+}  # type: Dict[str, type]
+
+
+def get_backend(backend: Union[str, Backend]) -> Backend:
+    """Returns the backend registered under the given name. Backend instances
+    are returned unchanged.
+
+    >>> get_backend("sim")
+    <SimBackend 'sim'>
+
+    >>> get_backend("usb")
+    Traceback (most recent call last):
+        ...
+    ValueError: Unknown backend 'usb', expected one of: dll, sim
+    """
+    if isinstance(backend, Backend):
+        return backend
+
+    try:
+        return backends[backend]()
+    except KeyError:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of: "
+                         + ", ".join(sorted(backends))) from None
+
+
+__all__ = [
+    "Library",
+    "Backend",
+    "DLLBackend",
+    "SimBackend",
+    "backends",
+    "get_backend",
+]
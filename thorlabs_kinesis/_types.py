@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Thorlabs-Kinesis Project Contributors
+# Licensed under the terms of the GNU GPLv3+ License
+# (see thorlabs_kinesis/__init__.py for details)
+
+"""
+Types
+-----
+
+Enums and structures of the Kinesis C API, shared by all binding modules so
+that each structure is a single ctypes class and its instances can be passed
+to the functions of any device family.
+
+Enum members are ints, so they compare equal to the raw values the DLLs
+return. Every member is also available at module level under its C name.
+The enum classes can be used in ``argtypes`` directly, where they convert
+values with the ``from_param`` of their C type; struct fields, pointers and
+return types use the C type itself, ``ctype``.
+"""
+
+from ctypes import (
+    Structure,
+    c_bool,
+    c_short,
+    c_int,
+    c_uint,
+    c_char,
+    c_byte,
+)
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+)
+
+from thorlabs_kinesis._utils import (
+    c_word,
+    c_dword,
+)
+
+
+class CEnumMeta(type):
+    """Turns the int attributes of a ``CEnum`` subclass into its members.
+    Lighter than ``enum.EnumMeta``, which matters with this many enums being
+    created at import.
+    """
+
+    def __new__(mcs, name: str, bases: tuple, namespace: Dict[str, Any],
+                ctype: Any=None):
+        values = {key: value for key, value in namespace.items()
+                  if not key.startswith("_") and type(value) is int}
+        for key in values:
+            del namespace[key]
+        if ctype is not None:
+            namespace["ctype"] = ctype
+            namespace["from_param"] = ctype.from_param
+
+        cls = super().__new__(mcs, name, bases, namespace)
+        members = {}
+        by_value = {}
+        for key, value in values.items():
+            member = by_value.get(value)
+            if member is None:
+                member = by_value[value] = int.__new__(cls, value)
+                object.__setattr__(member, "name", key)
+            members[key] = member
+            type.__setattr__(cls, key, member)
+        type.__setattr__(cls, "__members__", MappingProxyType(members))
+        type.__setattr__(cls, "_value2member_", by_value)
+        return cls
+
+    def __init__(cls, name: str, bases: tuple, namespace: Dict[str, Any],
+                 ctype: Any=None):
+        super().__init__(name, bases, namespace)
+
+    def __call__(cls, value: int) -> "CEnum":
+        try:
+            return cls._value2member_[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") \
+                from None
+
+    def __iter__(cls) -> Iterator[int]:
+        return iter(cls._value2member_.values())
+
+    def __len__(cls) -> int:
+        return len(cls._value2member_)
+
+    def __contains__(cls, value: int) -> bool:
+        return value in cls._value2member_
+
+    def __setattr__(cls, key: str, value: Any):
+        if key in cls.__dict__.get("__members__", ()):
+            raise AttributeError(f"Cannot reassign member {key!r}.")
+        super().__setattr__(key, value)
+
+
+class CEnum(int, metaclass=CEnumMeta):
+    """Base class of the Kinesis enums, ``IntEnum`` style. Subclasses give
+    their C type as ``ctype`` class argument, which also provides the
+    ``from_param`` used when the enum appears in ``argtypes``. That is the C
+    type's own, so converting an argument costs no Python call.
+    """
+    name = ""
+
+    @property
+    def value(self) -> int:
+        return int(self)
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} members are immutable.")
+
+    def __reduce__(self):
+        return type(self), (int(self),)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}.{self.name}: {int(self)}>"
+
+    __str__ = int.__repr__
+
+
+class FT_Status(CEnum, ctype=c_short):
+    FT_OK = 0x00
+    FT_InvalidHandle = 0x01
+    FT_DeviceNotFound = 0x02
+    FT_DeviceNotOpened = 0x03
+    FT_IOError = 0x04
+    FT_InsufficientResources = 0x05
+    FT_InvalidParameter = 0x06
+    FT_DeviceNotPresent = 0x07
+    FT_IncorrectDevice = 0x08
+
+
+class MOT_MotorTypes(CEnum, ctype=c_int):
+    MOT_NotMotor = 0
+    MOT_DCMotor = 1
+    MOT_StepperMotor = 2
+    MOT_BrushlessMotor = 3
+    MOT_CustomMotor = 100
+
+
+class MOT_TravelModes(CEnum, ctype=c_int):
+    MOT_TravelModeUndefined = 0x00
+    MOT_Linear = 0x01
+    MOT_Rotational = 0x02
+
+
+class MOT_TravelDirection(CEnum, ctype=c_short):
+    MOT_TravelDirectionUndefined = 0x00
+    MOT_TravelDirectionDisabled = 0x00
+    MOT_Forwards = 0x01
+    MOT_Reverse = 0x02
+
+
+class MOT_HomeLimitSwitchDirection(CEnum, ctype=c_short):
+    MOT_LimitSwitchDirectionUndefined = 0x00
+    MOT_ReverseLimitSwitch = 0x01
+    MOT_ForwardLimitSwitch = 0x04
+
+
+class MOT_DirectionSense(CEnum, ctype=c_short):
+    MOT_Normal = 0x00
+    MOT_Backwards = 0x01
+
+
+class MOT_JogModes(CEnum, ctype=c_short):
+    MOT_JogModeUndefined = 0x00
+    MOT_Continuous = 0x01
+    MOT_SingleStep = 0x02
+
+
+class MOT_StopModes(CEnum, ctype=c_short):
+    MOT_StopModeUndefined = 0x00
+    MOT_Immediate = 0x01
+    MOT_Profiled = 0x02
+
+
+class MOT_ButtonModes(CEnum, ctype=c_word):
+    MOT_ButtonModeUndefined = 0x00
+    MOT_JogMode = 0x01
+    MOT_Preset = 0x02
+
+
+class MOT_VelocityProfileModes(CEnum, ctype=c_word):
+    MOT_Trapezoidal = 0x00
+    MOT_SCurve = 0x02
+
+
+class MOT_LimitSwitchModes(CEnum, ctype=c_word):
+    MOT_LimitSwitchModeUndefined = 0x00
+    MOT_LimitSwitchIgnoreSwitch = 0x01
+    MOT_LimitSwitchMakeOnContact = 0x02
+    MOT_LimitSwitchBreakOnContact = 0x03
+    MOT_LimitSwitchMakeOnHome = 0x04
+    MOT_LimitSwitchBreakOnHome = 0x05
+    MOT_PMD_Reserved = 0x06
+    MOT_LimitSwitchIgnoreSwitchSwapped = 0x81
+    MOT_LimitSwitchMakeOnContactSwapped = 0x82
+    MOT_LimitSwitchBreakOnContactSwapped = 0x83
+    MOT_LimitSwitchMakeOnHomeSwapped = 0x84
+    MOT_LimitSwitchBreakOnHomeSwapped = 0x85
+
+
+class MOT_LimitSwitchSWModes(CEnum, ctype=c_word):
+    MOT_LimitSwitchSWModeUndefined = 0x00
+    MOT_LimitSwitchIgnored = 0x01
+    MOT_LimitSwitchStopImmediate = 0x02
+    MOT_LimitSwitchStopProfiled = 0x03
+    MOT_LimitSwitchIgnored_Rotational = 0x81
+    MOT_LimitSwitchStopImmediate_Rotational = 0x82
+    MOT_LimitSwitchStopProfiled_Rotational = 0x83
+
+
+class MOT_LimitsSoftwareApproachPolicy(CEnum, ctype=c_short):
+    DisallowIllegalMoves = 0
+    AllowPartialMoves = 1
+    AllowAllMoves = 2
+
+
+class MOT_PID_LoopMode(CEnum, ctype=c_word):
+    MOT_PIDLoopModeDisabled = 0x00
+    MOT_PIDOpenLoopMode = 0x01
+    MOT_PIDClosedLoopMode = 0x02
+
+
+class MOT_CurrentLoopPhases(CEnum, ctype=c_word):
+    MOT_PhaseA = 0x0
+    MOT_PhaseB = 0x1
+    MOT_PhaseAB = 0x2
+
+
+class MOT_MovementModes(CEnum, ctype=c_int):
+    LinearRange = 0x00
+    RotationalUnlimited = 0x01
+    RotationalWrapping = 0x02
+
+
+class MOT_MovementDirections(CEnum, ctype=c_int):
+    Quickest = 0x00
+    Forwards = 0x01
+    Reverse = 0x02
+
+
+class PZ_ControlModeTypes(CEnum, ctype=c_short):
+    PZ_Undefined = 0
+    PZ_OpenLoop = 1
+    PZ_ClosedLoop = 2
+    PZ_OpenLoopSmoothed = 3
+    PZ_ClosedLoopSmoothed = 4
+
+
+class PZ_InputSourceFlags(CEnum, ctype=c_short):
+    # TODO: Verify these!
+    PZ_SoftwareOnly = 0
+    PZ_ExternalSignal = 1
+    PZ_Potentiometer = 2
+    PZ_All = 3
+
+
+class PZ_OutputLUTModes(CEnum, ctype=c_short):
+    PZ_Continuous = 0
+    PZ_Fixed = 1
+    PZ_OutputTrigEnable = 2
+    PZ_InputTrigEnable = 3
+    PZ_OutputTrigSenseHigh = 4
+    PZ_InputTrigSenseHigh = 5
+    PZ_OutputGated = 6
+    PZ_OutputTrigRepeat = 7
+
+
+# Make every member available under its C name.
+__all__ = ["CEnum"]
+for _enum in CEnum.__subclasses__():
+    globals().update(_enum.__members__)
+    __all__.append(_enum.__name__)
+    __all__.extend(_enum.__members__)
+del _enum
+
+
+class TLI_DeviceInfo(Structure):
+    _fields_ = [("typeID", c_dword),
+                ("description", (65 * c_char)),
+                ("serialNo", (9 * c_char)),
+                ("PID", c_dword),
+                ("isKnownType", c_bool),
+                ("motorType", MOT_MotorTypes.ctype),
+                ("isPiezoDevice", c_bool),
+                ("isLaser", c_bool),
+                ("isCustomType", c_bool),
+                ("isRack", c_bool),
+                ("maxChannels", c_short)]
+
+
+class TLI_HardwareInformation(Structure):
+    _fields_ = [("serialNumber", c_dword),
+                ("modelNumber", (8 * c_char)),
+                ("type", c_word),
+                ("firmwareVersion", c_dword),
+                ("notes", (48 * c_char)),
+                ("deviceDependantData", (12 * c_byte)),
+                ("hardwareVersion", c_word),
+                ("modificationState", c_word),
+                ("numChannels", c_short)]
+
+
+class MOT_VelocityParameters(Structure):
+    _fields_ = [("minVelocity", c_int),
+                ("acceleration", c_int),
+                ("maxVelocity", c_int)]
+
+
+class MOT_JogParameters(Structure):
+    _fields_ = [("mode", MOT_JogModes.ctype),
+                ("stepSize", c_uint),
+                ("velParams", MOT_VelocityParameters),
+                ("stopMode", MOT_StopModes.ctype)]
+
+
+class MOT_HomingParameters(Structure):
+    _fields_ = [("direction", MOT_TravelDirection.ctype),
+                ("limitSwitch", MOT_HomeLimitSwitchDirection.ctype),
+                ("velocity", c_uint),
+                ("offsetDistance", c_uint)]
+
+
+class MOT_LimitSwitchParameters(Structure):
+    _fields_ = [("clockwiseHardwareLimit", MOT_LimitSwitchModes.ctype),
+                ("anticlockwiseHardwareLimit", MOT_LimitSwitchModes.ctype),
+                ("clockwisePosition", c_dword),
+                ("anticlockwisePosition", c_dword),
+                ("softLimitMode", MOT_LimitSwitchSWModes.ctype)]
+
+
+class MOT_PowerParameters(Structure):
+    _fields_ = [("restPercentage", c_word),
+                ("movePercentage", c_word)]
+
+
+class MOT_JoystickParameters(Structure):
+    _fields_ = [("lowGearMaxVelocity", c_dword),
+                ("highGearMaxVelocity", c_dword),
+                ("lowGearAcceleration", c_dword),
+                ("highGearAcceleration", c_dword),
+                ("directionSense", MOT_TravelDirection.ctype)]
+
+
+class MOT_PIDLoopEncoderParams(Structure):
+    _fields_ = [("loopMode", MOT_PID_LoopMode.ctype),
+                ("proportionalGain", c_int),
+                ("integralGain", c_int),
+                ("differentialGain", c_int),
+                ("PIDOutputLimit", c_int),
+                ("PIDTolerance", c_int)]
+
+
+class MOT_ButtonParameters(Structure):
+    _fields_ = [("buttonMode", MOT_ButtonModes.ctype),
+                ("leftButtonPosition", c_int),
+                ("rightButtonPosition", c_int),
+                ("timeout", c_word),
+                ("unused", c_word)]
+
+
+class MOT_PotentiometerStep(Structure):
+    _fields_ = [("thresholdDeflection", c_word),
+                ("velocity", c_dword)]
+
+
+class MOT_PotentiometerSteps(Structure):
+    _fields_ = [("potentiometerStepParameters", (4 * MOT_PotentiometerStep))]
+
+
+class MOT_VelocityProfileParameters(Structure):
+    _fields_ = [("mode", MOT_VelocityProfileModes.ctype),
+                ("jerk", c_dword),
+                ("notUsed", c_word),
+                ("lastNotUsed", c_word)]
+
+
+class MOT_StageAxisParameters(Structure):
+    _fields_ = [("stageID", c_word),
+                ("axisID", c_word),
+                ("partNumber", (16 * c_char)),
+                ("serialNumber", c_dword),
+                ("countsPerUnit", c_dword),
+                ("minPosition", c_int),
+                ("maxPosition", c_int),
+                ("maxAcceleration", c_int),
+                ("maxDecceleration", c_int),
+                ("maxVelocity", c_int),
+                ("reserved1", c_word),
+                ("reserved2", c_word),
+                ("reserved3", c_word),
+                ("reserved4", c_word),
+                ("reserved5", c_dword),
+                ("reserved6", c_dword),
+                ("reserved7", c_dword),
+                ("reserved8", c_dword)]
+
+
+class MOT_DC_PIDParameters(Structure):
+    _fields_ = [("proportionalGain", c_int),
+                ("integralGain", c_int),
+                ("differentialGain", c_int),
+                ("integralLimit", c_int),
+                ("parameterFilter", c_word)]
+
+
+class MOT_BrushlessPositionLoopParameters(Structure):
+    _fields_ = [("proportionalGain", c_word),
+                ("integralGain", c_word),
+                ("integralLimit", c_dword),
+                ("differentialGain", c_word),
+                ("derivativeRecalculationTime", c_word),
+                ("factorForOutput", c_word),
+                ("velocityFeedForward", c_word),
+                ("accelerationFeedForward", c_word),
+                ("positionErrorLimit", c_dword),
+                ("notUsed", c_word),
+                ("lastNotUsed", c_word)]
+
+
+class MOT_BrushlessTrackSettleParameters(Structure):
+    _fields_ = [("time", c_word),
+                ("settledError", c_word),
+                ("maxTrackingError", c_word),
+                ("notUsed", c_word),
+                ("lastNotUsed", c_word)]
+
+
+class MOT_BrushlessCurrentLoopParameters(Structure):
+    _fields_ = [("phase", MOT_CurrentLoopPhases.ctype),
+                ("proportionalGain", c_word),
+                ("integralGain", c_word),
+                ("integralLimit", c_word),
+                ("deadErrorBand", c_word),
+                ("feedForward", c_word),
+                ("notUsed", c_word),
+                ("lastNotUsed", c_word)]
+
+
+class MOT_BrushlessElectricOutputParameters(Structure):
+    _fields_ = [("continuousCurrentLimit", c_word),
+                ("excessEnergyLimit", c_word),
+                ("motorSignalLimit", c_short),
+                ("motorSignalBias", c_short),
+                ("notUsed", c_word),
+                ("lastNotUsed", c_word)]
+
+
+class PZ_FeedbackLoopConstants(Structure):
+    _fields_ = [("proportionalTerm", c_short),
+                ("integralTerm", c_short)]
+
+
+class PZ_LUTWaveParameters(Structure):
+    _fields_ = [("mode", PZ_OutputLUTModes.ctype),
+                ("cycleLength", c_short),
+                ("numCycles", c_uint),
+                ("LUTValueDelay", c_uint),
+                ("preCycleDelay", c_uint),
+                ("postCycleDelay", c_uint),
+                ("outTriggerStart", c_short),
+                ("outTriggerDuration", c_uint),
+                ("numOutTriggerRepeat", c_short)]
+
+
+__all__ += [
+    "TLI_DeviceInfo",
+    "TLI_HardwareInformation",
+    "MOT_VelocityParameters",
+    "MOT_JogParameters",
+    "MOT_HomingParameters",
+    "MOT_LimitSwitchParameters",
+    "MOT_PowerParameters",
+    "MOT_JoystickParameters",
+    "MOT_PIDLoopEncoderParams",
+    "MOT_ButtonParameters",
+    "MOT_PotentiometerStep",
+    "MOT_PotentiometerSteps",
+    "MOT_VelocityProfileParameters",
+    "MOT_StageAxisParameters",
+    "MOT_DC_PIDParameters",
+    "MOT_BrushlessPositionLoopParameters",
+    "MOT_BrushlessTrackSettleParameters",
+    "MOT_BrushlessCurrentLoopParameters",
+    "MOT_BrushlessElectricOutputParameters",
+    "PZ_FeedbackLoopConstants",
+    "PZ_LUTWaveParameters",
+]
@@ -11,6 +11,7 @@ Utilities
 Utility functions.
 """
 
+import sys
 from ctypes import (
     CDLL,
     CFUNCTYPE,
@@ -19,15 +20,91 @@ from ctypes import (
 )
 from typing import (
     Any,
+    Callable,
+    Dict,
     List,
+    Tuple,
 )
 
+from thorlabs_kinesis._backend import Library
+
 c_word = c_ushort
 c_dword = c_ulong
 
 
+class LazyLibrary:
+    """Shared library that is loaded the first time one of its functions is
+    needed, from the backend selected in ``thorlabs_kinesis.config`` at that
+    time. Attribute access is forwarded to the loaded library, so it can be
+    used anywhere a ``CDLL`` is expected.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.backend = None
+        self._handle = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._handle is not None
+
+    @property
+    def handle(self) -> CDLL:
+        if self._handle is None:
+            from thorlabs_kinesis import config
+
+            backend = config.backend
+            self._handle = backend.load_library(self.name)
+            self.backend = backend
+        return self._handle
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.handle, name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<{type(self).__name__} {self.name!r} ({state})>"
+
+
+class LazyFunction:
+    """Function of a ``LazyLibrary`` that is looked up in the library and
+    given its prototype on first use.
+    """
+
+    __slots__ = ("lib", "name", "argtypes", "restype", "_func")
+
+    def __init__(self, lib: LazyLibrary, name: str,
+                 argtypes: List[Any]=None, restype: Any=None):
+        self.lib = lib
+        self.name = name
+        self.argtypes = argtypes
+        self.restype = restype
+        self._func = None
+
+    @property
+    def resolved(self) -> bool:
+        return self._func is not None
+
+    def resolve(self) -> CFUNCTYPE:
+        if self._func is None:
+            self._func = bind(self.lib.handle, self.name,
+                              self.argtypes, self.restype)
+        return self._func
+
+    def __call__(self, *args):
+        return self.resolve()(*args)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
 def bind(lib: CDLL, func: str,
          argtypes: List[Any]=None, restype: Any=None) -> CFUNCTYPE:
+    if isinstance(lib, LazyLibrary):
+        return LazyFunction(lib, func, argtypes, restype)
+    if isinstance(lib, Library):
+        return lib.bind(func, argtypes, restype)
+
     _func = getattr(lib, func, null_function)
     _func.argtypes = argtypes
     _func.restype = restype
@@ -35,6 +112,49 @@ def bind(lib: CDLL, func: str,
     return _func
 
 
+def defer_bindings(namespace: Dict[str, Any]) -> Tuple[Callable, Callable]:
+    """Take the ``LazyFunction`` objects out of a module namespace and return
+    the module level ``__getattr__`` and ``__dir__`` that bind them on first
+    access. Once bound, a function is stored back in the namespace so later
+    lookups are plain attribute reads.
+
+    The module's ``__all__`` is set to its public names, the pending
+    functions included, so ``from module import *`` still exports them; it
+    binds every function, which needs the library. A function whose library
+    can't be loaded raises an AttributeError, chained to the OSError, so
+    ``hasattr`` and ``getattr`` with a default work as for any attribute.
+
+    Python 3.6 has no module ``__getattr__``, so there the placeholders are
+    left in place and bind themselves on first call instead.
+    """
+    pending = {name: value for name, value in namespace.items()
+               if isinstance(value, LazyFunction)}
+    namespace["__all__"] = sorted(name for name in namespace
+                                  if not name.startswith("_"))
+
+    if sys.version_info >= (3, 7):
+        for name in pending:
+            del namespace[name]
+
+    def __getattr__(name: str) -> Any:
+        lazy = pending.get(name)
+        if lazy is None:
+            raise AttributeError(
+                f"module {namespace['__name__']!r} has no attribute {name!r}")
+        try:
+            func = namespace[name] = lazy.resolve()
+        except OSError as err:
+            raise AttributeError(
+                f"module {namespace['__name__']!r} can't bind {name!r}: "
+                f"{err}") from err
+        return func
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(pending))
+
+    return __getattr__, __dir__
+
+
 def null_function():
     pass
 
@@ -44,7 +164,10 @@ def not_implemented():
 
 
 __all__ = [
+    "LazyLibrary",
+    "LazyFunction",
     "bind",
+    "defer_bindings",
     "null_function",
     "c_word",
     "c_dword",
@@ -1,14 +1,9 @@
 # Bindings for Thorlabs Benchtop Piezo BCP 303 (3 channel piezo controller)
 # Implemented with Kinesis Version 1.14.23.16838
-import thorlabs_kinesis as tk
-
 # import c types
 from ctypes import (
-    Structure,
-    cdll,
     c_bool,
     c_short,
-    c_uint,
     c_int,
     c_int32,
     c_int64,
@@ -16,90 +11,21 @@ from ctypes import (
     c_byte,
     c_long,
     POINTER,
+    CFUNCTYPE,
 )
 
 from thorlabs_kinesis._utils import (
     c_word,
     c_dword,
-    bind
+    bind,
+    defer_bindings,
+    LazyLibrary,
 )
 
-lib = cdll.LoadLibrary("Thorlabs.MotionControl.Benchtop.Piezo.dll")
-
-
-# enum MOT_MotorTypes (c_int)
-MOT_NotMotor = c_int(0)
-MOT_DCMotor = c_int(1)
-MOT_StepperMotor = c_int(2)
-MOT_BrushlessMotor = c_int(3)
-MOT_CustomMotor = c_int(100)
-MOT_MotorTypes = c_int
-
-# enum control types (c_int)
-PZ_Undefined = c_short(0)
-PZ_OpenLoop = c_short(1)
-PZ_ClosedLoop = c_short(2)
-PZ_OpenLoopSmoothed = c_short(3)
-PZ_ClosedLoopSmoothed = c_short(4)
-PZ_ControlModeTypes = c_short # this is the variable the int will be saved to
-
-# enum PZ_InputSourceFlags # TODO: Verify these!
-PZ_SoftwareOnly = c_short(0)
-PZ_ExternalSignal = c_short(1)
-PZ_Potentiometer = c_short(2)
-PZ_All = c_short(3)
-PZ_InputSourceFlags = c_short
-
-# enum PZ_OutputLUTModes
-PZ_Continuous = c_short(0)
-PZ_Fixed = c_short(1)
-PZ_OutputTrigEnable = c_short(2)
-PZ_InputTrigEnable = c_short(3)
-PZ_OutputTrigSenseHigh = c_short(4)
-PZ_InputTrigSenseHigh = c_short(5)
-PZ_OutputGated = c_short(6)
-PZ_OutputTrigRepeat = c_short(7)
-PZ_OutputLUTModes = c_short
+lib = LazyLibrary("Thorlabs.MotionControl.Benchtop.Piezo.dll")
 
 
-class TLI_DeviceInfo(Structure):
-    _fields_ = [("typeID", c_dword),
-                ("description", (65 * c_char)),
-                ("serialNo", (9 * c_char)),
-                ("PID", c_dword),
-                ("isKnownType", c_bool),
-                ("motorType", MOT_MotorTypes),
-                ("isPiezoDevice", c_bool),
-                ("isLaser", c_bool),
-                ("isCustomType", c_bool),
-                ("isRack", c_bool),
-                ("maxChannels", c_short)]
-
-class TLI_HardwareInformation(Structure):
-    _fields_ = [("serialNumber", c_dword),
-                ("modelNumber", (8 * c_char)),
-                ("type", c_word),
-                ("firmwareVersion", c_dword),
-                ("notes", (48 * c_char)),
-                ("deviceDependantData", (12 * c_byte)),
-                ("hardwareVersion", c_word),
-                ("modificationState", c_word),
-                ("numChannels", c_short)]
-
-class PZ_FeedbackLoopConstants(Structure):
-    _fields_ = [("integralTerm", c_short),
-                ("proportionalTerm", c_short)]
-
-class PZ_LUTWaveParameters(Structure):
-    _fields_ = [("cycleLength", c_short),
-                ("LUTValueDelay", c_uint),
-                ("mode", PZ_OutputLUTModes),
-                ("numCycles", c_uint),
-                ("numOutTriggerRepeat", c_short),
-                ("outTriggerDuration", c_uint),
-                ("outTriggerStart", c_short),
-                ("postCycleDelay", c_uint),
-                ("preCycleDelay", c_uint)]
+from thorlabs_kinesis._types import *
 
 
 TLI_BuildDeviceList = bind(lib, "TLI_BuildDeviceList", None, c_short)
@@ -130,12 +56,12 @@ PBC_GetNextMessage = bind(lib, "PBC_GetNextMessage", [POINTER(c_char), c_short,
 PBC_GetNumChannels = bind(lib, "PBC_GetNumChannels", [POINTER(c_char)], c_short)
 PBC_GetOutputVoltage = bind(lib, "PBC_GetOutputVoltage", [POINTER(c_char), c_short], c_short)
 PBC_GetPosition = bind(lib, "PBC_GetPosition", [POINTER(c_char), c_short], c_short)
-PBC_GetPositionControlMode = bind(lib, "PBC_GetPositionControlMode", [POINTER(c_char), c_short], PZ_ControlModeTypes)
+PBC_GetPositionControlMode = bind(lib, "PBC_GetPositionControlMode", [POINTER(c_char), c_short], PZ_ControlModeTypes.ctype)
 PBC_GetRackDigitalOutputs = bind(lib, "PBC_GetRackDigitalOutputs", [POINTER(c_char)], c_byte)
 PBC_GetRackStatusBits = bind(lib, "PBC_GetRackStatusBits", [POINTER(c_char)], c_dword)
 PBC_GetSoftwareVersion = bind(lib, "PBC_GetSoftwareVersion", [POINTER(c_char)], c_dword)
 PBC_GetStatusBits = bind(lib, "PBC_GetStatusBits", [POINTER(c_char), c_short], c_dword)
-PBC_GetVoltageSource = bind(lib, "PBC_GetVoltageSource", [POINTER(c_char), c_short], PZ_InputSourceFlags)
+PBC_GetVoltageSource = bind(lib, "PBC_GetVoltageSource", [POINTER(c_char), c_short], PZ_InputSourceFlags.ctype)
 PBC_HasLastMsgTimerOverrun = bind(lib, "PBC_HasLastMsgTimerOverrun", [POINTER(c_char), c_short], c_bool)
 PBC_Identify = bind(lib, "PBC_Identify", [POINTER(c_char), c_short], None)
 PBC_IsChannelValid = bind(lib, "PBC_IsChannelValid", [POINTER(c_char), c_short], c_bool)
@@ -146,7 +72,7 @@ PBC_MessageQueueSize = bind(lib, "PBC_MessageQueueSize", [POINTER(c_char), c_sho
 PBC_Open = bind(lib, "PBC_Open", [POINTER(c_char)], c_short)
 PBC_PersistSettings = bind(lib, "PBC_PersistSettings", [POINTER(c_char), c_short], c_bool)
 PBC_PollingDuration = bind(lib, "PBC_PollingDuration", [POINTER(c_char), c_short], c_long)
-# PBC_RegisterMessageCallback = 
+PBC_RegisterMessageCallback = bind(lib, "PBC_RegisterMessageCallback", [POINTER(c_char), c_short, CFUNCTYPE(None)])
 PBC_RequestActualPosition = bind(lib, "PBC_RequestActualPosition", [POINTER(c_char), c_short], c_short)
 PBC_RequestFeedbackLoopPIconsts = bind(lib, "PBC_RequestFeedbackLoopPIconsts", [POINTER(c_char), c_short], c_bool)
 PBC_RequestMaximumTravel = bind(lib, "PBC_RequestMaximumTravel", [POINTER(c_char), c_short], c_bool)
@@ -177,5 +103,8 @@ PBC_StartLUTwave = bind(lib, "PBC_StartLUTwave", [POINTER(c_char), c_short], c_s
 PBC_StartPolling = bind(lib, "PBC_StartPolling", [POINTER(c_char), c_short, c_int], c_bool)
 PBC_StopLUTwave = bind(lib, "PBC_StopLUTwave", [POINTER(c_char), c_short], c_short)
 PBC_StopPolling = bind(lib, "PBC_StopPolling", [POINTER(c_char), c_short], None)
-PBC_TimeSinceLastMsgReceived = bind(lib, "", [POINTER(c_char), c_short, POINTER(c_int64)], c_bool)
+PBC_TimeSinceLastMsgReceived = bind(lib, "PBC_TimeSinceLastMsgReceived", [POINTER(c_char), c_short, POINTER(c_int64)], c_bool)
 PBC_WaitForMessage = bind(lib, "PBC_WaitForMessage", [POINTER(c_char), c_short, POINTER(c_word), POINTER(c_word), POINTER(c_dword)], c_bool)
+
+
+__getattr__, __dir__ = defer_bindings(globals())
@@ -13,14 +13,12 @@ Bindings for Thorlabs Benchtop Stepper Motor DLL.
 
 # flake8: noqa
 from ctypes import (
-    Structure,
-    cdll,
     c_bool,
     c_short,
     c_int,
     c_uint,
-    c_int16,
     c_int32,
+    c_int64,
     c_char,
     c_byte,
     c_long,
@@ -33,197 +31,15 @@ from ctypes import (
 from thorlabs_kinesis._utils import (
     c_word,
     c_dword,
-    bind
+    bind,
+    defer_bindings,
+    LazyLibrary,
 )
 
-lib = cdll.LoadLibrary("Thorlabs.MotionControl.Benchtop.StepperMotor.dll")
+lib = LazyLibrary("Thorlabs.MotionControl.Benchtop.StepperMotor.dll")
 
 
-# enum FT_Status
-FT_OK = c_short(0x00)
-FT_InvalidHandle = c_short(0x01)
-FT_DeviceNotFound = c_short(0x02)
-FT_DeviceNotOpened = c_short(0x03)
-FT_IOError = c_short(0x04)
-FT_InsufficientResources = c_short(0x05)
-FT_InvalidParameter = c_short(0x06)
-FT_DeviceNotPresent = c_short(0x07)
-FT_IncorrectDevice = c_short(0x08)
-FT_Status = c_short
-
-# enum MOT_MotorTypes
-MOT_NotMotor = c_int(0)
-MOT_DCMotor = c_int(1)
-MOT_StepperMotor = c_int(2)
-MOT_BrushlessMotor = c_int(3)
-MOT_CustomMotor = c_int(100)
-MOT_MotorTypes = c_int
-
-# enum MOT_TravelModes
-MOT_TravelModeUndefined = c_int(0x00)
-MOT_Linear = c_int(0x01)
-MOT_Rotational = c_int(0x02)
-MOT_TravelModes = c_int
-
-# enum MOT_TravelDirection
-MOT_TravelDirectionUndefined = c_short(0x00)
-MOT_Forwards = c_short(0x01)
-MOT_Reverse = c_short(0x02)
-MOT_TravelDirection = c_short
-
-# enum MOT_HomeLimitSwitchDirection
-MOT_LimitSwitchDirectionUndefined = c_short(0x00)
-MOT_ReverseLimitSwitch = c_short(0x01)
-MOT_ForwardLimitSwitch = c_short(0x04)
-MOT_HomeLimitSwitchDirection = c_short
-
-# enum MOT_DirectionSense
-MOT_Normal = c_short(0x00)
-MOT_Backwards = c_short(0x01)
-MOT_DirectionSense = c_short
-
-# enum MOT_JogModes
-MOT_JogModeUndefined = c_short(0x00)
-MOT_Continuous = c_short(0x01)
-MOT_SingleStep = c_short(0x02)
-MOT_JogModes = c_short
-
-# enum MOT_StopModes
-MOT_StopModeUndefined = c_short(0x00)
-MOT_Immediate = c_short(0x01)
-MOT_Profiled = c_short(0x02)
-MOT_StopModes = c_short
-
-# enum MOT_ButtonModes
-MOT_ButtonModeUndefined = c_word(0x00)
-MOT_JogMode = c_word(0x01)
-MOT_Preset = c_word(0x02)
-MOT_ButtonModes = c_word
-
-# enum MOT_LimitSwitchModes
-MOT_LimitSwitchModeUndefined = c_word(0x00)
-MOT_LimitSwitchIgnoreSwitch = c_word(0x01)
-MOT_LimitSwitchMakeOnContact = c_word(0x02)
-MOT_LimitSwitchBreakOnContact = c_word(0x03)
-MOT_LimitSwitchMakeOnHome = c_word(0x04)
-MOT_LimitSwitchBreakOnHome = c_word(0x05)
-MOT_PMD_Reserved = c_word(0x06)
-MOT_LimitSwitchIgnoreSwitchSwapped = c_word(0x81)
-MOT_LimitSwitchMakeOnContactSwapped = c_word(0x82)
-MOT_LimitSwitchBreakOnContactSwapped = c_word(0x83)
-MOT_LimitSwitchMakeOnHomeSwapped = c_word(0x84)
-MOT_LimitSwitchBreakOnHomeSwapped = c_word(0x85)
-MOT_LimitSwitchModes = c_word
-
-# enum MOT_LimitSwitchSWModes
-MOT_LimitSwitchSWModeUndefined = c_word(0x00)
-MOT_LimitSwitchIgnored = c_word(0x01)
-MOT_LimitSwitchStopImmediate = c_word(0x02)
-MOT_LimitSwitchStopProfiled = c_word(0x03)
-MOT_LimitSwitchIgnored_Rotational = c_word(0x81)
-MOT_LimitSwitchStopImmediate_Rotational = c_word(0x82)
-MOT_LimitSwitchStopProfiled_Rotational = c_word(0x83)
-MOT_LimitSwitchSWModes = c_word
-
-# enum MOT_LimitsSoftwareApproachPolicy
-DisallowIllegalMoves = c_int16(0)
-AllowPartialMoves = c_int16(1)
-AllowAllMoves = c_int16(2)
-MOT_LimitsSoftwareApproachPolicy = c_int16
-
-# enum MOT_PID_LoopMode
-MOT_PIDLoopModeDisabled = c_word(0x00)
-MOT_PIDOpenLoopMode = c_word(0x01)
-MOT_PIDClosedLoopMode = c_word(0x02)
-MOT_PID_LoopMode = c_word
-
-# enum MOT_MovementModes
-LinearRange = c_int(0x00)
-RotationalUnlimited = c_int(0x01)
-RotationalWrapping = c_int(0x02)
-MOT_MovementModes = c_int
-
-# enum MOT_MovementDirections
-Quickest = c_int(0x00)
-Forwards = c_int(0x01)
-Reverse = c_int(0x02)
-MOT_MovementDirections = c_int
-
-
-class TLI_DeviceInfo(Structure):
-    _fields_ = [("typeID", c_dword),
-                ("description", (65 * c_char)),
-                ("serialNo", (9 * c_char)),
-                ("PID", c_dword),
-                ("isKnownType", c_bool),
-                ("motorType", MOT_MotorTypes),
-                ("isPiezoDevice", c_bool),
-                ("isLaser", c_bool),
-                ("isCustomType", c_bool),
-                ("isRack", c_bool),
-                ("maxChannels", c_short)]
-
-
-class TLI_HardwareInformation(Structure):
-    _fields_ = [("serialNumber", c_dword),
-                ("modelNumber", (8 * c_char)),
-                ("type", c_word),
-                ("firmwareVersion", c_dword),
-                ("notes", (48 * c_char)),
-                ("deviceDependantData", (12 * c_byte)),
-                ("hardwareVersion", c_word),
-                ("modificationState", c_word),
-                ("numChannels", c_short)]
-
-
-class MOT_VelocityParameters(Structure):
-    _fields_ = [("minVelocity", c_int),
-                ("acceleration", c_int),
-                ("maxVelocity", c_int)]
-
-
-class MOT_JogParameters(Structure):
-    _fields_ = [("mode", MOT_JogModes),
-                ("stepSize", c_uint),
-                ("velParams", MOT_VelocityParameters),
-                ("stopMode", MOT_StopModes)]
-
-
-class MOT_HomingParameters(Structure):
-    _fields_ = [("direction", MOT_TravelDirection),
-                ("limitSwitch", MOT_HomeLimitSwitchDirection),
-                ("velocity", c_uint),
-                ("offsetDistance", c_uint)]
-
-
-class MOT_LimitSwitchParameters(Structure):
-    _fields_ = [("clockwiseHardwareLimit", MOT_LimitSwitchModes),
-                ("anticlockwiseHardwareLimit", MOT_LimitSwitchModes),
-                ("clockwisePosition", c_dword),
-                ("anticlockwisePosition", c_dword),
-                ("softLimitMode", MOT_LimitSwitchSWModes)]
-
-
-class MOT_PowerParameters(Structure):
-    _fields_ = [("restPercentage", c_word),
-                ("movePercentage", c_word)]
-
-
-class MOT_JoystickParameters(Structure):
-    _fields_ = [("lowGearMaxVelocity", c_dword),
-                ("highGearMaxVelocity", c_dword),
-                ("lowGearAcceleration", c_dword),
-                ("highGearAcceleration", c_dword),
-                ("directionSense", MOT_TravelDirection)]
-
-
-class MOT_PIDLoopEncoderParams(Structure):
-    _fields_ = [("loopMode", MOT_PID_LoopMode),
-                ("proportionalGain", c_int),
-                ("integralGain", c_int),
-                ("differentialGain", c_int),
-                ("PIDOutputLimit", c_int),
-                ("PIDTolerance", c_int)]
+from thorlabs_kinesis._types import *
 
 
 TLI_BuildDeviceList = bind(lib, "TLI_BuildDeviceList", None, c_short)
@@ -271,7 +87,7 @@ SBC_GetHomingVelocity = bind(lib, "SBC_GetHomingVelocity", [POINTER(c_char), c_s
 SBC_SetHomingVelocity = bind(lib, "SBC_SetHomingVelocity", [POINTER(c_char), c_short, c_uint], c_short)
 SBC_MoveRelative = bind(lib, "SBC_MoveRelative", [POINTER(c_char), c_short, c_int], c_short)
 SBC_RequestJogParams = bind(lib, "SBC_RequestJogParams", [POINTER(c_char), c_short], c_short)
-SBC_GetJogMode = bind(lib, "SBC_GetJogMode", [POINTER(c_char), c_short, POINTER(MOT_JogModes), POINTER(MOT_StopModes)], c_short)
+SBC_GetJogMode = bind(lib, "SBC_GetJogMode", [POINTER(c_char), c_short, POINTER(MOT_JogModes.ctype), POINTER(MOT_StopModes.ctype)], c_short)
 SBC_SetJogMode = bind(lib, "SBC_SetJogMode", [POINTER(c_char), c_short, MOT_JogModes, MOT_StopModes], c_short)
 SBC_GetJogStepSize = bind(lib, "SBC_GetJogStepSize", [POINTER(c_char), c_short], c_uint)
 SBC_SetJogStepSize = bind(lib, "SBC_SetJogStepSize", [POINTER(c_char), c_short, c_uint], c_short)
@@ -294,9 +110,9 @@ SBC_RequestEncoderCounter = bind(lib, "SBC_RequestEncoderCounter", [POINTER(c_ch
 SBC_GetEncoderCounter = bind(lib, "SBC_GetEncoderCounter", [POINTER(c_char), c_short], c_long)
 SBC_SetEncoderCounter = bind(lib, "SBC_SetEncoderCounter", [POINTER(c_char), c_short, c_long], c_short)
 SBC_RequestLimitSwitchParams = bind(lib, "SBC_RequestLimitSwitchParams", [POINTER(c_char), c_short], c_short)
-SBC_GetLimitSwitchParams = bind(lib, "SBC_GetLimitSwitchParams", [POINTER(c_char), c_short, POINTER(MOT_LimitSwitchModes), POINTER(MOT_LimitSwitchModes), POINTER(c_uint), POINTER(c_uint), POINTER(MOT_LimitSwitchSWModes)], c_short)
+SBC_GetLimitSwitchParams = bind(lib, "SBC_GetLimitSwitchParams", [POINTER(c_char), c_short, POINTER(MOT_LimitSwitchModes.ctype), POINTER(MOT_LimitSwitchModes.ctype), POINTER(c_uint), POINTER(c_uint), POINTER(MOT_LimitSwitchSWModes.ctype)], c_short)
 SBC_SetLimitSwitchParams = bind(lib, "SBC_SetLimitSwitchParams", [POINTER(c_char), c_short, MOT_LimitSwitchModes, MOT_LimitSwitchModes, c_uint, c_uint, MOT_LimitSwitchSWModes], c_short)
-SBC_GetSoftLimitMode = bind(lib, "SBC_GetSoftLimitMode", [POINTER(c_char), c_short], MOT_LimitsSoftwareApproachPolicy)
+SBC_GetSoftLimitMode = bind(lib, "SBC_GetSoftLimitMode", [POINTER(c_char), c_short], MOT_LimitsSoftwareApproachPolicy.ctype)
 SBC_SetLimitsSoftwareApproachPolicy = bind(lib, "SBC_SetLimitsSoftwareApproachPolicy", [POINTER(c_char), c_short, MOT_LimitsSoftwareApproachPolicy])
 SBC_GetVelParamsBlock = bind(lib, "SBC_GetVelParamsBlock", [POINTER(c_char), c_short, POINTER(MOT_VelocityParameters)], c_short)
 SBC_SetVelParamsBlock = bind(lib, "SBC_SetVelParamsBlock", [POINTER(c_char), c_short, POINTER(MOT_VelocityParameters)], c_short)
@@ -350,7 +166,7 @@ SBC_GetStatusBits = bind(lib, "SBC_GetStatusBits", [POINTER(c_char), c_short], c
 SBC_StartPolling = bind(lib, "SBC_StartPolling", [POINTER(c_char), c_short, c_int], c_bool)
 SBC_PollingDuration = bind(lib, "SBC_PollingDuration", [POINTER(c_char), c_short], c_long)
 SBC_StopPolling = bind(lib, "SBC_StopPolling", [POINTER(c_char), c_short])
-# SBC_TimeSinceLastMsgReceived <- TODO: BENCHTOPSTEPPERMOTOR_API bool __cdecl SBC_TimeSinceLastMsgReceived(char const * serialNo, short channel, __int64 &lastUpdateTimeMS );
+SBC_TimeSinceLastMsgReceived = bind(lib, "SBC_TimeSinceLastMsgReceived", [POINTER(c_char), c_short, POINTER(c_int64)], c_bool)
 SBC_EnableLastMsgTimer = bind(lib, "SBC_EnableLastMsgTimer", [POINTER(c_char), c_short, c_bool, c_int32])
 SBC_HasLastMsgTimerOverrun = bind(lib, "SBC_HasLastMsgTimerOverrun", [POINTER(c_char), c_short], c_bool)
 SBC_RequestSettings = bind(lib, "SBC_RequestSettings", [POINTER(c_char), c_short], c_short)
@@ -358,7 +174,7 @@ SBC_GetStageAxisMinPos = bind(lib, "SBC_GetStageAxisMinPos", [POINTER(c_char), c
 SBC_GetStageAxisMaxPos = bind(lib, "SBC_GetStageAxisMaxPos", [POINTER(c_char), c_short], c_int)
 SBC_SetStageAxisLimits = bind(lib, "SBC_SetStageAxisLimits", [POINTER(c_char), c_short, c_int, c_int], c_short)
 SBC_SetMotorTravelMode = bind(lib, "SBC_SetMotorTravelMode", [POINTER(c_char), c_short, MOT_TravelModes], c_short)
-SBC_GetMotorTravelMode = bind(lib, "SBC_GetMotorTravelMode", [POINTER(c_char), c_short], MOT_TravelModes)
+SBC_GetMotorTravelMode = bind(lib, "SBC_GetMotorTravelMode", [POINTER(c_char), c_short], MOT_TravelModes.ctype)
 SBC_SetMotorParams = bind(lib, "SBC_SetMotorParams", [POINTER(c_char), c_short, c_long, c_long, c_float], c_short)
 SBC_GetMotorParams = bind(lib, "SBC_GetMotorParams", [POINTER(c_char), c_short, POINTER(c_long), POINTER(c_long), POINTER(c_float)], c_short)
 SBC_SetMotorParamsExt = bind(lib, "SBC_SetMotorParamsExt", [POINTER(c_char), c_short, c_double, c_double, c_double], c_short)
@@ -371,3 +187,6 @@ SBC_SetMotorTravelLimits = bind(lib, "SBC_SetMotorTravelLimits", [POINTER(c_char
 SBC_GetMotorTravelLimits = bind(lib, "SBC_GetMotorTravelLimits", [POINTER(c_char), c_short, POINTER(c_double), POINTER(c_double)], c_short)
 SBC_GetRealValueFromDeviceUnit = bind(lib, "SBC_GetRealValueFromDeviceUnit", [POINTER(c_char), c_short, c_int, POINTER(c_double), c_int], c_short)
 SBC_GetDeviceUnitFromRealValue = bind(lib, "SBC_GetDeviceUnitFromRealValue", [POINTER(c_char), c_short, c_double, POINTER(c_int), c_int], c_short)
+
+
+__getattr__, __dir__ = defer_bindings(globals())
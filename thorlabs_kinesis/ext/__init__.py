@@ -1,13 +1,143 @@
+from thorlabs_kinesis.ext._approach import (
+    Approach,
+    ApproachPlanner,
+    backlash_disabled,
+)
 from thorlabs_kinesis.ext._device import (
     serial_prefix,
     expand_device,
     device_to_real_units,
     real_to_device_units,
 )
+from thorlabs_kinesis.ext._device_list import DeviceListReader
+from thorlabs_kinesis.ext._discovery import (
+    Discovery,
+    discover,
+)
+from thorlabs_kinesis.ext._dispatch import (
+    Message,
+    MessageDispatcher,
+    Subscription,
+)
+from thorlabs_kinesis.ext._group import (
+    ChannelGroup,
+    GroupMove,
+)
+from thorlabs_kinesis.ext._handle import (
+    DeviceHandle,
+    open_device,
+)
+from thorlabs_kinesis.ext._messages import (
+    MessageDrain,
+    message_name,
+    message_names,
+)
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    Motor,
+)
+from thorlabs_kinesis.ext._ordering import order_points
+from thorlabs_kinesis.ext._polling import PollingManager
+from thorlabs_kinesis.ext._profile import (
+    MoveProfile,
+    bow_jerk,
+    plan_time,
+)
+from thorlabs_kinesis.ext._registry import DeviceRegistry
+from thorlabs_kinesis.ext._rotation import RotationalAxis
+from thorlabs_kinesis.ext._scan import (
+    Scan,
+    ScanPoint,
+)
+from thorlabs_kinesis.ext._stages import (
+    StageDatabase,
+    StageInfo,
+    detect_stage,
+    load_stages,
+    stage_info,
+)
+from thorlabs_kinesis.ext._status import (
+    MotorStatus,
+    PiezoStatus,
+    decode_status,
+    decode_status_array,
+    has_error,
+    is_homed,
+    is_homing,
+    is_moving,
+    status_flags,
+)
+from thorlabs_kinesis.ext._telemetry import (
+    Snapshot,
+    TelemetryBuffer,
+    TelemetrySampler,
+)
+from thorlabs_kinesis.ext._units import (
+    ChannelUnits,
+    UnitConverter,
+)
+from thorlabs_kinesis.ext._wait import (
+    wait_for_home,
+    wait_for_move,
+)
+from thorlabs_kinesis.ext._watchdog import (
+    HealthEvent,
+    Watchdog,
+)
 
 __all__ = [
     "serial_prefix",
     "expand_device",
     "device_to_real_units",
     "real_to_device_units",
+    "DeviceListReader",
+    "DeviceRegistry",
+    "Discovery",
+    "discover",
+    "DeviceHandle",
+    "open_device",
+    "Channel",
+    "Motor",
+    "wait_for_home",
+    "wait_for_move",
+    "MotorStatus",
+    "PiezoStatus",
+    "decode_status",
+    "decode_status_array",
+    "has_error",
+    "is_homed",
+    "is_homing",
+    "is_moving",
+    "status_flags",
+    "Snapshot",
+    "TelemetryBuffer",
+    "TelemetrySampler",
+    "PollingManager",
+    "MessageDrain",
+    "message_name",
+    "message_names",
+    "Message",
+    "MessageDispatcher",
+    "Subscription",
+    "HealthEvent",
+    "Watchdog",
+    "UnitConverter",
+    "ChannelUnits",
+    "StageDatabase",
+    "StageInfo",
+    "detect_stage",
+    "load_stages",
+    "stage_info",
+    "ChannelGroup",
+    "GroupMove",
+    "Scan",
+    "ScanPoint",
+    "MoveProfile",
+    "bow_jerk",
+    "plan_time",
+    "order_points",
+    "Approach",
+    "ApproachPlanner",
+    "backlash_disabled",
+    "RotationalAxis",
 ]
\ No newline at end of file
@@ -0,0 +1,161 @@
+"Planning moves that approach every point from the same direction."
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+)
+
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    as_channel,
+)
+
+__all__ = [
+    "Approach",
+    "ApproachPlanner",
+    "backlash_disabled",
+]
+
+# ``waypoints`` are the rows to move through, ``measured`` marks the ones
+# that are points of the plan, in order, the others are overshoots.
+Approach = namedtuple("Approach", ["waypoints", "measured"])
+
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Planning approaches needs NumPy.") from None
+    return np
+
+
+def _backlash(channel: Channel) -> int:
+    return channel.motor.function("GetBacklash")(*channel._args)
+
+
+class ApproachPlanner:
+    """Plans moves so that every point of a plan is reached moving in the
+    same ``direction`` per axis, 1 (forwards) or -1 (reverse), which takes
+    the backlash of the drive out of the positions reached.
+
+    An axis moving against its direction to a point first overshoots it by
+    its ``backlash`` and then returns; axes already moving in their
+    direction, or not at all, go straight to the point during the overshoot,
+    so the moves of the axes are merged into one overshoot row per point.
+    Both passes run on whole plans in device units at once.
+
+    Controllers correct backlash on their own on every reverse move, by the
+    distance of SetBacklash; turn that off with ``backlash_disabled`` while
+    running a planned approach, or the corrections add up.
+
+    >>> planner = ApproachPlanner([2000, 2000])
+    >>> approach = planner.plan([[0, 0], [1000, 5000], [500, 6000]],
+    ...                         start=[0, 0])
+    >>> approach.waypoints.tolist()
+    [[0, 0], [1000, 5000], [-1500, 6000], [500, 6000]]
+    >>> approach.measured.tolist()
+    [True, True, False, True]
+    """
+
+    def __init__(self, backlash, direction=1):
+        np = _numpy()
+        backlash = np.atleast_1d(np.asarray(backlash, dtype=np.int64))
+        direction = np.broadcast_to(np.asarray(direction, dtype=np.int64),
+                                    backlash.shape)
+        if backlash.ndim != 1 or (backlash < 0).any():
+            raise ValueError("Backlash is one distance of at least 0 per "
+                             "axis.")
+        if not np.isin(direction, (-1, 1)).all():
+            raise ValueError("Directions are 1 (forwards) or -1 (reverse).")
+        self.backlash = backlash
+        self.direction = direction.copy()
+
+    @classmethod
+    def from_channels(cls, channels: Iterable[Channel],
+                      direction=1) -> "ApproachPlanner":
+        """A planner with the backlash of the channels (or Motors, for their
+        first channel), from their GetBacklash, in device units.
+        """
+        channels = [as_channel(channel) for channel in channels]
+        return cls([_backlash(channel) for channel in channels], direction)
+
+    def __len__(self) -> int:
+        return len(self.backlash)
+
+    def plan(self, plan, start=None) -> Approach:
+        """The waypoints through a plan with a row per point and a column per
+        axis (or a vector for one axis), in device units.
+
+        ``start`` is the positions before the plan, reached moving in the
+        approach direction; without it, the first point is reached with an
+        overshoot on every axis, its last direction being unknown.
+        """
+        np = _numpy()
+        plan = np.asarray(plan)
+        if plan.ndim == 1:
+            plan = plan[:, np.newaxis]
+        if plan.ndim != 2 or plan.shape[1] != len(self):
+            raise ValueError(f"A plan for {len(self)} axes needs {len(self)} "
+                             f"columns, not shape {plan.shape}.")
+        if plan.dtype.kind not in "iu":
+            raise TypeError("Plans are in device units, as integers.")
+        plan = plan.astype(np.int64)
+        count = len(plan)
+
+        # Axes reaching every point against their direction.
+        delta = np.empty_like(plan)
+        if start is None:
+            delta[:1] = -self.direction
+        else:
+            start = np.reshape(np.asarray(start, dtype=np.int64),
+                               (1, len(self)))
+            delta[:1] = plan[:1] - start
+        np.subtract(plan[1:], plan[:-1], out=delta[1:])
+        against = (delta * self.direction < 0) & (self.backlash > 0)
+        overshoots = against.any(axis=1)
+
+        # Every point moves down by the overshoots inserted before it.
+        rows = np.arange(count) + np.cumsum(overshoots)
+        waypoints = np.empty((count + int(overshoots.sum()), len(self)),
+                             dtype=np.int64)
+        waypoints[rows] = plan
+        waypoints[rows[overshoots] - 1] = (
+            plan[overshoots]
+            - against[overshoots] * self.direction * self.backlash)
+        if waypoints.size and (waypoints.min() < INT32_MIN or
+                               waypoints.max() > INT32_MAX):
+            raise ValueError("Overshoots are out of the range of device "
+                             "units.")
+        measured = np.zeros(len(waypoints), dtype=bool)
+        measured[rows] = True
+        return Approach(waypoints.astype(np.int32), measured)
+
+    def __repr__(self) -> str:
+        return (f"<ApproachPlanner backlash {self.backlash.tolist()}, "
+                f"direction {self.direction.tolist()}>")
+
+
+@contextmanager
+def backlash_disabled(channels: Iterable[Channel]) -> Iterator[List[int]]:
+    """Sets the backlash correction of the channels (or Motors) to 0 with
+    SetBacklash, giving the distances it had, which are set again on exit.
+    """
+    channels = [as_channel(channel) for channel in channels]
+    previous = [_backlash(channel) for channel in channels]
+    changed = []  # type: List[Channel]
+    try:
+        for channel in channels:
+            err = channel.motor.function("SetBacklash")(*channel._args, 0)
+            if err != 0:
+                raise OSError(f"Can't set the backlash of {channel}, "
+                              f"error {err}.")
+            changed.append(channel)
+        yield previous
+    finally:
+        for channel, distance in zip(changed, previous):
+            channel.motor.function("SetBacklash")(*channel._args, distance)
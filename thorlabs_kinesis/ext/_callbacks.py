@@ -0,0 +1,254 @@
+"""The message callbacks of the devices, one per device (or channel), shared
+by everything that reads its messages.
+
+The DLL keeps a single callback per device (or channel), registering another
+one replaces it, and it only holds a pointer to the ctypes thunk. The thunks
+are kept here, keyed by serial number and channel, and every reader gets its
+messages from the same callback through a Subscription.
+"""
+import threading
+import time
+from collections import (
+    deque,
+    namedtuple,
+)
+from ctypes import (
+    CFUNCTYPE,
+    byref,
+)
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from thorlabs_kinesis._utils import (
+    c_dword,
+    c_word,
+    not_implemented,
+)
+
+__all__ = [
+    "Message",
+    "Subscription",
+    "register_callbacks",
+    "subscribe",
+]
+
+Message = namedtuple("Message", ["type", "id", "data", "time"])
+
+# Messages a Subscription keeps by default, as many as the DLL queues.
+QUEUE_SIZE = 1024
+
+
+@CFUNCTYPE(None)
+def _no_callback():
+    "Registered in place of a released callback, lives as long as the module."
+
+
+class Subscription:
+    """Queue of the messages of a device (or channel) for one reader, filled
+    by the device's message callback.
+
+    The DLL's thread only appends to the queue, sets an event and calls
+    ``on_message``, if set, which should return quickly; reading happens in
+    the reader's thread. Once ``maxlen`` messages are queued, each new one
+    drops the oldest, like the DLL's own queue, and counts in ``dropped``;
+    with a ``maxlen`` of None the queue grows as long as nobody reads it.
+    """
+
+    def __init__(self, route: "_Route",
+                 messages: Optional[FrozenSet[Tuple[int, int]]],
+                 maxlen: Optional[int]):
+        self.route = route
+        self.key = route.key
+        self.messages = messages
+        self.on_message = None  # type: Optional[Callable[[], None]]
+        self.dropped = 0
+        self._queue = deque(maxlen=maxlen)
+        self._ready = threading.Event()
+
+    def _put(self, batch: List[Message]):
+        # DLL thread.
+        if self.messages is not None:
+            batch = [message for message in batch
+                     if message[:2] in self.messages]
+            if not batch:
+                return
+        queue = self._queue
+        if queue.maxlen is not None:
+            # Can be off by the messages read meanwhile.
+            self.dropped += max(len(queue) + len(batch) - queue.maxlen, 0)
+        queue.extend(batch)
+        self._ready.set()
+        on_message = self.on_message
+        if on_message is not None:
+            on_message()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def poll(self) -> Optional[Message]:
+        "The next message, or None if the queue is empty."
+        try:
+            return self._queue.popleft()
+        except IndexError:
+            return None
+
+    def get(self, timeout: float=None) -> Message:
+        """The next message, waiting for one if the queue is empty. Raises
+        TimeoutError if none arrives within ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._queue.popleft()
+            except IndexError:
+                pass
+            self._ready.clear()
+            if self._queue:
+                continue
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+            if (remaining is not None and remaining <= 0) or \
+                    not self._ready.wait(remaining):
+                raise TimeoutError(f"No message for {self.key} within "
+                                   f"{timeout} s.")
+
+    def drain(self) -> List[Message]:
+        "All the queued messages, without waiting."
+        messages = []
+        popleft = self._queue.popleft
+        try:
+            while True:
+                messages.append(popleft())
+        except IndexError:
+            return messages
+
+    def __iter__(self) -> Iterator[Message]:
+        while True:
+            yield self.get()
+
+    def close(self):
+        """Stops the delivery. The callback of the device is released with
+        its last subscription.
+        """
+        _unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<Subscription to {self.key}, {len(self)} queued>"
+
+
+class _Route:
+    "The message callback of a device (or channel) and its subscriptions."
+
+    def __init__(self, key: tuple, function: Callable, args: tuple):
+        self.key = key
+        self.message_type = c_word()
+        self.message_id = c_word()
+        self.data = c_dword()
+        self._next_message = partial(function("GetNextMessage"), *args,
+                                     byref(self.message_type),
+                                     byref(self.message_id),
+                                     byref(self.data))
+        self._register = partial(function("RegisterMessageCallback"), *args)
+        # Replaced as a whole on (un)subscribing, read as is by the callback.
+        self.subscriptions = ()  # type: Tuple[Subscription, ...]
+        self.received = 0
+        # Only taken to read the queue, in case the DLL calls the callback
+        # from several threads; the out-parameters are shared.
+        self._lock = threading.Lock()
+        self.callback = CFUNCTYPE(None)(self.collect)
+
+    def register(self):
+        self._register(self.callback)
+
+    def release(self):
+        # The DLL may still call the callback until it is replaced.
+        self._register(_no_callback)
+
+    def collect(self):
+        """Takes the messages off the device's queue and hands them over.
+        Called by the DLL's thread on every message, and by the readers for
+        the messages queued before the callback was registered.
+        """
+        with self._lock:
+            now = time.time()
+            batch = []
+            while self._next_message():
+                batch.append(Message(self.message_type.value,
+                                     self.message_id.value, self.data.value,
+                                     now))
+        if not batch:
+            return
+        self.received += len(batch)
+        for subscription in self.subscriptions:
+            subscription._put(batch)
+
+
+_routes = {}  # type: Dict[tuple, _Route]
+_lock = threading.Lock()
+
+
+def _key(args: tuple) -> tuple:
+    return (args[0].value.decode(),) + tuple(arg.value for arg in args[1:])
+
+
+def subscribe(function: Callable, args: tuple,
+              messages: Iterable[Tuple[int, int]]=None,
+              maxlen: Optional[int]=QUEUE_SIZE) -> Optional[Subscription]:
+    """Subscribes to the messages of the device (or channel) given by the
+    function lookup of its family and the leading arguments of its
+    functions, registering its callback if it has none yet. None if the
+    family has no message callback. The subscription keeps the last
+    ``maxlen`` messages, or all with None.
+
+    The callback takes every message off the device's queue, so it must be
+    the only reader of that queue.
+    """
+    key = _key(args)
+    with _lock:
+        route = _routes.get(key)
+        if route is None:
+            if function("RegisterMessageCallback") is not_implemented:
+                return None
+            route = _Route(key, function, args)
+            route.register()
+            _routes[key] = route
+        subscription = Subscription(
+            route, None if messages is None else frozenset(messages), maxlen)
+        route.subscriptions += (subscription,)
+    return subscription
+
+
+def _unsubscribe(subscription: Subscription):
+    with _lock:
+        route = subscription.route
+        route.subscriptions = tuple(other for other in route.subscriptions
+                                    if other is not subscription)
+        if not route.subscriptions and _routes.get(route.key) is route:
+            route.release()
+            del _routes[route.key]
+
+
+def register_callbacks(serial: str):
+    """Registers the callbacks of the device again, after it was opened
+    again: closing a device drops its callbacks in the DLL.
+    """
+    with _lock:
+        for key, route in _routes.items():
+            if key[0] == serial:
+                route.register()
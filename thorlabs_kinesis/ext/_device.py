@@ -1,5 +1,6 @@
 "Device related objects."
 from collections import namedtuple
+from typing import Dict
 
 __all__ = [
     "serial_prefix"
@@ -14,14 +15,14 @@ MotorEncoderSettings = namedtuple("MotorEncoderSettings",
 serial_prefix = {
     73: Device(None, "Benchtop Brushless Motor", ""),
     22: Device(None, "Benchtop NanoTrak", ""),
-    41: Device(None, "Benchtop Piezo (1 channel)", ""),
-    71: Device(None, "Benchtop Piezo (3 channel)", ""),
+    41: Device("benchtop_piezo", "Benchtop Piezo (1 channel)", "PBC"),
+    71: Device("benchtop_piezo", "Benchtop Piezo (3 channel)", "PBC"),
     40: Device("benchtop_stepper_motor", "Benchtop Stepper Motor (1 channel)", "SBC"),  # noqa: E501
     70: Device("benchtop_stepper_motor", "Benchtop Stepper Motor (3 channel)", "SBC"),  # noqa: E501
     37: Device(None, "Filter Flipper", ""),
     47: Device(None, "Filter Wheel", ""),
     28: Device(None, "KCube Brushless Motor", ""),
-    27: Device(None, "KCube DC Servo", ""),
+    27: Device("kcube_dcservo", "KCube DC Servo", "CC"),
     97: Device(None, "KCube Inertial Motor", ""),
     56: Device(None, "KCube LaserSource", ""),
     57: Device(None, "KCube NanoTrak", ""),
@@ -53,6 +54,10 @@ motor_encoder_lib = {
     "HS DRV001 8mm": MotorEncoderSettings(546100, 29320310, 6008),
 }
 
+# Scales of the motor types found in the stage database, by name as given.
+# Cleared when stages are loaded.
+_stage_settings = {}  # type: Dict[str, MotorEncoderSettings]
+
 
 def expand_device(serial_no: str) -> Device:
     """Expand name and module related to device by checking first two numbers
@@ -61,6 +66,29 @@ def expand_device(serial_no: str) -> Device:
     return serial_prefix[int(serial_no[:2])]
 
 
+def encoder_settings(motor_type: str) -> MotorEncoderSettings:
+    """Scales of a motor type, from the stage database or else
+    ``motor_encoder_lib``, so that the stage files loaded with
+    ``load_stages`` take precedence. Raises a ValueError for unknown types.
+    """
+    settings = _stage_settings.get(motor_type, None)
+    if settings is not None:
+        return settings
+    # Imported here, the stage database needs the device handles, which need
+    # this module.
+    from thorlabs_kinesis.ext._stages import stages
+    info = stages.get(motor_type)
+    if info is None:
+        settings = motor_encoder_lib.get(motor_type, None)
+        if settings is None:
+            raise ValueError("Can't find given motor encoder.")
+        return settings
+    settings = MotorEncoderSettings(info.position, info.velocity,
+                                    info.acceleration)
+    _stage_settings[motor_type] = settings
+    return settings
+
+
 def device_to_real_units(motor_type: str,
                          dev: int, dimension: str="position") -> float:
     """Converts given device units [steps] to real units [mm]. Dimension can be
@@ -78,6 +106,9 @@ def device_to_real_units(motor_type: str,
     >>> device_to_real_units("HS DRV001 8mm", 1.0, "acceleration")
     0.00016644474034620507
 
+    >>> device_to_real_units("LTS150", 409600)
+    1.0
+
     >>> device_to_real_units("HS DRV001 8mm", 1.0, "Acceleration")
     Traceback (most recent call last):
         ...
@@ -93,10 +124,7 @@ def device_to_real_units(motor_type: str,
         ...
     ValueError: Can't find given motor encoder.
     """
-    motor_enc = motor_encoder_lib.get(motor_type, None)
-
-    if motor_enc is None:
-        raise ValueError("Can't find given motor encoder.")
+    motor_enc = encoder_settings(motor_type)
 
     scale = getattr(motor_enc, dimension, None)
 
@@ -139,10 +167,7 @@ def real_to_device_units(motor_type: str,
     ValueError: Can't find given motor encoder.
     """
 
-    motor_enc = motor_encoder_lib.get(motor_type, None)
-
-    if motor_enc is None:
-        raise ValueError("Can't find given motor encoder.")
+    motor_enc = encoder_settings(motor_type)
 
     scale = getattr(motor_enc, dimension, None)
 
@@ -0,0 +1,94 @@
+"Reader for the device list of the binding modules."
+import importlib
+import threading
+from ctypes import (
+    c_char,
+    c_int,
+)
+from types import ModuleType
+from typing import (
+    Iterable,
+    Tuple,
+    Union,
+)
+
+__all__ = [
+    "DeviceListReader",
+]
+
+# Serial numbers are 8 digits, each followed by a comma.
+ENTRY_SIZE = 9
+COMMA = ord(",")
+
+
+class DeviceListReader:
+    """Reads the serial numbers from ``TLI_GetDeviceListExt`` and friends.
+
+    The buffer is sized from ``TLI_GetDeviceListSize``, so the list is never
+    truncated, and kept between calls; it only grows when more devices show
+    up. Serial numbers are decoded straight from the buffer, without copying
+    it to an intermediate bytes object first.
+
+    The list isn't built here; call ``TLI_BuildDeviceList`` first.
+
+    >>> bsm.TLI_BuildDeviceList()  # doctest: +SKIP
+    0
+    >>> reader = DeviceListReader(bsm)  # doctest: +SKIP
+    >>> reader.read()  # doctest: +SKIP
+    ('40000001', '45000001', '45000002')
+    >>> reader.read([45])  # doctest: +SKIP
+    ('45000001', '45000002')
+    """
+
+    def __init__(self, module: Union[str, ModuleType]="benchtop_stepper_motor",
+                 size: int=0):
+        if isinstance(module, str):
+            module = importlib.import_module("thorlabs_kinesis." + module)
+        self.module = module
+        self._lock = threading.Lock()
+        self._allocate(size)
+
+    @property
+    def size(self) -> int:
+        "Size of the buffer in bytes."
+        return len(self._data)
+
+    def _allocate(self, size: int):
+        self._data = bytearray(size)
+        self._buffer = (c_char * size).from_buffer(self._data)
+        self._view = memoryview(self._data)
+
+    def read(self, type_ids: Iterable[int]=None) -> Tuple[str, ...]:
+        """Serial numbers of the listed devices, optionally only the ones
+        with the given type IDs.
+        """
+        with self._lock:
+            size = self.module.TLI_GetDeviceListSize() * ENTRY_SIZE + 1
+            if size > len(self._data):
+                self._allocate(size)
+            else:
+                self._data[0] = 0
+            size = len(self._data)
+
+            if type_ids is None:
+                err = self.module.TLI_GetDeviceListExt(self._buffer, size)
+            else:
+                type_ids = list(type_ids)
+                ids = (c_int * len(type_ids))(*type_ids)
+                err = self.module.TLI_GetDeviceListByTypesExt(
+                    self._buffer, size, ids, len(ids))
+            if err != 0:
+                raise OSError(f"Can't read device list, error {err}.")
+            return self._parse()
+
+    def _parse(self) -> Tuple[str, ...]:
+        # Decoding the whole list at once from the buffer and splitting it
+        # is much faster than slicing each serial number out in Python.
+        length = self._data.find(0)
+        if length < 0:
+            length = len(self._data)
+        if length and self._data[length - 1] == COMMA:
+            length -= 1
+        if not length:
+            return ()
+        return tuple(str(self._view[:length], "ascii").split(","))
@@ -0,0 +1,105 @@
+"Discovery of the devices of every binding module at once."
+import importlib
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from thorlabs_kinesis.ext._device import (
+    Device,
+    serial_prefix,
+)
+from thorlabs_kinesis.ext._device_list import DeviceListReader
+
+__all__ = [
+    "Discovery",
+    "discover",
+    "module_types",
+]
+
+Discovery = namedtuple("Discovery", ["devices", "timings", "errors",
+                                     "elapsed"])
+
+
+def module_types() -> Dict[str, List[int]]:
+    "Type IDs handled by each binding module, according to serial_prefix."
+    types = {}
+    for type_id, device in serial_prefix.items():
+        if device.module is not None:
+            types.setdefault(device.module, []).append(type_id)
+    return types
+
+
+_readers = {}  # type: Dict[str, DeviceListReader]
+
+
+def _enumerate(name: str, type_ids: List[int]) -> Tuple[str, ...]:
+    module = importlib.import_module("thorlabs_kinesis." + name)
+    err = module.TLI_BuildDeviceList()
+    if err != 0:
+        raise OSError(f"Can't build device list, error {err}.")
+
+    reader = _readers.get(name)
+    if reader is None:
+        reader = _readers.setdefault(name, DeviceListReader(module))
+    return reader.read(type_ids)
+
+
+def _timed(name: str, type_ids: List[int]):
+    start = time.perf_counter()
+    try:
+        serials, error = _enumerate(name, type_ids), None
+    except (OSError, ImportError) as e:
+        serials, error = (), e
+    except AttributeError as e:
+        # Functions of a library that can't be loaded raise AttributeErrors.
+        if not isinstance(e.__cause__, OSError):
+            raise
+        serials, error = (), e.__cause__
+    return serials, time.perf_counter() - start, error
+
+
+def discover(modules: Iterable[str]=None,
+             max_workers: int=None) -> Discovery:
+    """Enumerates the devices of every binding module concurrently.
+
+    Each module asks its own DLL for the types it handles, in a thread pool.
+    ctypes releases the GIL during the calls, so the whole discovery takes
+    about as long as the slowest DLL. A module whose DLL can't be loaded or
+    fails to enumerate is reported in ``errors`` instead of raising.
+
+    Returns a ``Discovery`` with ``devices``, a dict of ``Device`` keyed by
+    serial number, ``timings``, the seconds spent by each module,
+    ``errors``, the exception raised by each failed module, and ``elapsed``,
+    the total time in seconds.
+
+    >>> found = discover()  # doctest: +SKIP
+    >>> found.devices["45000001"]  # doctest: +SKIP
+    Device(module='integrated_stepper_motors', type='Long Travel Stage', prefix='ISC')
+    """
+    types = module_types()
+    if modules is not None:
+        types = {name: types.get(name, []) for name in modules}
+    types = {name: type_ids for name, type_ids in types.items() if type_ids}
+
+    start = time.perf_counter()
+    devices = {}  # type: Dict[str, Device]
+    timings = {}  # type: Dict[str, float]
+    errors = {}  # type: Dict[str, Exception]
+    if types:
+        with ThreadPoolExecutor(max_workers=max_workers or len(types),
+                                thread_name_prefix="discover") as pool:
+            futures = {name: pool.submit(_timed, name, type_ids)
+                       for name, type_ids in types.items()}
+        for name, future in futures.items():
+            serials, timings[name], error = future.result()
+            if error is not None:
+                errors[name] = error
+            for serial in serials:
+                devices.setdefault(serial, serial_prefix[int(serial[:2])])
+    return Discovery(devices, timings, errors, time.perf_counter() - start)
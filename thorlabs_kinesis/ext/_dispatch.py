@@ -0,0 +1,96 @@
+"Push delivery of the messages of the devices to any number of subscribers."
+import threading
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from thorlabs_kinesis.ext._callbacks import (
+    QUEUE_SIZE,
+    Message,
+    Subscription,
+    subscribe,
+)
+from thorlabs_kinesis.ext._handle import DeviceHandle
+from thorlabs_kinesis.ext._messages import device_args
+from thorlabs_kinesis.ext._motor import Channel
+
+__all__ = [
+    "Message",
+    "MessageDispatcher",
+    "Subscription",
+]
+
+
+class MessageDispatcher:
+    """Hands the messages of devices (or channels) to Subscriptions, so that
+    many consumers can follow a device without polling its queue.
+
+    Every device (or channel) has a single message callback, shared by all
+    dispatchers, ``Channel.wait_for_move`` and the asyncio handles, which
+    takes every message off its queue: nothing else should read the queues
+    subscribed to. The callback stays registered while the device has
+    subscriptions; once the last one is closed, a no-op callback replaces it
+    and the messages stay in the queue again.
+
+    >>> dispatcher = MessageDispatcher()
+    >>> moved = [(2, 1)]
+    >>> moves = dispatcher.subscribe(stage, messages=moved)  # doctest: +SKIP
+    >>> stage.move_to(100000)  # doctest: +SKIP
+    >>> moves.get(timeout=10)  # doctest: +SKIP
+    Message(type=2, id=1, data=100000, time=1700000000.0)
+    """
+
+    def __init__(self):
+        self._subscriptions = []  # type: List[Subscription]
+        self._lock = threading.Lock()
+
+    def subscribe(self, device: Union[Channel, DeviceHandle],
+                  channel: int=None,
+                  messages: Iterable[Tuple[int, int]]=None,
+                  maxlen: Optional[int]=QUEUE_SIZE) -> Subscription:
+        """Subscribes to the messages of a motor Channel or Motor, or of a
+        DeviceHandle and, for the families with channels, a channel number.
+
+        ``messages`` limits the subscription to the given message type and
+        ID pairs. Messages arrive from the first wakeup of the callback
+        after subscribing. A subscription that isn't read keeps the last
+        ``maxlen`` messages, dropping older ones; None keeps them all.
+        """
+        device, function, args = device_args(device, channel)
+        subscription = subscribe(function, args, messages, maxlen)
+        if subscription is None:
+            raise TypeError(f"{device} has no message callback.")
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscription.close()
+        with self._lock:
+            self._subscriptions = [other for other in self._subscriptions
+                                   if other is not subscription]
+
+    def received(self) -> Dict[tuple, int]:
+        "Number of messages taken off the queue of every device (or channel)."
+        with self._lock:
+            routes = [subscription.route
+                      for subscription in self._subscriptions]
+        return {route.key: route.received for route in routes}
+
+    def close(self):
+        "Closes all the subscriptions."
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for subscription in subscriptions:
+            subscription.close()
+
+    def __enter__(self) -> "MessageDispatcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,165 @@
+"Moving several motor channels together."
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    as_channel,
+)
+from thorlabs_kinesis.ext._wait import (
+    MOVED,
+    STOPPED,
+    MessageWaiter,
+)
+
+__all__ = [
+    "ChannelGroup",
+    "GroupMove",
+]
+
+# ``started`` and ``finished`` are seconds since the first move command, per
+# channel; ``skew`` is the start of the last channel, ``elapsed`` the finish
+# of the last one.
+GroupMove = namedtuple("GroupMove", ["targets",
+                                     "started",
+                                     "finished",
+                                     "completed",
+                                     "skew",
+                                     "elapsed"])
+
+
+class ChannelGroup:
+    """Motor channels moved together, like the three channels of a benchtop
+    stepper controller, or channels of different controllers.
+
+    ``move_to`` first sets the target of every channel with
+    SetMoveAbsolutePosition, then fires the MoveAbsolute calls back to back,
+    so the channels start within microseconds of each other, and the move
+    takes as long as the slowest channel. The Moved messages of all channels
+    are then awaited together.
+
+    Moves use the message waiters of the channels, so nothing else should
+    read their message queues meanwhile. Channels can also be given as
+    Motors, for their first channel.
+
+    >>> motor = Motor("70000001")  # doctest: +SKIP
+    >>> xyz = ChannelGroup([motor[1], motor[2], motor[3]])  # doctest: +SKIP
+    >>> move = xyz.move_to([100000, 20000, 5000])  # doctest: +SKIP
+    >>> move.elapsed, move.skew  # doctest: +SKIP
+    (1.52, 2.1e-05)
+    """
+
+    def __init__(self, channels: Iterable[Channel]):
+        self.channels = tuple(as_channel(channel) for channel in channels)
+        if not self.channels:
+            raise ValueError("A channel group needs channels.")
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def _waiters(self) -> List[MessageWaiter]:
+        waiters = [channel.waiter for channel in self.channels]
+        for waiter in waiters:
+            if not waiter.has_callback:
+                raise TypeError(f"{waiter.channel} has no message callback.")
+        return waiters
+
+    def stage(self, targets: Sequence[int]):
+        "Sets the targets of the next ``fire``, one per channel."
+        if len(targets) != len(self.channels):
+            raise ValueError(f"{len(targets)} targets for "
+                             f"{len(self.channels)} channels.")
+        for channel, target in zip(self.channels, targets):
+            channel.set_move_absolute_position(int(target))
+
+    def fire(self) -> List[float]:
+        """Starts the moves to the staged targets. Returns the start of every
+        channel, in seconds after the first one.
+        """
+        return self._fire()[1]
+
+    def _fire(self) -> Tuple[float, List[float]]:
+        clock = time.perf_counter
+        moves = [channel.move_absolute for channel in self.channels]
+        started = []
+        first = clock()
+        for move in moves:
+            started.append(clock() - first)
+            move()
+        return first, started
+
+    def move_to(self, targets: Sequence[int],
+                timeout: float=None) -> GroupMove:
+        """Moves every channel to its target and returns once all arrived,
+        or were stopped. Raises TimeoutError after ``timeout`` seconds.
+        """
+        waiters = self._waiters()
+        self.stage(targets)
+        # Messages of earlier moves don't belong to this one.
+        for waiter in waiters:
+            waiter.clear()
+
+        with self._listening(waiters) as wakeup:
+            first, started = self._fire()
+            finished, completed = self._wait(waiters, first, timeout, wakeup)
+
+        return GroupMove(tuple(int(target) for target in targets),
+                         tuple(started), tuple(finished), tuple(completed),
+                         started[-1], max(finished))
+
+    @staticmethod
+    @contextmanager
+    def _listening(waiters: List[MessageWaiter]) -> Iterator[threading.Event]:
+        "Points the waiters at one event, set on a message of any of them."
+        wakeup = threading.Event()
+        previous = [waiter.on_message for waiter in waiters]
+        for waiter in waiters:
+            waiter.on_message = wakeup.set
+        try:
+            yield wakeup
+        finally:
+            for waiter, on_message in zip(waiters, previous):
+                waiter.on_message = on_message
+
+    @staticmethod
+    def _wait(waiters: List[MessageWaiter], first: float,
+              timeout: Optional[float], wakeup: threading.Event
+              ) -> Tuple[List[float], List[bool]]:
+        finished = [0.0] * len(waiters)
+        completed = [False] * len(waiters)
+        pending = set(range(len(waiters)))
+        deadline = None if timeout is None else first + timeout
+        while True:
+            wakeup.clear()
+            for index in list(pending):
+                while True:
+                    message = waiters[index].next_message()
+                    if message is None:
+                        break
+                    pair = message[:2]
+                    if pair == MOVED or pair == STOPPED:
+                        finished[index] = time.perf_counter() - first
+                        completed[index] = pair == MOVED
+                        pending.discard(index)
+                        break
+            if not pending:
+                return finished, completed
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.perf_counter()
+            if (remaining is not None and remaining <= 0) or \
+                    not wakeup.wait(remaining):
+                channels = ", ".join(str(waiters[index].channel)
+                                     for index in sorted(pending))
+                raise TimeoutError(f"{channels} didn't finish within "
+                                   f"{timeout} s.")
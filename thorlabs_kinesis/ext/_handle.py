@@ -0,0 +1,106 @@
+"Uniform handle to a device of any family with bindings."
+import importlib
+from functools import partial
+from typing import Callable
+
+from thorlabs_kinesis.ext._callbacks import register_callbacks
+from thorlabs_kinesis.ext._device import (
+    Device,
+    expand_device,
+)
+
+__all__ = [
+    "DeviceHandle",
+    "open_device",
+]
+
+
+class DeviceHandle:
+    """Handle to a device, whatever its family.
+
+    The binding module is found from the first two digits of the serial
+    number and only imported when a handle to one of its devices is created,
+    so only the DLLs of the connected hardware get loaded. The functions of
+    the module are available as attributes, without their family prefix and
+    with the serial number already filled in.
+
+    >>> stage = DeviceHandle("45000001")  # doctest: +SKIP
+    >>> stage.open()  # doctest: +SKIP
+    >>> stage.GetPosition()  # doctest: +SKIP
+    0
+    >>> stage.module.__name__  # doctest: +SKIP
+    'thorlabs_kinesis.integrated_stepper_motors'
+    """
+
+    def __init__(self, serial_no: str):
+        self.serial_no = str(serial_no)
+        try:
+            self.device = expand_device(self.serial_no)  # type: Device
+        except (KeyError, ValueError):
+            raise ValueError(f"Unknown device {self.serial_no!r}.") from None
+        if self.device.module is None:
+            raise ValueError(f"No bindings for {self.device.type} devices.")
+
+        self.module = importlib.import_module("thorlabs_kinesis." +
+                                              self.device.module)
+        self.prefix = self.device.prefix
+        self.opened = False
+        self._serial = self.serial_no.encode()
+
+    def function(self, name: str) -> Callable:
+        "The module function, e.g. ``ISC_GetPosition`` for 'GetPosition'."
+        try:
+            return getattr(self.module, f"{self.prefix}_{name}")
+        except AttributeError as err:
+            if isinstance(err.__cause__, OSError):
+                # The library can't be loaded.
+                raise err.__cause__ from None
+            raise AttributeError(f"{self.module.__name__} has no function "
+                                 f"{self.prefix}_{name}.") from None
+
+    def __getattr__(self, name: str) -> Callable:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        func = partial(self.function(name), self._serial)
+        # Cached, next lookups don't go through __getattr__ anymore.
+        setattr(self, name, func)
+        return func
+
+    def open(self):
+        err = self.Open()
+        if err != 0:
+            raise OSError(f"Can't open {self.serial_no}, error {err}.")
+        self.opened = True
+        # Closing dropped the message callbacks, if it was open before.
+        register_callbacks(self.serial_no)
+
+    def close(self):
+        if self.opened:
+            self.Close()
+            self.opened = False
+
+    def __enter__(self) -> "DeviceHandle":
+        if not self.opened:
+            self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"<{type(self).__name__} {self.serial_no} "
+                f"{self.device.type}{'' if self.opened else ' (closed)'}>")
+
+
+def open_device(serial_no: str) -> DeviceHandle:
+    """Opens the device with the given serial number with the binding module
+    of its family. Raises ValueError for devices without bindings and OSError
+    if the device can't be opened.
+
+    >>> with open_device("27000001") as kcube:  # doctest: +SKIP
+    ...     kcube.StartPolling(200)
+    True
+    """
+    handle = DeviceHandle(serial_no)
+    handle.open()
+    return handle
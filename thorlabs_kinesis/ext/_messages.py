@@ -0,0 +1,196 @@
+"Reading the message queues of the devices in bulk."
+import time
+from ctypes import (
+    byref,
+    c_char_p,
+    c_short,
+    sizeof,
+)
+from functools import partial
+from typing import (
+    Callable,
+    List,
+    Tuple,
+    Union,
+)
+
+from thorlabs_kinesis._utils import (
+    c_dword,
+    c_word,
+)
+from thorlabs_kinesis.ext._handle import DeviceHandle
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    Motor,
+)
+
+__all__ = [
+    "MESSAGE_FIELDS",
+    "MessageDrain",
+    "message_name",
+    "message_names",
+]
+
+MESSAGE_FIELDS = [
+    ("type", "u2"),
+    ("id", "u2"),
+    ("data", "u4"),
+    ("time", "f8"),
+]
+
+message_types = {
+    0: "GenericDevice",
+    1: "GenericPiezo",
+    2: "GenericMotor",
+    3: "GenericDCMotor",
+    4: "GenericSimpleMotor",
+    5: "RackDevice",
+    6: "Laser",
+    7: "TECCtlr",
+    8: "Quad",
+    9: "NanoTrak",
+    10: "Specialized",
+    11: "Solenoid",
+}
+
+message_ids = {
+    (0, 0): "SettingsInitialized",
+    (0, 1): "SettingsUpdated",
+    (0, 2): "Error",
+    (0, 3): "Close",
+    (1, 0): "MaxVoltageChanged",
+    (1, 1): "ControlModeChanged",
+    (1, 2): "StatusChanged",
+    (1, 3): "MaxTravelChanged",
+    (1, 4): "TSG_Status",
+    (1, 5): "TSG_DisplayModeChanged",
+    (2, 0): "Homed",
+    (2, 1): "Moved",
+    (2, 2): "Stopped",
+    (2, 3): "LimitUpdated",
+    (3, 0): "Error",
+    (3, 1): "Status",
+    (5, 0): "RackCountEstablished",
+    (5, 1): "RackBayState",
+}
+
+
+def message_name(message_type: int, message_id: int) -> str:
+    """Name of a message, as type and ID names joined by a dot.
+
+    >>> message_name(2, 1)
+    'GenericMotor.Moved'
+    >>> message_name(2, 9)
+    'GenericMotor.9'
+    """
+    type_name = message_types.get(message_type, str(message_type))
+    id_name = message_ids.get((message_type, message_id), str(message_id))
+    return f"{type_name}.{id_name}"
+
+
+def message_names(messages) -> List[str]:
+    """Names of the messages of an array returned by MessageDrain, each
+    distinct message looked up once.
+    """
+    keys = (messages["type"].astype("u4") << 16) | messages["id"]
+    names = {}
+    for key in set(keys.tolist()):
+        names[key] = message_name(key >> 16, key & 0xFFFF)
+    return [names[key] for key in keys.tolist()]
+
+
+def device_args(device: Union[Channel, DeviceHandle], channel: int=None
+                ) -> Tuple[Union[Channel, DeviceHandle], Callable, tuple]:
+    """The channel (or device), the function lookup and the leading
+    arguments of the per-device functions, for a Motor or Channel, or a
+    DeviceHandle and a channel number.
+    """
+    if isinstance(device, Motor):
+        device = device.channel(1)
+    if isinstance(device, Channel):
+        return device, device.motor.function, device._args
+    args = (c_char_p(device._serial),)
+    if channel is not None:
+        args += (c_short(channel),)
+    return device, device.function, args
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("MessageDrain needs NumPy.") from None
+    return np
+
+
+class MessageDrain:
+    """Takes all pending messages of a device (or channel) off its queue at
+    once.
+
+    The out-parameters of GetNextMessage are slots of preallocated arrays,
+    and a call with its arguments bound is prepared for every slot, so each
+    message only costs the DLL call. The arrays grow when the queue holds
+    more messages than ever before.
+
+    Takes a motor Channel or Motor, or a DeviceHandle and, for the families
+    with channels (SBC, PBC), a channel number.
+
+    >>> piezo = DeviceHandle("71000001")  # doctest: +SKIP
+    >>> messages = MessageDrain(piezo, channel=1)()  # doctest: +SKIP
+    >>> message_names(messages)  # doctest: +SKIP
+    ['GenericDevice.SettingsInitialized', 'GenericPiezo.StatusChanged']
+    """
+
+    def __init__(self, device: Union[Channel, DeviceHandle],
+                 channel: int=None, capacity: int=64):
+        np = _numpy()
+        self.device, function, args = device_args(device, channel)
+        self._queue_size = partial(function("MessageQueueSize"), *args)
+        self._get_next = function("GetNextMessage")
+        self._args = args
+        self._np = np
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self._types = (c_word * capacity)()
+        self._ids = (c_word * capacity)()
+        self._data = (c_dword * capacity)()
+        as_array = self._np.ctypeslib.as_array
+        self._views = (as_array(self._types), as_array(self._ids),
+                       as_array(self._data))
+        word, dword = sizeof(c_word), sizeof(c_dword)
+        # Slots are passed as scalars sharing the memory of the arrays, to
+        # match the pointer types of GetNextMessage.
+        self._calls = [
+            partial(self._get_next, *self._args,
+                    byref(c_word.from_buffer(self._types, i * word)),
+                    byref(c_word.from_buffer(self._ids, i * word)),
+                    byref(c_dword.from_buffer(self._data, i * dword)))
+            for i in range(capacity)]
+
+    def pending(self) -> int:
+        return max(self._queue_size(), 0)
+
+    def __call__(self):
+        """All pending messages as a structured array of type, id, data and
+        time, the host time (time.time()) of the drain.
+        """
+        np = self._np
+        pending = self.pending()
+        if pending > self.capacity:
+            self._allocate(max(pending, 2 * self.capacity))
+
+        count = 0
+        for call in self._calls[:pending]:
+            if not call():
+                break
+            count += 1
+
+        types, ids, data = self._views
+        messages = np.empty(count, dtype=MESSAGE_FIELDS)
+        messages["type"] = types[:count]
+        messages["id"] = ids[:count]
+        messages["data"] = data[:count]
+        messages["time"] = time.time()
+        return messages
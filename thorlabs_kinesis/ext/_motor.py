@@ -0,0 +1,257 @@
+"Motor handles with the serial number and channel converted once."
+from ctypes import (
+    c_char_p,
+    c_short,
+)
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Optional,
+)
+
+from thorlabs_kinesis.ext._handle import DeviceHandle
+from thorlabs_kinesis.ext._wait import (
+    MessageWaiter,
+    wait_for_home,
+    wait_for_move,
+)
+
+if TYPE_CHECKING:
+    # Only for annotations, the unit converters need the stage database,
+    # which needs this module.
+    from thorlabs_kinesis.ext._units import ChannelUnits
+
+__all__ = [
+    "Channel",
+    "Motor",
+]
+
+# Families with motor functions, and whether their functions take a channel.
+MOTOR_FAMILIES = {
+    "SBC": True,
+    "ISC": False,
+    "CC": False,
+}
+
+# Methods of the first channel that are available on the motor itself.
+CHANNEL_METHODS = (
+    "get_position",
+    "get_status_bits",
+    "get_encoder_count",
+    "request_position",
+    "request_status_bits",
+    "move_to",
+    "move_by",
+    "set_move_absolute_position",
+    "move_absolute",
+    "home",
+    "stop",
+    "start_polling",
+    "stop_polling",
+    "polling_duration",
+    "set_motor_params",
+    "wait_for_move",
+    "wait_for_home",
+)
+
+
+class Channel:
+    """One motor channel of a controller. Single channel controllers (ISC,
+    CC) have one channel, whose functions don't take a channel number.
+
+    The serial number and channel are converted to ctypes once, and the hot
+    calls get the converted arguments bound up front, so a call only
+    converts what changes. Positions are in device units.
+
+    ``get_position()``, ``get_status_bits()`` and ``get_encoder_count()``
+    return the last position, status bits and encoder count reported by the
+    controller, as ints.
+    """
+
+    def __init__(self, motor: "Motor", number: Optional[int]):
+        self.motor = motor
+        self.number = number
+        self._waiter = None  # type: Optional[MessageWaiter]
+        self._units = None  # type: Optional[ChannelUnits]
+        if number is None:
+            self._args = (c_char_p(motor._serial),)
+        else:
+            self._args = (c_char_p(motor._serial), c_short(number))
+
+        function = motor.function
+        self._request_position = function("RequestPosition")
+        self._request_status_bits = function("RequestStatusBits")
+        self._move_to = function("MoveToPosition")
+        self._move_by = function("MoveRelative")
+        self._set_move_absolute_position = function("SetMoveAbsolutePosition")
+        self._move_absolute = function("MoveAbsolute")
+        self._home = function("Home")
+        self._stop_profiled = function("StopProfiled")
+        self._stop_immediate = function("StopImmediate")
+        self._start_polling = function("StartPolling")
+        self._stop_polling = function("StopPolling")
+        self._polling_duration = function("PollingDuration")
+        self._set_motor_params = function("SetMotorParamsExt")
+
+        # Partials instead of methods, they skip a Python frame per call.
+        self.get_position = partial(function("GetPosition"), *self._args)
+        self.get_status_bits = partial(function("GetStatusBits"),
+                                       *self._args)
+        try:
+            counter = function("GetEncoderCounter")
+        except AttributeError:
+            # Integrated stepper motors only have the position counter.
+            counter = function("GetPositionCounter")
+        self.get_encoder_count = partial(counter, *self._args)
+
+    def _check(self, err: int, action: str):
+        if err != 0:
+            raise OSError(f"Can't {action} {self}, error {err}.")
+
+    def request_position(self):
+        self._check(self._request_position(*self._args),
+                    "request position of")
+
+    def request_status_bits(self):
+        self._check(self._request_status_bits(*self._args),
+                    "request status of")
+
+    def move_to(self, position: int):
+        self._check(self._move_to(*self._args, position), "move")
+
+    def move_by(self, distance: int):
+        self._check(self._move_by(*self._args, distance), "move")
+
+    def set_move_absolute_position(self, position: int):
+        "Sets the target of the next ``move_absolute``, without moving."
+        self._check(self._set_move_absolute_position(*self._args, position),
+                    "set the target of")
+
+    def move_absolute(self):
+        "Moves to the target set with ``set_move_absolute_position``."
+        self._check(self._move_absolute(*self._args), "move")
+
+    def home(self):
+        self._check(self._home(*self._args), "home")
+
+    def stop(self, profiled: bool=True):
+        "Stops with the deceleration of the velocity profile, or immediately."
+        stop = self._stop_profiled if profiled else self._stop_immediate
+        self._check(stop(*self._args), "stop")
+
+    def start_polling(self, milliseconds: int):
+        "Starts polling, or changes the period if already polling."
+        if not self._start_polling(*self._args, milliseconds):
+            raise OSError(f"Can't start polling {self}.")
+
+    def stop_polling(self):
+        self._stop_polling(*self._args)
+
+    def polling_duration(self) -> int:
+        "Achieved polling period in milliseconds, 0 if not polling."
+        return self._polling_duration(*self._args)
+
+    @property
+    def waiter(self) -> MessageWaiter:
+        "Created on first use, subscribes to the message callback."
+        if self._waiter is None:
+            self._waiter = MessageWaiter(self)
+        return self._waiter
+
+    @property
+    def units(self) -> "ChannelUnits":
+        """Converts between real and device units like the DLL does, without
+        calling it after a first calibration.
+        """
+        if self._units is None:
+            # Imported here, the unit converters need the stage database,
+            # which needs this module.
+            from thorlabs_kinesis.ext._units import ChannelUnits
+            self._units = ChannelUnits(self)
+        return self._units
+
+    def set_motor_params(self, steps_per_rev: float, gearbox_ratio: float,
+                         pitch: float):
+        """Sets the motor parameters, which rescale the device units, with
+        SetMotorParamsExt.
+        """
+        self._check(self._set_motor_params(*self._args, steps_per_rev,
+                                           gearbox_ratio, pitch),
+                    "set motor params of")
+        if self._units is not None:
+            self._units.invalidate()
+
+    def wait_for_move(self, timeout: float=None) -> bool:
+        return wait_for_move(self, timeout)
+
+    def wait_for_home(self, timeout: float=None) -> bool:
+        return wait_for_home(self, timeout)
+
+    def __repr__(self) -> str:
+        if self.number is None:
+            return f"<{type(self).__name__} {self.motor.serial_no}>"
+        return (f"<{type(self).__name__} {self.motor.serial_no} "
+                f"channel {self.number}>")
+
+
+def as_channel(channel) -> Channel:
+    "The channel itself, or the first channel of a Motor."
+    if isinstance(channel, Motor):
+        return channel.channel(1)
+    return channel
+
+
+class Motor(DeviceHandle):
+    """Handle to a stepper or DC servo motor controller (SBC, ISC or CC
+    functions). The methods of the first channel are available on the motor
+    itself; other channels are ``motor.channel(number)`` or
+    ``motor[number]``.
+
+    >>> stage = Motor("45000001")  # doctest: +SKIP
+    >>> stage.open()  # doctest: +SKIP
+    >>> stage.move_to(100000)  # doctest: +SKIP
+    >>> stage.get_position()  # doctest: +SKIP
+    100000
+    """
+
+    def __init__(self, serial_no: str):
+        super().__init__(serial_no)
+        if self.prefix not in MOTOR_FAMILIES:
+            raise ValueError(f"{self.device.type} devices aren't motors.")
+        self.has_channels = MOTOR_FAMILIES[self.prefix]
+        self._channels = {}  # type: Dict[int, Channel]
+
+        channel = self.channel(1)
+        for name in CHANNEL_METHODS:
+            setattr(self, name, getattr(channel, name))
+
+    def channel(self, number: int=1) -> Channel:
+        channel = self._channels.get(number)
+        if channel is None:
+            if not self.has_channels and number != 1:
+                raise ValueError(f"{self.device.type} devices have only one "
+                                 f"channel.")
+            channel = Channel(self, number if self.has_channels else None)
+            self._channels[number] = channel
+        return channel
+
+    __getitem__ = channel
+
+    @property
+    def units(self) -> "ChannelUnits":
+        return self.channel(1).units
+
+    def open(self):
+        super().open()
+        # The device may have been replaced or reconfigured while closed.
+        for channel in self._channels.values():
+            if channel._units is not None:
+                channel._units.invalidate()
+
+    def close(self):
+        super().close()
+        for channel in self._channels.values():
+            if channel._waiter is not None:
+                channel._waiter.close()
+                channel._waiter = None
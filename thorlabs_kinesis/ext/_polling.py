@@ -0,0 +1,140 @@
+"Polling periods following the motion state of the channels."
+import math
+import threading
+import time
+from typing import (
+    Dict,
+    Iterable,
+    Optional,
+)
+
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    as_channel,
+)
+from thorlabs_kinesis.ext._status import (
+    HOMING,
+    MOVING,
+)
+
+__all__ = [
+    "PollingManager",
+]
+
+
+class PollingManager:
+    """Polls channels every ``active`` milliseconds while they move or home,
+    and every ``idle`` milliseconds otherwise. A channel stays active for
+    ``linger`` seconds after it stopped, to catch it settling.
+
+    ``budget`` caps the total number of polls per second over all channels,
+    like the capacity of a shared USB hub. Idle channels get their share
+    first; active channels split what is left. If even the idle channels
+    don't fit, or what is left would poll the active channels slower than
+    the idle ones, every channel is slowed down to the same period.
+
+    Motion is seen in the status bits, so it takes up to an idle period to
+    notice a move; call ``activate`` before commanding one to switch right
+    away. Channels can also be given as Motors, for their first channel.
+
+    >>> with PollingManager(stages, budget=200) as polling:  # doctest: +SKIP
+    ...     polling.activate(stages[0])
+    ...     stages[0].move_to(100000)
+    """
+
+    def __init__(self, channels: Iterable[Channel], active: int=20,
+                 idle: int=500, budget: float=None, linger: float=0.5,
+                 interval: float=0.05):
+        self.channels = list(channels)
+        self.active = active
+        self.idle = idle
+        self.budget = budget
+        self.linger = linger
+        self.interval = interval
+        self.periods = {}  # type: Dict[object, int]
+        self._active_until = {key: 0.0 for key in self.channels}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    @property
+    def load(self) -> float:
+        "Polls per second requested over all channels."
+        return sum(1000 / period for period in self.periods.values()
+                   if period)
+
+    def is_active(self, channel) -> bool:
+        return time.monotonic() < self._active_until[channel]
+
+    def activate(self, channel):
+        "Polls the channel fast from now on, until it has been idle a while."
+        with self._lock:
+            self._active_until[channel] = time.monotonic() + self.linger
+            self._apply()
+
+    def _plan(self, active: int, idle: int) -> Dict[bool, int]:
+        active_period, idle_period = self.active, self.idle
+        if self.budget:
+            shared = math.ceil((active + idle) * 1000 / self.budget)
+            idle_load = idle * 1000 / idle_period
+            if idle_load >= self.budget:
+                return {True: shared, False: shared}
+            if active and idle_load + active * 1000 / active_period > \
+                    self.budget:
+                active_period = math.ceil(active * 1000 /
+                                          (self.budget - idle_load))
+                if active_period > idle_period:
+                    return {True: shared, False: shared}
+        return {True: min(active_period, idle_period), False: idle_period}
+
+    def _apply(self):
+        now = time.monotonic()
+        states = {key: now < until
+                  for key, until in self._active_until.items()}
+        active = sum(states.values())
+        periods = self._plan(active, len(states) - active)
+        for key, state in states.items():
+            period = periods[state]
+            if self.periods.get(key) != period:
+                channel = as_channel(key)
+                channel.start_polling(period)
+                self.periods[key] = period
+
+    def update(self):
+        """Checks the status of every channel and changes the polling periods
+        that need it. Called every ``interval`` seconds once started.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for key in self.channels:
+                channel = as_channel(key)
+                if channel.get_status_bits() & (MOVING | HOMING):
+                    self._active_until[key] = now + self.linger
+            self._apply()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.update()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="PollingManager")
+        self._thread.start()
+
+    def stop(self):
+        "Stops adjusting; the channels keep their current polling periods."
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "PollingManager":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.update()
@@ -0,0 +1,261 @@
+"Predicting how long moves take from the velocity profile of a channel."
+import math
+import numbers
+from ctypes import (
+    byref,
+    c_int,
+)
+from typing import (
+    Optional,
+    Sequence,
+)
+
+from thorlabs_kinesis._types import (
+    MOT_VelocityParameters,
+    MOT_VelocityProfileModes,
+    MOT_VelocityProfileParameters,
+)
+from thorlabs_kinesis._utils import not_implemented
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    as_channel,
+)
+from thorlabs_kinesis.ext._units import UnitConverter
+
+__all__ = [
+    "MoveProfile",
+    "bow_jerk",
+    "plan_time",
+]
+
+# Device jerk units are scaled by 2^32 where velocities and accelerations
+# are scaled by 2^16, as in the APT protocol: a BBD stage has 92.2337 jerk
+# units per mm/s^3.
+JERK_FACTOR = 65536
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Estimating arrays of moves needs NumPy.") from None
+    return np
+
+
+def bow_jerk(bow_index: int, base: float) -> Optional[float]:
+    """Jerk of a stepper bow index, None for the trapezoidal index 0.
+
+    ``base`` is the jerk of bow index 1, and every index above doubles it,
+    as in the APT protocol. It isn't documented, so measure it: time a few
+    moves of the stage and fit it.
+    """
+    if not 0 <= bow_index <= 18:
+        raise ValueError(f"Bow indices are 0 to 18, not {bow_index}.")
+    if bow_index == 0:
+        return None
+    return base * 2 ** (bow_index - 1)
+
+
+class MoveProfile:
+    """Velocity profile of a channel, giving the time of moves from rest to
+    rest: trapezoidal with the given ``velocity`` and ``acceleration``, or an
+    S-curve limiting the rate of change of acceleration to ``jerk``.
+
+    Distances are in the units of the parameters. The profiles from
+    ``from_channel`` and ``from_params`` are in device position units, so
+    the differences of a plan can be given as they are. ``move_time`` takes
+    a scalar, which doesn't need NumPy, or an array of distances, estimated
+    in one pass; the sign of distances is ignored.
+
+    The trapezoidal times match the simulated devices. The S-curve times
+    are closed-form but unchecked against hardware, and the jerk of a
+    stepper's bow index needs a measured base (see ``bow_jerk``).
+
+    >>> profile = MoveProfile(velocity=2.0, acceleration=4.0)
+    >>> profile.move_time(1.0)
+    1.0
+    >>> profile.move_time([0.0, 0.25, 2.0])  # doctest: +SKIP
+    array([0. , 0.5, 1.5])
+    >>> MoveProfile.from_channel(motor[1]).move_time(546100)  # doctest: +SKIP
+    0.8
+    """
+
+    def __init__(self, velocity: float, acceleration: float,
+                 jerk: float=None):
+        if not velocity > 0 or not acceleration > 0:
+            raise ValueError("Moves need a positive velocity and "
+                             "acceleration.")
+        if jerk is not None and not jerk > 0:
+            raise ValueError("The jerk of an S-curve must be positive.")
+        self.velocity = float(velocity)
+        self.acceleration = float(acceleration)
+        self.jerk = None if jerk is None else float(jerk)
+
+    @classmethod
+    def from_params(cls, params: MOT_VelocityParameters,
+                    units: UnitConverter,
+                    profile: MOT_VelocityProfileParameters=None,
+                    bow_index: int=None,
+                    bow_base: float=None) -> "MoveProfile":
+        """The profile of velocity parameters in device units, converted to
+        device position units with the scales of ``units``. The jerk comes
+        from the S-curve ``profile`` of a brushless motor, or the
+        ``bow_index`` of a stepper, which needs the ``bow_base`` of
+        ``bow_jerk`` unless it is 0: a ValueError is raised without it.
+
+        Device jerk units have one more factor of the sample time than
+        acceleration units, which is the ratio of the acceleration and
+        velocity scales, and are scaled by 2^32 instead of 2^16.
+        """
+        position = units._get_scale("position")
+        velocity = units.to_real(params.maxVelocity, "velocity") * position
+        acceleration = (units.to_real(params.acceleration, "acceleration")
+                        * position)
+        jerk = None
+        if profile is not None:
+            if profile.mode == MOT_VelocityProfileModes.MOT_SCurve:
+                scale = units._get_scale("acceleration")
+                scale *= scale / units._get_scale("velocity") * JERK_FACTOR
+                jerk = profile.jerk / scale * position
+        elif bow_index:
+            if bow_base is None:
+                raise ValueError(f"Bow index {bow_index} needs the measured "
+                                 f"jerk of bow index 1, bow_base.")
+            jerk = bow_jerk(bow_index, bow_base)
+        return cls(velocity, acceleration, jerk)
+
+    @classmethod
+    def from_channel(cls, channel: Channel,
+                     bow_base: float=None) -> "MoveProfile":
+        """The current profile of a motor channel, from its GetVelParams and,
+        for steppers, GetBowIndex, in device position units. Steppers with
+        an S-curve need ``bow_base``, as for ``from_params``.
+        """
+        channel = as_channel(channel)
+        function = channel.motor.function
+        acceleration = c_int()
+        velocity = c_int()
+        err = function("GetVelParams")(*channel._args, byref(acceleration),
+                                       byref(velocity))
+        if err != 0:
+            raise OSError(f"Can't read the velocity parameters of {channel}, "
+                          f"error {err}.")
+        params = MOT_VelocityParameters(0, acceleration.value, velocity.value)
+
+        bow_index = None
+        try:
+            get_bow_index = function("GetBowIndex")
+        except AttributeError:
+            # DC servos have no S-curve.
+            get_bow_index = not_implemented
+        if get_bow_index is not not_implemented:
+            bow_index = get_bow_index(*channel._args)
+        return cls.from_params(params, channel.units, bow_index=bow_index,
+                               bow_base=bow_base)
+
+    @property
+    def ramp(self) -> float:
+        "Time to accelerate from rest to full velocity."
+        return self._ramp(self.velocity)
+
+    def _ramp(self, velocity: float) -> float:
+        jerk = self.jerk
+        if jerk is None:
+            return velocity / self.acceleration
+        if velocity * jerk >= self.acceleration ** 2:
+            return velocity / self.acceleration + self.acceleration / jerk
+        return 2 * math.sqrt(velocity / jerk)
+
+    def _peak(self, distance: float) -> float:
+        "Velocity reached by a move too short to cruise."
+        acceleration = self.acceleration
+        jerk = self.jerk
+        if jerk is None:
+            return math.sqrt(distance * acceleration)
+        if distance <= 2 * acceleration ** 3 / jerk ** 2:
+            # The acceleration never reaches its limit.
+            return (0.5 * distance * math.sqrt(jerk)) ** (2 / 3)
+        lag = acceleration / jerk
+        return 0.5 * acceleration * (math.sqrt(lag * lag
+                                               + 4 * distance / acceleration)
+                                     - lag)
+
+    def _move_time(self, distance: float) -> float:
+        if distance == 0:
+            return 0.0
+        # Accelerating and decelerating cover velocity * ramp together.
+        velocity = min(self.velocity, self._peak(distance))
+        return self._ramp(velocity) + distance / velocity
+
+    def move_time(self, distance):
+        """Seconds a move of ``distance`` takes, as a float or a float64
+        array of the shape of ``distance``.
+        """
+        if isinstance(distance, numbers.Real):
+            return self._move_time(abs(float(distance)))
+
+        np = _numpy()
+        distance = np.abs(np.asarray(distance, dtype=np.float64))
+        if not distance.ndim:
+            return self._move_time(float(distance))
+        acceleration = self.acceleration
+        jerk = self.jerk
+        if jerk is None:
+            peak = np.sqrt(distance * acceleration)
+        else:
+            lag = acceleration / jerk
+            peak = np.where(
+                distance <= 2 * acceleration ** 3 / jerk ** 2,
+                np.cbrt(0.5 * distance * math.sqrt(jerk)) ** 2,
+                0.5 * acceleration * (np.sqrt(lag * lag
+                                              + 4 * distance / acceleration)
+                                      - lag))
+        velocity = np.minimum(peak, self.velocity)
+        if jerk is None:
+            ramp = velocity / acceleration
+        else:
+            ramp = np.where(velocity * jerk >= acceleration ** 2,
+                            velocity / acceleration + acceleration / jerk,
+                            2 * np.sqrt(velocity / jerk))
+        moving = distance > 0
+        # Divides by one where nothing moves, the time is zeroed anyway.
+        time = ramp + distance / np.where(moving, velocity, 1.0)
+        return np.where(moving, time, 0.0)
+
+    def __repr__(self) -> str:
+        shape = "trapezoid" if self.jerk is None else f"jerk {self.jerk:g}"
+        return (f"<MoveProfile velocity {self.velocity:g}, acceleration "
+                f"{self.acceleration:g}, {shape}>")
+
+
+def plan_time(profiles: Sequence[MoveProfile], plan, start=None):
+    """Seconds each point of a plan takes to reach, for channels moving at
+    the same time: the longest move of any channel.
+
+    The plan has a row per point and a column per profile (or is a vector
+    for one), in the units of the profiles, like the plan of a Scan. The
+    first point is reached from ``start``, a position per profile, by
+    default the first point itself. The sum is a forecast of the time a scan
+    spends moving.
+    """
+    np = _numpy()
+    plan = np.asarray(plan, dtype=np.float64)
+    if plan.ndim == 1:
+        plan = plan[:, np.newaxis]
+    if plan.ndim != 2 or plan.shape[1] != len(profiles):
+        raise ValueError(f"A plan for {len(profiles)} channels needs "
+                         f"{len(profiles)} columns, not shape {plan.shape}.")
+    if start is None:
+        origin = plan[:1]
+    else:
+        origin = np.asarray(start, dtype=np.float64)
+        if origin.size != len(profiles) or origin.ndim > 1:
+            raise ValueError(f"A start for {len(profiles)} channels needs "
+                             f"{len(profiles)} positions, not shape "
+                             f"{origin.shape}.")
+        origin = origin.reshape(1, len(profiles))
+    distances = np.diff(plan, axis=0, prepend=origin)
+    times = np.zeros(len(plan))
+    for column, profile in enumerate(profiles):
+        np.maximum(times, profile.move_time(distances[:, column]), out=times)
+    return times
@@ -0,0 +1,147 @@
+"Cached registry of the connected devices."
+import importlib
+import threading
+import time
+from ctypes import byref
+from types import ModuleType
+from typing import (
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from thorlabs_kinesis._types import TLI_DeviceInfo
+from thorlabs_kinesis.ext._device import serial_prefix
+from thorlabs_kinesis.ext._device_list import DeviceListReader
+
+__all__ = [
+    "DeviceRegistry",
+]
+
+
+class DeviceRegistry:
+    """Cache of the serial numbers and ``TLI_DeviceInfo`` of the connected
+    devices, indexed by type ID (the first two digits of the serial number)
+    and by binding module.
+
+    Scanning the USB bus with ``TLI_BuildDeviceList`` is slow, so it is only
+    done once ``ttl`` seconds have passed since the last scan. In between,
+    each lookup only checks ``TLI_GetDeviceListSize`` and reads the list
+    again if someone else rebuilt it. Device info is only requested for
+    serial numbers that were not seen before; devices whose info can't be
+    read are left out until the list is read again.
+
+    Every Kinesis DLL lists all devices, so any binding module can be used
+    for the enumeration.
+
+    >>> registry = DeviceRegistry(ttl=10.0)  # doctest: +SKIP
+    >>> registry.by_module("integrated_stepper_motors")  # doctest: +SKIP
+    ('45000001', '55000002')
+    """
+
+    def __init__(self, ttl: float=5.0,
+                 module: Union[str, ModuleType]="benchtop_stepper_motor"):
+        if isinstance(module, str):
+            module = importlib.import_module("thorlabs_kinesis." + module)
+        self.module = module
+        self.reader = DeviceListReader(module)
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._scanned = None  # type: Optional[float]
+        self._size = -1
+        self._serials = ()  # type: Tuple[str, ...]
+        self._info = {}  # type: Dict[str, TLI_DeviceInfo]
+        self._by_type = {}  # type: Dict[int, Tuple[str, ...]]
+        self._by_module = {}  # type: Dict[str, Tuple[str, ...]]
+
+    @property
+    def expired(self) -> bool:
+        return (self._scanned is None
+                or time.monotonic() - self._scanned >= self.ttl)
+
+    def invalidate(self):
+        "Makes the next lookup scan the bus again."
+        with self._lock:
+            self._scanned = None
+
+    def refresh(self, force: bool=False) -> bool:
+        """Scans the bus if the TTL expired (or ``force``) and reads the
+        device list again if it changed. Returns whether it was read again.
+        """
+        with self._lock:
+            scanned = force or self.expired
+            if scanned:
+                err = self.module.TLI_BuildDeviceList()
+                if err != 0:
+                    raise OSError(f"Can't build device list, error {err}.")
+                self._scanned = time.monotonic()
+
+            size = self.module.TLI_GetDeviceListSize()
+            if not scanned and size == self._size:
+                return False
+
+            self._size = size
+            self._update(self.reader.read())
+            return True
+
+    def _update(self, serials: Tuple[str, ...]):
+        info = {}
+        for serial in serials:
+            device_info = self._info.get(serial)
+            if device_info is None:
+                device_info = TLI_DeviceInfo()
+                # 1 on success, 0 if the device is gone or unknown.
+                if not self.module.TLI_GetDeviceInfo(serial.encode(),
+                                                     byref(device_info)):
+                    continue
+            info[serial] = device_info
+        serials = tuple(serial for serial in serials if serial in info)
+
+        by_type = {}
+        by_module = {}
+        for serial in serials:
+            type_id = int(serial[:2])
+            by_type.setdefault(type_id, []).append(serial)
+            device = serial_prefix.get(type_id)
+            if device is not None and device.module is not None:
+                by_module.setdefault(device.module, []).append(serial)
+
+        self._serials = serials
+        self._info = info
+        self._by_type = {key: tuple(value) for key, value in by_type.items()}
+        self._by_module = {key: tuple(value)
+                           for key, value in by_module.items()}
+
+    def serials(self) -> Tuple[str, ...]:
+        self.refresh()
+        return self._serials
+
+    def info(self, serial: str) -> TLI_DeviceInfo:
+        "Raises KeyError if the device isn't connected."
+        self.refresh()
+        return self._info[serial]
+
+    def by_type(self, type_id: int) -> Tuple[str, ...]:
+        self.refresh()
+        return self._by_type.get(type_id, ())
+
+    def by_module(self, module: str) -> Tuple[str, ...]:
+        "Serial numbers of the devices handled by the given binding module."
+        self.refresh()
+        return self._by_module.get(module, ())
+
+    def __contains__(self, serial: str) -> bool:
+        self.refresh()
+        return serial in self._info
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.serials())
+
+    def __len__(self) -> int:
+        return len(self.serials())
+
+    def __repr__(self) -> str:
+        return (f"<{type(self).__name__} {len(self._serials)} devices, "
+                f"ttl={self.ttl}>")
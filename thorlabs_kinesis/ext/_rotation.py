@@ -0,0 +1,154 @@
+"Moving rotational stages the short way round."
+from typing import Optional
+
+from thorlabs_kinesis._types import (
+    MOT_MovementDirections,
+    MOT_MovementModes,
+)
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    as_channel,
+)
+from thorlabs_kinesis.ext._stages import detect_stage
+
+__all__ = [
+    "RotationalAxis",
+]
+
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+QUICKEST = MOT_MovementDirections.Quickest
+FORWARDS = MOT_MovementDirections.Forwards
+REVERSE = MOT_MovementDirections.Reverse
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Planning arrays of angles needs NumPy.") from None
+    return np
+
+
+class RotationalAxis:
+    """A rotational channel, like a K10CR1 cage rotator, with positions in
+    device units that repeat every ``period``, one revolution, by default
+    the ``revolution`` of its stage in the stage database.
+
+    ``move_to`` moves to a target of any revolution in the RotationalWrapping
+    mode, in the given direction: ``QUICKEST`` for the least travel, or
+    ``FORWARDS`` and ``REVERSE`` to always approach from the same side, which
+    takes the backlash out of the angles reached. ``plan`` computes the
+    positions of a whole sequence of targets in the RotationalUnlimited mode,
+    for a Scan or ChannelGroup of the channel, where every move goes the
+    chosen way round.
+
+    SetRotationModes is only called when the modes change, as far as this
+    axis knows; call ``invalidate`` after changing them by other means.
+
+    >>> rotator = RotationalAxis(Motor("55000001"))  # doctest: +SKIP
+    >>> degrees = rotator.channel.units  # doctest: +SKIP
+    >>> angles = degrees.to_device([350, 10, 30, 340])  # doctest: +SKIP
+    >>> plan = rotator.plan(angles, start=0)  # doctest: +SKIP
+    >>> degrees.to_real(plan)  # doctest: +SKIP
+    array([-10.,  10.,  30., -20.])
+    """
+
+    def __init__(self, channel: Channel, period: int=None):
+        self.channel = as_channel(channel)
+        if period is None:
+            stage = detect_stage(self.channel)
+            if not stage.rotational:
+                raise ValueError(f"{self.channel} has a linear stage, "
+                                 f"{stage.part_number}.")
+            period = stage.revolution
+        if period <= 0:
+            raise ValueError("A revolution needs a positive period.")
+        self.period = int(period)
+        self._modes = None  # type: Optional[tuple]
+        self._set_rotation_modes = self.channel.motor.function(
+            "SetRotationModes")
+
+    def normalize(self, position):
+        """The position within the first revolution, from 0 to ``period``, as
+        an int or an int64 array.
+        """
+        if isinstance(position, int):
+            return position % self.period
+        np = _numpy()
+        return np.mod(np.asarray(position, dtype=np.int64), self.period)
+
+    def _deltas(self, delta, direction: int):
+        "Moves reaching the angles of ``delta`` going the given way round."
+        np = _numpy()
+        period = self.period
+        if direction == QUICKEST:
+            # Half turns go in reverse.
+            return np.mod(delta + period // 2, period) - period // 2
+        if direction == FORWARDS:
+            return np.mod(delta, period)
+        if direction == REVERSE:
+            return -np.mod(-delta, period)
+        raise ValueError(f"Unknown direction {direction}.")
+
+    def set_rotation_modes(self, mode: int, direction: int):
+        """Sets MOT_MovementModes and MOT_MovementDirections, unless already
+        set.
+        """
+        modes = (int(mode), int(direction))
+        if modes == self._modes:
+            return
+        err = self._set_rotation_modes(*self.channel._args,
+                                       MOT_MovementModes(mode),
+                                       MOT_MovementDirections(direction))
+        if err != 0:
+            raise OSError(f"Can't set the rotation modes of {self.channel}, "
+                          f"error {err}.")
+        self._modes = modes
+
+    def invalidate(self):
+        "Forgets the modes set, the next move sets them again."
+        self._modes = None
+
+    def move_to(self, position: int, direction: int=QUICKEST):
+        """Moves to ``position``, in any revolution, the given way round, in
+        the RotationalWrapping mode.
+        """
+        self.set_rotation_modes(MOT_MovementModes.RotationalWrapping,
+                                direction)
+        self.channel.move_to(self.normalize(int(position)))
+
+    def unlimited(self):
+        "Switches to the RotationalUnlimited mode, which plans are for."
+        self.set_rotation_modes(MOT_MovementModes.RotationalUnlimited,
+                                QUICKEST)
+
+    def plan(self, targets, start: int=None, direction: int=QUICKEST):
+        """Positions reaching a sequence of targets, in any revolutions, each
+        from the one before, the given way round, as an int32 array.
+
+        The positions are unwrapped, continuing across revolutions from
+        ``start``, by default the current position, so they are meant for
+        the RotationalUnlimited mode, set with ``unlimited``. Plans that
+        turn too far for device units raise a ValueError.
+        """
+        np = _numpy()
+        targets = np.asarray(targets)
+        if targets.ndim != 1:
+            raise ValueError(f"Plans of one axis are vectors, not shape "
+                             f"{targets.shape}.")
+        if targets.dtype.kind not in "iu":
+            raise TypeError("Plans are in device units, as integers.")
+        if start is None:
+            start = self.channel.get_position()
+        targets = targets.astype(np.int64)
+        delta = np.diff(targets, prepend=np.int64(start))
+        positions = start + np.cumsum(self._deltas(delta, direction))
+        if positions.size and (positions.min() < INT32_MIN or
+                               positions.max() > INT32_MAX):
+            raise ValueError("Plan turns out of the range of device units.")
+        return positions.astype(np.int32)
+
+    def __repr__(self) -> str:
+        return f"<RotationalAxis {self.channel}, period {self.period}>"
@@ -0,0 +1,162 @@
+"Scans through a plan of positions, overlapping moves with the host's work."
+import time
+from collections import namedtuple
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Union,
+)
+
+from thorlabs_kinesis.ext._group import ChannelGroup
+from thorlabs_kinesis.ext._motor import Channel
+
+__all__ = [
+    "Scan",
+    "ScanPoint",
+]
+
+# ``move_time`` is the time from the move command to the arrival of the
+# last channel, ``time`` the time since the start of the scan.
+ScanPoint = namedtuple("ScanPoint", ["index",
+                                     "target",
+                                     "result",
+                                     "move_time",
+                                     "time"])
+
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Scans need NumPy.") from None
+    return np
+
+
+class Scan:
+    """Moves channels through a plan of points, calling ``acquire(index,
+    target)`` at each one, and yields a ScanPoint per point from ``run``.
+
+    The plan is an array of device units with a row per point and a column
+    per channel (or a vector for one channel), e.g. from
+    ``UnitConverter.to_device``. Only the channels whose target changes
+    move. The target of the next point is staged with
+    SetMoveAbsolutePosition while the current move runs, and the next move
+    is started right after ``acquire`` returns, before the point is yielded,
+    so whatever the caller does with it overlaps the move.
+
+    A stopped move ends the scan with a RuntimeError. Closing the generator
+    early leaves the channels to finish the move already started.
+
+    >>> xy = [motor[1], motor[2]]  # doctest: +SKIP
+    >>> scan = Scan(xy, plan, acquire=read_camera)  # doctest: +SKIP
+    >>> for point in scan.run():  # doctest: +SKIP
+    ...     images[point.index] = point.result
+    >>> scan.rate  # doctest: +SKIP
+    8.7
+    """
+
+    def __init__(self, channels: Union[ChannelGroup, Iterable[Channel]],
+                 plan, acquire: Callable=None, timeout: float=None):
+        np = _numpy()
+        if not isinstance(channels, ChannelGroup):
+            channels = ChannelGroup(channels)
+        self.group = channels
+
+        plan = np.asarray(plan)
+        if plan.ndim == 1:
+            plan = plan[:, np.newaxis]
+        if plan.ndim != 2 or plan.shape[1] != len(channels):
+            raise ValueError(f"A plan for {len(channels)} channels needs "
+                             f"{len(channels)} columns, not shape "
+                             f"{plan.shape}.")
+        if plan.dtype.kind not in "iu":
+            raise TypeError("Plans are in device units, as integers.")
+        if plan.size and (plan.min() < INT32_MIN or plan.max() > INT32_MAX):
+            raise ValueError("Plan is out of the range of device units.")
+        self.plan = plan.astype(np.int32)
+        self.acquire = acquire
+        self.timeout = timeout
+        self.completed = 0
+        self.elapsed = 0.0
+
+    def __len__(self) -> int:
+        return len(self.plan)
+
+    @property
+    def rate(self) -> float:
+        "Points per second so far."
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def _moves(self) -> List[List[int]]:
+        "Channels moving at every point, those whose target changes."
+        np = _numpy()
+        changed = np.empty(self.plan.shape, dtype=bool)
+        changed[:1] = True
+        np.not_equal(self.plan[1:], self.plan[:-1], out=changed[1:])
+        return [[channel for channel, moves in enumerate(row) if moves]
+                for row in changed.tolist()]
+
+    def run(self) -> Iterator[ScanPoint]:
+        targets = self.plan.tolist()
+        moves = self._moves()
+        count = len(targets)
+        group = self.group
+        stage = [channel.set_move_absolute_position
+                 for channel in group.channels]
+        fire = [channel.move_absolute for channel in group.channels]
+        waiters = group._waiters()
+        acquire = self.acquire
+        timeout = self.timeout
+        clock = time.perf_counter
+
+        self.completed = 0
+        self.elapsed = 0.0
+        if not count:
+            return
+        # Messages of earlier moves don't belong to the scan.
+        for waiter in waiters:
+            waiter.clear()
+
+        with group._listening(waiters) as wakeup:
+            start = clock()
+            for channel in moves[0]:
+                stage[channel](targets[0][channel])
+            fired = clock()
+            for channel in moves[0]:
+                fire[channel]()
+
+            for index in range(count):
+                following = index + 1
+                if following < count:
+                    for channel in moves[following]:
+                        stage[channel](targets[following][channel])
+
+                moving = moves[index]
+                move_time = 0.0
+                if moving:
+                    _, completed = group._wait(
+                        [waiters[channel] for channel in moving], fired,
+                        timeout, wakeup)
+                    if not all(completed):
+                        raise RuntimeError(f"Move to point {index} was "
+                                           f"stopped.")
+                    move_time = clock() - fired
+
+                result = None
+                if acquire is not None:
+                    result = acquire(index, targets[index])
+
+                if following < count:
+                    fired = clock()
+                    for channel in moves[following]:
+                        fire[channel]()
+
+                self.completed = following
+                self.elapsed = clock() - start
+                yield ScanPoint(index, tuple(targets[index]), result,
+                                move_time, self.elapsed)
@@ -0,0 +1,211 @@
+"Database of stages and their conversion factors, by part number."
+import json
+import os
+import threading
+from collections import namedtuple
+from ctypes import byref
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from thorlabs_kinesis._types import (
+    MOT_StageAxisParameters,
+    TLI_HardwareInformation,
+)
+from thorlabs_kinesis.ext._device import _stage_settings
+from thorlabs_kinesis.ext._messages import device_args
+
+__all__ = [
+    "StageDatabase",
+    "StageInfo",
+    "detect_stage",
+    "load_stages",
+    "stage_info",
+    "stages",
+]
+
+# ``position``, ``velocity`` and ``acceleration`` are device units per real
+# unit, per real unit/s and per real unit/s^2, like MotorEncoderSettings.
+# ``revolution`` is the device units of a turn of rotational stages, exact
+# where the position scale is rounded, and None for linear ones.
+StageInfo = namedtuple("StageInfo", ["part_number",
+                                     "position",
+                                     "velocity",
+                                     "acceleration",
+                                     "travel",
+                                     "rotational",
+                                     "units",
+                                     "revolution"])
+
+BUNDLED_STAGES = os.path.join(os.path.dirname(__file__), "stages.json")
+
+# Files of extra stages, separated like PATH, loaded after the bundled ones.
+STAGES_VARIABLE = "THORLABS_KINESIS_STAGES"
+
+_SCALES = ("position", "velocity", "acceleration")
+
+
+def normalize(name: Union[str, bytes]) -> str:
+    """Key of a part or model number: upper case, without surrounding blanks
+    or the NUL padding of the DLL's structures.
+    """
+    if isinstance(name, bytes):
+        name = name.decode("ascii", "replace")
+    return name.strip("\0 \t").upper()
+
+
+def _names(source) -> List[str]:
+    if isinstance(source, MOT_StageAxisParameters):
+        return [source.partNumber]
+    if isinstance(source, TLI_HardwareInformation):
+        return [source.modelNumber]
+    return [source]
+
+
+class StageDatabase:
+    """Stages by part number, with aliases, read from JSON files.
+
+    The files map part numbers to the scales (``position``, ``velocity`` and
+    ``acceleration``), ``travel`` (minimum and maximum), ``rotational`` and
+    ``units`` of the stage, and optionally a list of ``aliases`` and, for
+    rotational stages, the ``revolution`` in device units, by default the
+    travel times the position scale. They are read on the first lookup: the
+    bundled stages.json, then the files in the THORLABS_KINESIS_STAGES
+    environment variable. Later entries replace earlier ones, so user files
+    can correct the bundled stages.
+
+    >>> stage_info("lts150").position
+    409600.0
+    >>> stage_info(b"Z825B\\0\\0\\0").part_number
+    'Z825'
+    """
+
+    def __init__(self, paths: Iterable[str]=None):
+        self._paths = None if paths is None else list(paths)
+        self._stages = None  # type: Optional[Dict[str, StageInfo]]
+        self._detected = {}  # type: Dict[tuple, StageInfo]
+        self._lock = threading.Lock()
+
+    def _default_paths(self) -> List[str]:
+        if self._paths is not None:
+            return self._paths
+        extra = os.environ.get(STAGES_VARIABLE, "")
+        return [BUNDLED_STAGES] + [path for path in extra.split(os.pathsep)
+                                   if path]
+
+    def _load(self) -> Dict[str, StageInfo]:
+        with self._lock:
+            if self._stages is None:
+                stages = {}  # type: Dict[str, StageInfo]
+                for path in self._default_paths():
+                    self._read(path, stages)
+                self._stages = stages
+            return self._stages
+
+    @staticmethod
+    def _read(path: str, stages: Dict[str, StageInfo]):
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+        for part_number, entry in entries.items():
+            try:
+                position, velocity, acceleration = (float(entry[scale])
+                                                    for scale in _SCALES)
+                low, high = entry["travel"]
+                rotational = bool(entry["rotational"])
+                revolution = entry.get("revolution")
+                if revolution is None and rotational:
+                    revolution = round((high - low) * position)
+                info = StageInfo(part_number, position, velocity,
+                                 acceleration, (low, high), rotational,
+                                 entry["units"],
+                                 None if revolution is None
+                                 else int(revolution))
+            except KeyError as missing:
+                raise ValueError(f"Stage {part_number!r} in {path} has no "
+                                 f"{missing}.") from None
+            for name in [part_number] + entry.get("aliases", []):
+                stages[normalize(name)] = info
+
+    def load(self, path: str):
+        """Adds the stages of a JSON file, replacing those already known.
+        Conversions by motor type, such as ``device_to_real_units``, use the
+        new scales; UnitConverters created before keep theirs.
+        """
+        stages = dict(self._load())
+        self._read(path, stages)
+        with self._lock:
+            self._stages = stages
+            self._detected.clear()
+            # Scales looked up in the default database.
+            _stage_settings.clear()
+
+    def get(self, name) -> Optional[StageInfo]:
+        """The stage with the given part number, model number or alias, also
+        given as a MOT_StageAxisParameters or TLI_HardwareInformation.
+        """
+        stages = self._stages
+        if stages is None:
+            stages = self._load()
+        for candidate in _names(name):
+            info = stages.get(normalize(candidate))
+            if info is not None:
+                return info
+        return None
+
+    def __getitem__(self, name) -> StageInfo:
+        info = self.get(name)
+        if info is None:
+            raise KeyError(f"Unknown stage {name!r}.")
+        return info
+
+    def __contains__(self, name) -> bool:
+        return self.get(name) is not None
+
+    def part_numbers(self) -> List[str]:
+        return sorted({info.part_number for info in self._load().values()})
+
+    def detect(self, device, channel: int=None) -> StageInfo:
+        """The stage of a motor Channel or Motor, or of a DeviceHandle and a
+        channel number, from the model number of its hardware information.
+        Integrated stages report their own model; a controller reporting
+        its own raises a ValueError. Cached per device and channel.
+        """
+        device, function, args = device_args(device, channel)
+        key = tuple(arg.value for arg in args)
+        info = self._detected.get(key)
+        if info is not None:
+            return info
+
+        hardware = TLI_HardwareInformation()
+        err = function("GetHardwareInfoBlock")(*args, byref(hardware))
+        if err != 0:
+            raise OSError(f"Can't read the hardware information of "
+                          f"{device}, error {err}.")
+        info = self.get(hardware)
+        if info is None:
+            model = normalize(hardware.modelNumber)
+            raise ValueError(f"No stage known for {device}, model {model!r}.")
+        self._detected[key] = info
+        return info
+
+
+stages = StageDatabase()
+
+
+def stage_info(name) -> StageInfo:
+    "The stage with the given part number, from the default database."
+    return stages[name]
+
+
+def load_stages(path: str):
+    "Adds the stages of a JSON file to the default database."
+    stages.load(path)
+
+
+def detect_stage(device, channel: int=None) -> StageInfo:
+    "The stage of a channel, from the default database."
+    return stages.detect(device, channel)
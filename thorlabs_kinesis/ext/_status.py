@@ -0,0 +1,166 @@
+"Decoding of the status bits returned by GetStatusBits."
+from collections import namedtuple
+from typing import Dict
+
+__all__ = [
+    "MotorStatus",
+    "PiezoStatus",
+    "status_flags",
+    "decode_status",
+    "decode_status_array",
+    "is_moving",
+    "is_homing",
+    "is_homed",
+    "has_error",
+]
+
+# Status bits of the motor controllers (SBC, ISC, CC and BMC functions).
+FORWARD_LIMIT = 0x00000001
+REVERSE_LIMIT = 0x00000002
+MOVING_FORWARD = 0x00000010
+MOVING_REVERSE = 0x00000020
+JOGGING_FORWARD = 0x00000040
+JOGGING_REVERSE = 0x00000080
+MOTOR_CONNECTED = 0x00000100
+HOMING = 0x00000200
+HOMED = 0x00000400
+TRACKING = 0x00001000
+SETTLED = 0x00002000
+MOTION_ERROR = 0x00004000
+CURRENT_LIMIT = 0x01000000
+ENABLED = 0x80000000
+
+MOVING = MOVING_FORWARD | MOVING_REVERSE | JOGGING_FORWARD | JOGGING_REVERSE
+MOTOR_ERRORS = MOTION_ERROR | CURRENT_LIMIT
+
+# Status bits of the piezo controllers (PBC functions).
+PIEZO_CONNECTED = 0x00000001
+ZEROED = 0x00000010
+ZEROING = 0x00000020
+STRAIN_GAUGE_CONNECTED = 0x00000100
+CLOSED_LOOP = 0x00000400
+
+MOTOR_FLAGS = {
+    "forward_limit": FORWARD_LIMIT,
+    "reverse_limit": REVERSE_LIMIT,
+    "moving_forward": MOVING_FORWARD,
+    "moving_reverse": MOVING_REVERSE,
+    "jogging_forward": JOGGING_FORWARD,
+    "jogging_reverse": JOGGING_REVERSE,
+    "connected": MOTOR_CONNECTED,
+    "homing": HOMING,
+    "homed": HOMED,
+    "tracking": TRACKING,
+    "settled": SETTLED,
+    "motion_error": MOTION_ERROR,
+    "current_limit": CURRENT_LIMIT,
+    "enabled": ENABLED,
+}
+
+PIEZO_FLAGS = {
+    "connected": PIEZO_CONNECTED,
+    "zeroed": ZEROED,
+    "zeroing": ZEROING,
+    "strain_gauge_connected": STRAIN_GAUGE_CONNECTED,
+    "closed_loop": CLOSED_LOOP,
+    "enabled": ENABLED,
+}
+
+MotorStatus = namedtuple("MotorStatus", list(MOTOR_FLAGS))
+PiezoStatus = namedtuple("PiezoStatus", list(PIEZO_FLAGS))
+
+_families = {
+    "SBC": (MOTOR_FLAGS, MotorStatus),
+    "ISC": (MOTOR_FLAGS, MotorStatus),
+    "CC": (MOTOR_FLAGS, MotorStatus),
+    "BMC": (MOTOR_FLAGS, MotorStatus),
+    "PBC": (PIEZO_FLAGS, PiezoStatus),
+}
+
+
+def _family(family: str):
+    try:
+        return _families[family]
+    except KeyError:
+        raise ValueError(f"Unknown family {family!r}.") from None
+
+
+def status_flags(family: str="ISC") -> Dict[str, int]:
+    """Names and masks of the status bits of the family, given by its function
+    prefix.
+
+    >>> status_flags("PBC")["closed_loop"]
+    1024
+    """
+    return dict(_family(family)[0])
+
+
+# The scalar checks work as well on NumPy arrays of status words, element by
+# element.
+
+def is_moving(bits):
+    """Whether the motor is moving or jogging, in either direction.
+
+    >>> is_moving(0x80000110)
+    True
+    >>> is_moving(0x80000500)
+    False
+    """
+    return (bits & MOVING) != 0
+
+
+def is_homing(bits):
+    "Whether the motor is homing."
+    return (bits & HOMING) != 0
+
+
+def is_homed(bits):
+    """Whether the motor was homed.
+
+    >>> is_homed(0x80000500)
+    True
+    """
+    return (bits & HOMED) != 0
+
+
+def has_error(bits):
+    "Whether a motion error or the current limit is flagged."
+    return (bits & MOTOR_ERRORS) != 0
+
+
+def decode_status(bits: int, family: str="ISC"):
+    """Decodes the status bits of a device of the given family into a
+    MotorStatus or PiezoStatus of booleans.
+
+    >>> decode_status(0x80000410).homed
+    True
+    >>> decode_status(0x80000410).moving_reverse
+    False
+    >>> decode_status(0x00000411, "PBC").closed_loop
+    True
+    """
+    flags, status = _family(family)
+    return status._make([(bits & mask) != 0 for mask in flags.values()])
+
+
+def decode_status_array(bits, family: str="ISC"):
+    """Decodes an array of status words, e.g. of many devices or of many
+    samples of one device, in one pass per flag. Returns a structured NumPy
+    array of booleans with a field per flag, with the shape of ``bits``.
+    Needs NumPy.
+
+    >>> status = decode_status_array([0x80000410, 0x80000400])  # doctest: +SKIP
+    >>> status["moving_forward"]  # doctest: +SKIP
+    array([ True, False])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("decode_status_array needs NumPy.") from None
+
+    flags, _ = _family(family)
+    bits = np.asarray(bits, dtype=np.uint32)
+    status = np.empty(bits.shape, dtype=[(name, np.bool_) for name in flags])
+    for name, mask in flags.items():
+        np.not_equal(bits & np.uint32(mask), 0, out=status[name])
+    return status
@@ -0,0 +1,183 @@
+"Background sampling of the position and status of motor channels."
+import threading
+import time
+from collections import namedtuple
+from typing import (
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from thorlabs_kinesis.ext._motor import (
+    Channel,
+    as_channel,
+)
+from thorlabs_kinesis.ext._wait import polling_period
+
+__all__ = [
+    "Snapshot",
+    "TelemetryBuffer",
+    "TelemetrySampler",
+]
+
+TELEMETRY_FIELDS = [
+    ("time", "f8"),
+    ("position", "i4"),
+    ("encoder", "i4"),
+    ("status", "u4"),
+]
+
+Snapshot = namedtuple("Snapshot", ["older", "newer", "start"])
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Telemetry buffers need NumPy.") from None
+    return np
+
+
+class TelemetryBuffer:
+    """Ring buffer of the last ``capacity`` samples of a channel: time (as
+    time.time()), position, encoder count and status bits. The memory is
+    allocated once; old samples are overwritten.
+    """
+
+    def __init__(self, capacity: int):
+        np = _numpy()
+        self.capacity = capacity
+        self.data = np.zeros(capacity, dtype=TELEMETRY_FIELDS)
+        self.count = 0  # Samples written so far.
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, timestamp: float, position: int, encoder: int,
+               status: int):
+        self.data[self.count % self.capacity] = (timestamp, position, encoder,
+                                                 status)
+        self.count += 1
+
+    def snapshot(self, n: int=None) -> Snapshot:
+        """The last ``n`` samples (all by default) as two views into the
+        buffer, ``older`` then ``newer``; nothing is copied.
+
+        The sampler keeps writing, so check ``intact(snapshot)`` after using
+        the views to make sure none of their samples was overwritten in the
+        meantime, or copy them with ``numpy.concatenate(snapshot[:2])``.
+        """
+        count = self.count
+        n = len(self) if n is None else min(n, len(self))
+        end = count % self.capacity
+        begin = end - n
+        if begin >= 0:
+            older, newer = self.data[begin:end], self.data[end:end]
+        else:
+            older, newer = self.data[begin:], self.data[:end]
+        return Snapshot(older, newer, count - n)
+
+    def intact(self, snapshot: Snapshot) -> bool:
+        "Whether none of the samples of the snapshot was overwritten yet."
+        return self.count <= snapshot.start + self.capacity
+
+
+class TelemetrySampler:
+    """Thread sampling channels at a fixed rate into TelemetryBuffers.
+
+    By default the rate follows the fastest polling period of the channels,
+    since the DLL only updates its cached position and status that often.
+    With ``request``, RequestPosition and RequestStatusBits are sent before
+    every sample, for channels that aren't polled.
+
+    A pass over the channels that runs past the next tick counts as an
+    overrun; the ticks it skipped count as dropped samples, one per channel.
+
+    Channels can also be given as Motors, for their first channel. The
+    buffers are keyed by the objects given.
+
+    >>> sampler = TelemetrySampler([stage])  # doctest: +SKIP
+    >>> with sampler:  # doctest: +SKIP
+    ...     stage.move_to(100000)
+    ...     stage.wait_for_move()
+    >>> older, newer, _ = sampler.buffers[stage].snapshot()  # doctest: +SKIP
+    """
+
+    def __init__(self, channels: Iterable[Channel], rate: float=None,
+                 capacity: int=100000, request: bool=False):
+        self.channels = list(channels)
+        if rate is None:
+            rate = 1 / min(polling_period(as_channel(channel))[0]
+                           for channel in self.channels)
+        self.rate = rate
+        self.request = request
+        self.buffers = {channel: TelemetryBuffer(capacity)
+                        for channel in self.channels}
+        self.overruns = 0
+        self.dropped = 0
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="TelemetrySampler")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "TelemetrySampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _sources(self) -> Tuple[tuple, ...]:
+        sources = []
+        for key in self.channels:
+            channel = as_channel(key)
+            sources.append((channel.get_position, channel.get_encoder_count,
+                            channel.get_status_bits, channel.request_position,
+                            channel.request_status_bits, self.buffers[key]))
+        return tuple(sources)
+
+    def _run(self):
+        sources = self._sources()
+        period = 1 / self.rate
+        request = self.request
+        clock = time.perf_counter
+        wall = time.time
+        tick = clock()
+        while not self._stop.is_set():
+            for (position, encoder, status, request_position,
+                 request_status, buffer) in sources:
+                if request:
+                    try:
+                        request_position()
+                        request_status()
+                    except OSError:
+                        self.errors += 1
+                        self.dropped += 1
+                        continue
+                buffer.append(wall(), position(), encoder(), status())
+
+            tick += period
+            late = clock() - tick
+            if late > 0:
+                skipped = int(late // period) + 1
+                self.overruns += 1
+                self.dropped += skipped * len(sources)
+                tick += skipped * period
+            self._stop.wait(tick - clock())
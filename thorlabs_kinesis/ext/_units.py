@@ -0,0 +1,195 @@
+"Conversion between real and device units for whole arrays of values."
+import numbers
+from ctypes import (
+    byref,
+    c_double,
+)
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Optional,
+)
+
+from thorlabs_kinesis.ext._device import (
+    MotorEncoderSettings,
+    encoder_settings,
+)
+from thorlabs_kinesis.ext._stages import StageInfo
+
+if TYPE_CHECKING:
+    # Only for annotations, the channels create their unit converters.
+    from thorlabs_kinesis.ext._motor import Channel
+
+__all__ = [
+    "ChannelUnits",
+    "UnitConverter",
+]
+
+# Device units are the int arguments of the DLL functions.
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+# Unit types of GetRealValueFromDeviceUnit, in the order of the scales.
+UNIT_TYPES = {
+    "position": 0,
+    "velocity": 1,
+    "acceleration": 2,
+}
+
+# Device value converted to calibrate. The scale is its ratio to a double,
+# so it is as precise as the DLL's result, whatever the value.
+PROBE = 1 << 24
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Converting arrays needs NumPy.") from None
+    return np
+
+
+class UnitConverter:
+    """Converts between real units [mm] and device units of a motor type,
+    from the stage database or ``motor_encoder_lib``, like
+    ``device_to_real_units`` and ``real_to_device_units`` but with the
+    scales looked up once.
+
+    Takes scalars, including NumPy scalars and 0-d arrays, converted to an
+    int or a float, or sequences and NumPy arrays, converted in one pass.
+    Device units are rounded half to even, as by ``round``, and returned as
+    int32 arrays; values that don't fit raise a ValueError.
+
+    >>> stage = UnitConverter("HS DRV001 8mm")
+    >>> stage.to_device(1.0)
+    546100
+    >>> stage.to_device([0.5, 1.0], "velocity")  # doctest: +SKIP
+    array([14660155, 29320310], dtype=int32)
+    >>> stage.to_real(546100)
+    1.0
+    """
+
+    def __init__(self, motor_type: str):
+        self.motor_type = motor_type
+        self._set_scales(encoder_settings(motor_type))
+
+    @classmethod
+    def from_scales(cls, position: float, velocity: float,
+                    acceleration: float,
+                    motor_type: str=None) -> "UnitConverter":
+        "A converter for scales that aren't in any database."
+        converter = cls.__new__(cls)
+        converter.motor_type = motor_type
+        converter._set_scales(MotorEncoderSettings(position, velocity,
+                                                   acceleration))
+        return converter
+
+    @classmethod
+    def from_stage(cls, stage: StageInfo) -> "UnitConverter":
+        """A converter for a stage of the database, e.g. from
+        ``detect_stage(channel)``.
+        """
+        return cls.from_scales(stage.position, stage.velocity,
+                               stage.acceleration, stage.part_number)
+
+    def _set_scales(self, scales: MotorEncoderSettings):
+        self.scales = scales
+        self._scale = scales._asdict()  # type: Dict[str, float]
+
+    def _get_scale(self, dimension: str) -> float:
+        try:
+            return self._scale[dimension]
+        except KeyError:
+            raise TypeError("Can't convert given dimension.") from None
+
+    def to_device(self, real, dimension: str="position"):
+        "Real units to device units, as an int or an int32 array."
+        scale = self._get_scale(dimension)
+        if not isinstance(real, numbers.Real):
+            np = _numpy()
+            real = np.asarray(real, dtype=np.float64)
+            if real.ndim:
+                device = np.rint(real * scale)
+                # Written so that NaN fails too.
+                if device.size and not (device.min() >= INT32_MIN and
+                                        device.max() <= INT32_MAX):
+                    raise ValueError("Values are out of the range of device "
+                                     "units.")
+                return device.astype(np.int32)
+        device = round(float(real) * scale)
+        if not INT32_MIN <= device <= INT32_MAX:
+            raise ValueError(f"{real} is out of the range of device units.")
+        return device
+
+    def to_real(self, device, dimension: str="position"):
+        "Device units to real units, as a float or a float64 array."
+        scale = self._get_scale(dimension)
+        if not isinstance(device, numbers.Real):
+            np = _numpy()
+            device = np.asarray(device, dtype=np.float64)
+            if device.ndim:
+                return device / scale
+        return float(device) / scale
+
+    def __repr__(self) -> str:
+        name = self.motor_type or "custom scales"
+        return f"<UnitConverter {name}>"
+
+
+class ChannelUnits(UnitConverter):
+    """Unit conversion of a motor channel, as done by its
+    GetRealValueFromDeviceUnit and GetDeviceUnitFromRealValue, but local.
+
+    The conversion is linear, so the DLL is asked once per unit type for the
+    real value of a device value, on the first conversion; the scales are
+    derived from the answers and kept until ``invalidate``. The channel
+    invalidates them when it sets motor params and when its motor is opened
+    again; call ``invalidate`` after changing the motor params or stage by
+    other means.
+
+    >>> stage = Motor("27000001")  # doctest: +SKIP
+    >>> stage.open()  # doctest: +SKIP
+    >>> stage.units.to_device(numpy.linspace(0, 25, 5))  # doctest: +SKIP
+    array([     0, 214400, 428800, 643200, 857600], dtype=int32)
+    """
+
+    def __init__(self, channel: "Channel"):
+        self.channel = channel
+        self.motor_type = None
+        self.scales = None  # type: Optional[MotorEncoderSettings]
+        self._scale = None  # type: Optional[Dict[str, float]]
+        self._real = c_double()
+        self._to_real = partial(
+            channel.motor.function("GetRealValueFromDeviceUnit"),
+            *channel._args, PROBE, byref(self._real))
+
+    @property
+    def calibrated(self) -> bool:
+        return self._scale is not None
+
+    def calibrate(self):
+        "Asks the DLL for the scales now."
+        scales = []
+        for dimension, unit_type in UNIT_TYPES.items():
+            err = self._to_real(unit_type)
+            if err != 0:
+                raise OSError(f"Can't convert the units of {self.channel}, "
+                              f"error {err}.")
+            if not self._real.value:
+                raise ValueError(f"{self.channel} has no {dimension} scale.")
+            scales.append(PROBE / self._real.value)
+        self._set_scales(MotorEncoderSettings(*scales))
+
+    def invalidate(self):
+        "Forgets the scales, the next conversion calibrates again."
+        self._scale = None
+        self.scales = None
+
+    def _get_scale(self, dimension: str) -> float:
+        if self._scale is None:
+            self.calibrate()
+        return super()._get_scale(dimension)
+
+    def __repr__(self) -> str:
+        return f"<ChannelUnits of {self.channel}>"
@@ -0,0 +1,238 @@
+"Waiting for moves and homing to complete."
+import time
+from ctypes import byref
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    FrozenSet,
+    Optional,
+    Tuple,
+)
+
+from thorlabs_kinesis._utils import (
+    c_dword,
+    c_word,
+)
+from thorlabs_kinesis.ext._callbacks import subscribe
+from thorlabs_kinesis.ext._status import (
+    HOMED as HOMED_BIT,
+    HOMING,
+    MOVING,
+)
+
+if TYPE_CHECKING:
+    # Only for annotations, the channels create their waiters.
+    from thorlabs_kinesis.ext._motor import Channel
+
+__all__ = [
+    "HOMED",
+    "MOVED",
+    "STOPPED",
+    "MessageWaiter",
+    "wait_for_home",
+    "wait_for_move",
+]
+
+# Message type and ID pairs of the generic motor messages.
+HOMED = (2, 0)
+MOVED = (2, 1)
+STOPPED = (2, 2)
+
+# The messages a MessageWaiter keeps, and how many of them between waits.
+WAITED = frozenset((HOMED, MOVED, STOPPED))
+WAITER_QUEUE_SIZE = 16
+
+# Used when the channel isn't polled, between status requests.
+REQUEST_PERIOD = 0.05
+
+
+class MessageWaiter:
+    """Waits for the messages of a motor channel.
+
+    Where the family has ``RegisterMessageCallback``, the waiter subscribes
+    to the channel's message callback, shared with the MessageDispatchers
+    and the asyncio handles, which wakes up the waiting thread as soon as a
+    message arrives. It only keeps the Homed, Moved and Stopped messages,
+    and the last ``WAITER_QUEUE_SIZE`` of them between waits. Otherwise,
+    waits without a timeout block in ``WaitForMessage``.
+
+    Messages are taken off the waiter's queue, so only one thread should
+    wait on it at a time. ``on_message``, if set, is called from the DLL's
+    thread after every message, once ``wait`` was woken up; it can be
+    changed at any time.
+    """
+
+    def __init__(self, channel: "Channel", on_message: Callable=None):
+        self.channel = channel
+        function = channel.motor.function
+        self._subscription = subscribe(function, channel._args, WAITED,
+                                       WAITER_QUEUE_SIZE)
+        if self._subscription is not None:
+            self._subscription.on_message = on_message
+            return
+
+        self.message_type = c_word()
+        self.message_id = c_word()
+        self.data = c_dword()
+        out = (byref(self.message_type), byref(self.message_id),
+               byref(self.data))
+        self._next_message = partial(function("GetNextMessage"),
+                                     *channel._args, *out)
+        self._wait_for_message = partial(function("WaitForMessage"),
+                                         *channel._args, *out)
+
+    @property
+    def has_callback(self) -> bool:
+        return self._subscription is not None
+
+    @property
+    def on_message(self) -> Optional[Callable]:
+        if self._subscription is None:
+            return None
+        return self._subscription.on_message
+
+    @on_message.setter
+    def on_message(self, on_message: Optional[Callable]):
+        if self._subscription is not None:
+            self._subscription.on_message = on_message
+
+    def _message(self) -> Tuple[int, int]:
+        return self.message_type.value, self.message_id.value
+
+    def next_message(self) -> Optional[Tuple[int, int, int]]:
+        "Type, ID and data of the next message in the queue, if any."
+        if self._subscription is not None:
+            message = self._subscription.poll()
+            return None if message is None else tuple(message[:3])
+        if not self._next_message():
+            return None
+        return (self.message_type.value, self.message_id.value,
+                self.data.value)
+
+    def clear(self):
+        """Drops the queued messages, including the ones the channel queued
+        before the callback was registered.
+        """
+        if self._subscription is not None:
+            self._subscription.route.collect()
+        while self.next_message() is not None:
+            pass
+
+    def wait(self, messages: FrozenSet[Tuple[int, int]],
+             timeout: float=None) -> Tuple[int, int]:
+        """Waits for one of the given message type and ID pairs, of
+        ``WAITED``, returning it. Raises TimeoutError if it doesn't arrive
+        within ``timeout`` seconds, which needs a message callback.
+        """
+        if not messages <= WAITED:
+            raise ValueError(f"Waiters only receive {sorted(WAITED)}, not "
+                             f"{sorted(messages - WAITED)}.")
+        if self._subscription is None:
+            if timeout is not None:
+                raise TypeError(f"{self.channel.motor.prefix} devices can't "
+                                f"wait for messages with a timeout.")
+            while True:
+                self._wait_for_message()
+                if self._message() in messages:
+                    return self._message()
+
+        # Messages queued before the callback was registered don't wake it.
+        self._subscription.route.collect()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+            try:
+                message = self._subscription.get(remaining)
+            except TimeoutError:
+                raise TimeoutError(f"No message from {self.channel} within "
+                                   f"{timeout} s.") from None
+            if message[:2] in messages:
+                return message[:2]
+
+    def close(self):
+        "Stops receiving the messages, the waiter can't be used anymore."
+        if self._subscription is not None:
+            self._subscription.close()
+
+
+def polling_period(channel: "Channel") -> Tuple[float, bool]:
+    """Seconds between status updates of the channel, and whether it is
+    polled; if not, ``REQUEST_PERIOD``.
+    """
+    period = channel.polling_duration() / 1000
+    if period > 0:
+        return period, True
+    return REQUEST_PERIOD, False
+
+
+class StatusCompletion:
+    """Tells from successive status bits whether a move or homing is done:
+    none of the ``busy`` bits set, and all of the ``required`` ones.
+
+    Right after the command, the status bits may still be the ones from
+    before it until the next poll, so they only count once the channel was
+    seen busy or after two polling periods.
+    """
+
+    def __init__(self, busy: int, required: int, period: float):
+        self.busy = busy
+        self.required = required
+        self.settled = time.monotonic() + 2 * period
+        self.seen_busy = False
+
+    def done(self, bits: int) -> bool:
+        if bits & self.busy:
+            self.seen_busy = True
+            return False
+        return (bits & self.required == self.required
+                and (self.seen_busy or time.monotonic() >= self.settled))
+
+
+def _poll_status(channel: "Channel", busy: int, required: int,
+                 timeout: Optional[float]) -> bool:
+    period, polling = polling_period(channel)
+    completion = StatusCompletion(busy, required, period)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        if not polling:
+            channel.request_status_bits()
+        if completion.done(channel.get_status_bits()):
+            return True
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"{channel} didn't finish within {timeout} s.")
+        time.sleep(period / 4)
+
+
+def _wait(channel, done: Tuple[int, int], busy: int, required: int,
+          timeout: Optional[float]) -> bool:
+    if hasattr(channel, "channel"):
+        channel = channel.channel(1)
+    waiter = channel.waiter
+    if waiter.has_callback or timeout is None:
+        return waiter.wait(frozenset((done, STOPPED)), timeout) == done
+    return _poll_status(channel, busy, required, timeout)
+
+
+def wait_for_move(channel: "Channel", timeout: float=None) -> bool:
+    """Waits until the channel (or the first channel of a Motor) finishes its
+    move. Returns False if the move was stopped instead. Raises TimeoutError
+    after ``timeout`` seconds.
+
+    The move ends with the Moved message. Families without a message
+    callback fall back to the moving bits of the status when a timeout is
+    given. A Moved message left in the queue by an earlier move counts, so
+    clear the message queue before moving if nothing reads it.
+
+    >>> stage.move_to(100000)  # doctest: +SKIP
+    >>> wait_for_move(stage, timeout=10.0)  # doctest: +SKIP
+    True
+    """
+    return _wait(channel, MOVED, MOVING, 0, timeout)
+
+
+def wait_for_home(channel: "Channel", timeout: float=None) -> bool:
+    "Same as wait_for_move, for homing."
+    return _wait(channel, HOMED, HOMING, HOMED_BIT, timeout)
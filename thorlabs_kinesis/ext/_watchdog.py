@@ -0,0 +1,242 @@
+"Watching the connections of many devices through their last-message timers."
+import threading
+import time
+from collections import (
+    deque,
+    namedtuple,
+)
+from ctypes import (
+    byref,
+    c_char_p,
+    c_int64,
+)
+from functools import partial
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+from thorlabs_kinesis._utils import not_implemented
+from thorlabs_kinesis.ext._messages import device_args
+
+__all__ = [
+    "HealthEvent",
+    "Watchdog",
+]
+
+HealthEvent = namedtuple("HealthEvent", ["time", "state", "detail"])
+
+HEALTHY = "healthy"
+STALE = "stale"
+DISCONNECTED = "disconnected"
+
+
+class _Target:
+    "A channel (or device) watched through its last-message timer."
+
+    def __init__(self, item, timeout: Optional[int]):
+        if isinstance(item, tuple):
+            target, function, args = device_args(*item)
+        else:
+            target, function, args = device_args(item)
+        self.target = target
+        # The motor of a channel.
+        self.handle = getattr(target, "motor", target)
+        self.serial = args[0].value.decode()
+        self.function = function
+        self.period = function("PollingDuration")(*args)
+        if timeout is None:
+            if self.period <= 0:
+                raise ValueError(f"{target} isn't polled; give the watchdog "
+                                 f"a timeout.")
+            timeout = max(2 * self.period, 100)
+        self.timeout = timeout
+        self.enable_timer = partial(function("EnableLastMsgTimer"), *args)
+        self.overrun = partial(function("HasLastMsgTimerOverrun"), *args)
+        self.start_polling = partial(function("StartPolling"), *args)
+        since = function("TimeSinceLastMsgReceived")
+        self._milliseconds = c_int64()
+        self._since = None
+        if since is not not_implemented:
+            self._since = partial(since, *args, byref(self._milliseconds))
+
+    def arm(self):
+        self.enable_timer(True, self.timeout)
+        if self.period > 0:
+            self.start_polling(self.period)
+
+    def since_last_message(self) -> Optional[float]:
+        "Seconds since the last message from the device, if the DLL knows."
+        if self._since is None:
+            return None
+        self._since()
+        return self._milliseconds.value / 1000
+
+
+class _Device:
+    "Connection state of a device and of the channels watched on it."
+
+    def __init__(self, serial: str, handle, function, history: int):
+        serial_arg = c_char_p(serial.encode())
+        self.serial = serial
+        self.handle = handle
+        self.check_connection = partial(function("CheckConnection"),
+                                        serial_arg)
+        # Not the handle's close, which would end the waits of its channels.
+        self.close = partial(function("Close"), serial_arg)
+        self.targets = []  # type: List[_Target]
+        self.state = HEALTHY
+        self.attempts = 0
+        self.next_attempt = 0.0
+        self.history = deque(maxlen=history)  # type: Deque[HealthEvent]
+
+    def overrun(self) -> Optional[_Target]:
+        for target in self.targets:
+            if target.overrun():
+                return target
+        return None
+
+
+class Watchdog:
+    """Watches the connections of many devices from one thread.
+
+    The last-message timer of every channel given (Motor, Channel, or
+    DeviceHandle, or a tuple of a DeviceHandle and a channel number) is
+    armed with ``timeout`` milliseconds, by default twice its polling
+    period, so a device that stops answering is flagged within a couple of
+    polling periods. Each check costs one HasLastMsgTimerOverrun call per
+    channel; CheckConnection is only called once a timer overran.
+
+    A device whose timer overran is ``stale`` while still connected, and
+    ``disconnected`` otherwise. Either way it is closed and opened again,
+    after ``backoff`` seconds, doubling after every failed attempt up to
+    ``max_backoff``. It is opened through the handle of its first channel
+    given, which registers the message callbacks of the device again and,
+    for a Motor, recalibrates its units. On success the timers are armed and
+    the polling started again. The last ``history`` changes of every device
+    are kept as HealthEvents in ``history``, keyed by serial number.
+
+    >>> with Watchdog(stages) as watchdog:  # doctest: +SKIP
+    ...     run_experiment()
+    >>> watchdog.history["45000001"]  # doctest: +SKIP
+    deque([HealthEvent(time=..., state='disconnected', detail=...), ...])
+    """
+
+    def __init__(self, devices: Iterable, timeout: int=None,
+                 interval: float=None, backoff: float=0.5,
+                 max_backoff: float=30.0, history: int=100):
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._devices = {}  # type: Dict[str, _Device]
+        for item in devices:
+            target = _Target(item, timeout)
+            device = self._devices.get(target.serial)
+            if device is None:
+                device = _Device(target.serial, target.handle,
+                                 target.function, history)
+                self._devices[target.serial] = device
+            device.targets.append(target)
+        if interval is None:
+            interval = min(target.timeout for device in self._devices.values()
+                           for target in device.targets) / 2000
+        self.interval = interval
+        self.history = {serial: device.history
+                        for serial, device in self._devices.items()}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    @property
+    def health(self) -> Dict[str, str]:
+        "State of every device: 'healthy', 'stale' or 'disconnected'."
+        return {serial: device.state
+                for serial, device in self._devices.items()}
+
+    def _record(self, device: _Device, state: str, detail: str):
+        device.state = state
+        device.history.append(HealthEvent(time.time(), state, detail))
+
+    def arm(self):
+        "Arms the last-message timers of all channels."
+        with self._lock:
+            for device in self._devices.values():
+                for target in device.targets:
+                    target.arm()
+
+    def check(self):
+        """Checks the timers of all devices once and reconnects the ones
+        due. Called every ``interval`` seconds once started.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for device in self._devices.values():
+                if device.state == DISCONNECTED:
+                    if now >= device.next_attempt:
+                        self._reconnect(device, now)
+                    continue
+                target = device.overrun()
+                if target is None:
+                    if device.state != HEALTHY:
+                        self._record(device, HEALTHY, "messages again")
+                        device.attempts = 0
+                    continue
+                if device.state == HEALTHY:
+                    self._fail(device, target, now)
+                elif now >= device.next_attempt:
+                    self._reconnect(device, now)
+
+    def _fail(self, device: _Device, target: _Target, now: float):
+        since = target.since_last_message()
+        detail = f"no message from {target.target}"
+        if since is not None:
+            detail += f" for {since:.3f} s"
+        state = STALE if device.check_connection() else DISCONNECTED
+        self._record(device, state, detail)
+        device.next_attempt = now + self.backoff
+
+    def _reconnect(self, device: _Device, now: float):
+        device.attempts += 1
+        device.close()
+        try:
+            device.handle.open()
+        except OSError as err:
+            delay = min(self.backoff * 2 ** device.attempts, self.max_backoff)
+            device.next_attempt = now + delay
+            self._record(device, device.state, f"reconnect failed ({err}), "
+                                               f"next attempt in {delay:g} s")
+            return
+        for target in device.targets:
+            target.arm()
+        self._record(device, HEALTHY, f"reconnected after "
+                                      f"{device.attempts} attempt(s)")
+        device.attempts = 0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.arm()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="Watchdog")
+        self._thread.start()
+
+    def stop(self):
+        "Stops checking; the timers stay armed."
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "Watchdog":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,246 @@
+"""asyncio handles for the motor controllers.
+
+The message callbacks of the DLL are handed over to the event loop with
+``call_soon_threadsafe``, so awaiting a move doesn't take up a thread, and one
+loop can supervise many axes.
+
+>>> async def main():  # doctest: +SKIP
+...     stage = Motor("45000001")
+...     stage.open()
+...     await stage.home()
+...     await stage.move_to(100000)
+...     async for status in stage.watch():
+...         print(status.position)
+"""
+import asyncio
+import time
+from collections import namedtuple
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+from thorlabs_kinesis.ext import _motor
+from thorlabs_kinesis.ext._wait import (
+    HOMED,
+    HOMED_BIT,
+    HOMING,
+    MOVED,
+    MOVING,
+    STOPPED,
+    MessageWaiter,
+    StatusCompletion,
+    polling_period,
+)
+
+__all__ = [
+    "Channel",
+    "Motor",
+    "Status",
+]
+
+Status = namedtuple("Status", ["position", "status_bits", "time"])
+
+# Python 3.6 has no get_running_loop; its get_event_loop returns the running
+# loop when called from a coroutine.
+_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class Channel:
+    """asyncio handle to a motor channel.
+
+    The handle subscribes to the message callback of the channel on first
+    use, from the event loop it is used in. The callback is shared with the
+    blocking ``wait_for_move`` and the MessageDispatchers.
+    """
+
+    def __init__(self, channel: _motor.Channel):
+        self.channel = channel
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        self._waiter = None  # type: Optional[MessageWaiter]
+        self._scheduled = False
+        self._pending = {}  # type: Dict[tuple, List[asyncio.Future]]
+        self._watchers = set()  # type: Set[asyncio.Event]
+
+    def _start(self) -> MessageWaiter:
+        loop = _running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._waiter = MessageWaiter(self.channel, self._on_message)
+            # Earlier messages don't belong to anything awaited here.
+            self._waiter.clear()
+        elif loop is not self._loop:
+            raise RuntimeError(f"{self.channel} is used from another event "
+                               f"loop.")
+        return self._waiter
+
+    def _on_message(self):
+        # DLL thread. Several messages arriving before the loop gets to them
+        # are drained at once.
+        loop = self._loop
+        if not self._scheduled and loop is not None:
+            self._scheduled = True
+            try:
+                loop.call_soon_threadsafe(self._drain)
+            except RuntimeError:
+                # The loop was closed before the handle.
+                self._scheduled = False
+
+    def _drain(self):
+        self._scheduled = False
+        if self._waiter is None:
+            # Closed since.
+            return
+        while True:
+            message = self._waiter.next_message()
+            if message is None:
+                break
+            pair = message[:2]
+            if pair == STOPPED:
+                self._resolve(MOVED, False)
+                self._resolve(HOMED, False)
+            elif pair in self._pending:
+                self._resolve(pair, True)
+        for event in self._watchers:
+            event.set()
+
+    def _resolve(self, pair: tuple, result: bool):
+        for future in self._pending.pop(pair, ()):
+            if not future.done():
+                future.set_result(result)
+
+    def _forget(self, pair: tuple, future: asyncio.Future):
+        pending = self._pending.get(pair)
+        if pending is not None and future in pending:
+            pending.remove(future)
+            if not pending:
+                del self._pending[pair]
+
+    async def _complete(self, pair: tuple, busy: int, required: int,
+                        command, timeout: Optional[float]) -> bool:
+        waiter = self._start()
+        if not waiter.has_callback:
+            command()
+            return await self._poll(busy, required, timeout)
+
+        future = self._loop.create_future()
+        self._pending.setdefault(pair, []).append(future)
+        try:
+            command()
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            # Resolved futures are gone already; failed, cancelled or timed
+            # out ones would otherwise stay until the next such message.
+            self._forget(pair, future)
+
+    async def _poll(self, busy: int, required: int,
+                    timeout: Optional[float]) -> bool:
+        period, polling = polling_period(self.channel)
+        completion = StatusCompletion(busy, required, period)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not polling:
+                self.channel.request_status_bits()
+            if completion.done(self.channel.get_status_bits()):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(period / 4)
+
+    async def move_to(self, position: int, timeout: float=None) -> bool:
+        """Moves to the position and returns once there, or False if the
+        move was stopped.
+        """
+        return await self._complete(
+            MOVED, MOVING, 0, lambda: self.channel.move_to(position), timeout)
+
+    async def move_by(self, distance: int, timeout: float=None) -> bool:
+        return await self._complete(
+            MOVED, MOVING, 0, lambda: self.channel.move_by(distance), timeout)
+
+    async def home(self, timeout: float=None) -> bool:
+        return await self._complete(HOMED, HOMING, HOMED_BIT,
+                                    self.channel.home, timeout)
+
+    def stop(self, profiled: bool=True):
+        self.channel.stop(profiled)
+
+    def close(self):
+        """Stops receiving the messages of the channel; the handle can be
+        used again afterwards, from any event loop.
+        """
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
+        self._loop = None
+        self._scheduled = False
+        self._pending.clear()
+
+    async def watch(self, interval: float=None) -> AsyncIterator[Status]:
+        """Yields the status at every message and otherwise every
+        ``interval`` seconds, by default the polling period.
+        """
+        self._start()
+        period, polling = polling_period(self.channel)
+        interval = period if interval is None else interval
+        changed = asyncio.Event()
+        self._watchers.add(changed)
+        try:
+            while True:
+                if not polling:
+                    self.channel.request_status_bits()
+                yield Status(self.channel.get_position(),
+                             self.channel.get_status_bits(), time.monotonic())
+                timer = self._loop.call_later(interval, changed.set)
+                await changed.wait()
+                timer.cancel()
+                changed.clear()
+        finally:
+            self._watchers.discard(changed)
+
+    def __repr__(self) -> str:
+        return f"<aio {self.channel!r}>"
+
+
+class Motor:
+    """asyncio handle to a motor controller. The methods of the first
+    channel are available on the motor itself; other channels are
+    ``motor.channel(number)`` or ``motor[number]``.
+
+    Opening and closing don't wait for a device, so they aren't coroutines.
+    Other functions are available through ``motor.motor``, the blocking
+    ``thorlabs_kinesis.ext.Motor``.
+    """
+
+    def __init__(self, serial_no: str):
+        self.motor = _motor.Motor(serial_no)
+        self._channels = {}  # type: Dict[int, Channel]
+        channel = self.channel(1)
+        self.move_to = channel.move_to
+        self.move_by = channel.move_by
+        self.home = channel.home
+        self.stop = channel.stop
+        self.watch = channel.watch
+
+    def open(self):
+        self.motor.open()
+
+    def close(self):
+        for channel in self._channels.values():
+            channel.close()
+        self.motor.close()
+
+    def channel(self, number: int=1) -> Channel:
+        channel = self._channels.get(number)
+        if channel is None:
+            channel = Channel(self.motor.channel(number))
+            self._channels[number] = channel
+        return channel
+
+    __getitem__ = channel
+
+    def __repr__(self) -> str:
+        return f"<aio {self.motor!r}>"
@@ -13,14 +13,12 @@ Bindings for Thorlabs Integrated Stepper Motor DLL.
 
 # flake8: noqa
 from ctypes import (
-    Structure,
-    cdll,
     c_bool,
     c_short,
     c_int,
     c_uint,
-    c_int16,
     c_int32,
+    c_int64,
     c_char,
     c_byte,
     c_long,
@@ -33,197 +31,15 @@ from ctypes import (
 from thorlabs_kinesis._utils import (
     c_word,
     c_dword,
-    bind
+    bind,
+    defer_bindings,
+    LazyLibrary,
 )
 
-lib = cdll.LoadLibrary("Thorlabs.MotionControl.IntegratedStepperMotors.dll")
+lib = LazyLibrary("Thorlabs.MotionControl.IntegratedStepperMotors.dll")
 
 
-# enum FT_Status
-FT_OK = c_short(0x00)
-FT_InvalidHandle = c_short(0x01)
-FT_DeviceNotFound = c_short(0x02)
-FT_DeviceNotOpened = c_short(0x03)
-FT_IOError = c_short(0x04)
-FT_InsufficientResources = c_short(0x05)
-FT_InvalidParameter = c_short(0x06)
-FT_DeviceNotPresent = c_short(0x07)
-FT_IncorrectDevice = c_short(0x08)
-FT_Status = c_short
-
-# enum MOT_MotorTypes
-MOT_NotMotor = c_int(0)
-MOT_DCMotor = c_int(1)
-MOT_StepperMotor = c_int(2)
-MOT_BrushlessMotor = c_int(3)
-MOT_CustomMotor = c_int(100)
-MOT_MotorTypes = c_int
-
-# enum MOT_TravelModes
-MOT_TravelModeUndefined = c_int(0x00)
-MOT_Linear = c_int(0x01)
-MOT_Rotational = c_int(0x02)
-MOT_TravelModes = c_int
-
-# enum MOT_TravelDirection
-MOT_TravelDirectionUndefined = c_short(0x00)
-MOT_Forwards = c_short(0x01)
-MOT_Reverse = c_short(0x02)
-MOT_TravelDirection = c_short
-
-# enum MOT_HomeLimitSwitchDirection
-MOT_LimitSwitchDirectionUndefined = c_short(0x00)
-MOT_ReverseLimitSwitch = c_short(0x01)
-MOT_ForwardLimitSwitch = c_short(0x04)
-MOT_HomeLimitSwitchDirection = c_short
-
-# enum MOT_DirectionSense
-MOT_Normal = c_short(0x00)
-MOT_Backwards = c_short(0x01)
-MOT_DirectionSense = c_short
-
-# enum MOT_JogModes
-MOT_JogModeUndefined = c_short(0x00)
-MOT_Continuous = c_short(0x01)
-MOT_SingleStep = c_short(0x02)
-MOT_JogModes = c_short
-
-# enum MOT_StopModes
-MOT_StopModeUndefined = c_short(0x00)
-MOT_Immediate = c_short(0x01)
-MOT_Profiled = c_short(0x02)
-MOT_StopModes = c_short
-
-# enum MOT_ButtonModes
-MOT_ButtonModeUndefined = c_word(0x00)
-MOT_JogMode = c_word(0x01)
-MOT_Preset = c_word(0x02)
-MOT_ButtonModes = c_word
-
-# enum MOT_LimitSwitchModes
-MOT_LimitSwitchModeUndefined = c_word(0x00)
-MOT_LimitSwitchIgnoreSwitch = c_word(0x01)
-MOT_LimitSwitchMakeOnContact = c_word(0x02)
-MOT_LimitSwitchBreakOnContact = c_word(0x03)
-MOT_LimitSwitchMakeOnHome = c_word(0x04)
-MOT_LimitSwitchBreakOnHome = c_word(0x05)
-MOT_PMD_Reserved = c_word(0x06)
-MOT_LimitSwitchIgnoreSwitchSwapped = c_word(0x81)
-MOT_LimitSwitchMakeOnContactSwapped = c_word(0x82)
-MOT_LimitSwitchBreakOnContactSwapped = c_word(0x83)
-MOT_LimitSwitchMakeOnHomeSwapped = c_word(0x84)
-MOT_LimitSwitchBreakOnHomeSwapped = c_word(0x85)
-MOT_LimitSwitchModes = c_word
-
-# enum MOT_LimitSwitchSWModes
-MOT_LimitSwitchSWModeUndefined = c_word(0x00)
-MOT_LimitSwitchIgnored = c_word(0x01)
-MOT_LimitSwitchStopImmediate = c_word(0x02)
-MOT_LimitSwitchStopProfiled = c_word(0x03)
-MOT_LimitSwitchIgnored_Rotational = c_word(0x81)
-MOT_LimitSwitchStopImmediate_Rotational = c_word(0x82)
-MOT_LimitSwitchStopProfiled_Rotational = c_word(0x83)
-MOT_LimitSwitchSWModes = c_word
-
-# enum MOT_LimitsSoftwareApproachPolicy
-DisallowIllegalMoves = c_int16(0)
-AllowPartialMoves = c_int16(1)
-AllowAllMoves = c_int16(2)
-MOT_LimitsSoftwareApproachPolicy = c_int16
-
-# enum MOT_PID_LoopMode
-MOT_PIDLoopModeDisabled = c_word(0x00)
-MOT_PIDOpenLoopMode = c_word(0x01)
-MOT_PIDClosedLoopMode = c_word(0x02)
-MOT_PID_LoopMode = c_word
-
-# enum MOT_MovementModes
-LinearRange = c_int(0x00)
-RotationalUnlimited = c_int(0x01)
-RotationalWrapping = c_int(0x02)
-MOT_MovementModes = c_int
-
-# enum MOT_MovementDirections
-Quickest = c_int(0x00)
-Forwards = c_int(0x01)
-Reverse = c_int(0x02)
-MOT_MovementDirections = c_int
-
-
-class TLI_DeviceInfo(Structure):
-    _fields_ = [("typeID", c_dword),
-                ("description", (65 * c_char)),
-                ("serialNo", (9 * c_char)),
-                ("PID", c_dword),
-                ("isKnownType", c_bool),
-                ("motorType", MOT_MotorTypes),
-                ("isPiezoDevice", c_bool),
-                ("isLaser", c_bool),
-                ("isCustomType", c_bool),
-                ("isRack", c_bool),
-                ("maxChannels", c_short)]
-
-
-class TLI_HardwareInformation(Structure):
-    _fields_ = [("serialNumber", c_dword),
-                ("modelNumber", (8 * c_char)),
-                ("type", c_word),
-                ("firmwareVersion", c_dword),
-                ("notes", (48 * c_char)),
-                ("deviceDependantData", (12 * c_byte)),
-                ("hardwareVersion", c_word),
-                ("modificationState", c_word),
-                ("numChannels", c_short)]
-
-
-class MOT_VelocityParameters(Structure):
-    _fields_ = [("minVelocity", c_int),
-                ("acceleration", c_int),
-                ("maxVelocity", c_int)]
-
-
-class MOT_JogParameters(Structure):
-    _fields_ = [("mode", MOT_JogModes),
-                ("stepSize", c_uint),
-                ("velParams", MOT_VelocityParameters),
-                ("stopMode", MOT_StopModes)]
-
-
-class MOT_HomingParameters(Structure):
-    _fields_ = [("direction", MOT_TravelDirection),
-                ("limitSwitch", MOT_HomeLimitSwitchDirection),
-                ("velocity", c_uint),
-                ("offsetDistance", c_uint)]
-
-
-class MOT_LimitSwitchParameters(Structure):
-    _fields_ = [("clockwiseHardwareLimit", MOT_LimitSwitchModes),
-                ("anticlockwiseHardwareLimit", MOT_LimitSwitchModes),
-                ("clockwisePosition", c_dword),
-                ("anticlockwisePosition", c_dword),
-                ("softLimitMode", MOT_LimitSwitchSWModes)]
-
-
-class MOT_PowerParameters(Structure):
-    _fields_ = [("restPercentage", c_word),
-                ("movePercentage", c_word)]
-
-
-class MOT_ButtonParameters(Structure):
-    _fields_ = [("buttonMode", MOT_ButtonModes),
-                ("leftButtonPosition", c_int),
-                ("rightButtonPosition", c_int),
-                ("timeout", c_word),
-                ("unused", c_word)]
-
-
-class MOT_PotentiometerStep(Structure):
-    _fields_ = [("thresholdDeflection", c_word),
-                ("velocity", c_dword)]
-
-
-class MOT_PotentiometerSteps(Structure):
-    _fields_ = [("potentiometerStepParameters", (4 * MOT_PotentiometerStep))]
+from thorlabs_kinesis._types import *
 
 
 TLI_BuildDeviceList = bind(lib, "TLI_BuildDeviceList", None, c_short)
@@ -262,7 +78,7 @@ ISC_NeedsHoming = bind(lib, "ISC_NeedsHoming", [POINTER(c_char)], c_bool)
 ISC_CanMoveWithoutHomingFirst = bind(lib, "ISC_CanMoveWithoutHomingFirst", [POINTER(c_char)], c_bool)
 ISC_Home = bind(lib, "ISC_Home", [POINTER(c_char)], c_short)
 ISC_ClearMessageQueue = bind(lib, "ISC_ClearMessageQueue", [POINTER(c_char)])
-ISC_RegisterMessageCallback = bind(lib, "ISC_RegisterMessageCallback", [POINTER(c_char), c_short, CFUNCTYPE(None)])
+ISC_RegisterMessageCallback = bind(lib, "ISC_RegisterMessageCallback", [POINTER(c_char), CFUNCTYPE(None)])
 ISC_MessageQueueSize = bind(lib, "ISC_MessageQueueSize", [POINTER(c_char)], c_int)
 ISC_GetNextMessage = bind(lib, "ISC_GetNextMessage", [POINTER(c_char), POINTER(c_word), POINTER(c_word), POINTER(c_dword)], c_bool)
 ISC_WaitForMessage = bind(lib, "ISC_WaitForMessage", [POINTER(c_char), POINTER(c_word), POINTER(c_word), POINTER(c_dword)], c_bool)
@@ -273,7 +89,7 @@ ISC_MoveRelative = bind(lib, "ISC_MoveRelative", [POINTER(c_char), c_int], c_sho
 # This is a typo in given header file. Typo is also persistent in CHM file. Correct one follows.
 # SCC_RequestJogParams = bind(lib, "SCC_RequestJogParams", [POINTER(c_char)], c_short)
 ISC_RequestJogParams = bind(lib, "ISC_RequestJogParams", [POINTER(c_char)], c_short)
-ISC_GetJogMode = bind(lib, "ISC_GetJogMode", [POINTER(c_char), POINTER(MOT_JogModes), POINTER(MOT_StopModes)], c_short)
+ISC_GetJogMode = bind(lib, "ISC_GetJogMode", [POINTER(c_char), POINTER(MOT_JogModes.ctype), POINTER(MOT_StopModes.ctype)], c_short)
 ISC_SetJogMode = bind(lib, "ISC_SetJogMode", [POINTER(c_char), MOT_JogModes, MOT_StopModes], c_short)
 ISC_GetJogStepSize = bind(lib, "ISC_GetJogStepSize", [POINTER(c_char)], c_uint)
 ISC_SetJogStepSize = bind(lib, "ISC_SetJogStepSize", [POINTER(c_char), c_uint], c_short)
@@ -293,12 +109,12 @@ ISC_SetBacklash = bind(lib, "ISC_SetBacklash", [POINTER(c_char), c_long], c_shor
 ISC_GetPositionCounter = bind(lib, "ISC_GetPositionCounter", [POINTER(c_char)], c_long)
 ISC_SetPositionCounter = bind(lib, "ISC_SetPositionCounter", [POINTER(c_char), c_long], c_short)
 ISC_RequestLimitSwitchParams = bind(lib, "ISC_RequestLimitSwitchParams", [POINTER(c_char)], c_short)
-ISC_GetLimitSwitchParams = bind(lib, "ISC_GetLimitSwitchParams", [POINTER(c_char), POINTER(MOT_LimitSwitchModes), POINTER(MOT_LimitSwitchModes), POINTER(c_uint), POINTER(c_uint), POINTER(MOT_LimitSwitchSWModes)], c_short)
+ISC_GetLimitSwitchParams = bind(lib, "ISC_GetLimitSwitchParams", [POINTER(c_char), POINTER(MOT_LimitSwitchModes.ctype), POINTER(MOT_LimitSwitchModes.ctype), POINTER(c_uint), POINTER(c_uint), POINTER(MOT_LimitSwitchSWModes.ctype)], c_short)
 ISC_SetLimitSwitchParams = bind(lib, "ISC_SetLimitSwitchParams", [POINTER(c_char), MOT_LimitSwitchModes, MOT_LimitSwitchModes, c_uint, c_uint, MOT_LimitSwitchSWModes], c_short)
-ISC_GetSoftLimitMode = bind(lib, "ISC_GetSoftLimitMode", [POINTER(c_char)], MOT_LimitsSoftwareApproachPolicy)
+ISC_GetSoftLimitMode = bind(lib, "ISC_GetSoftLimitMode", [POINTER(c_char)], MOT_LimitsSoftwareApproachPolicy.ctype)
 ISC_SetLimitsSoftwareApproachPolicy = bind(lib, "ISC_SetLimitsSoftwareApproachPolicy", [POINTER(c_char), MOT_LimitsSoftwareApproachPolicy])
 ISC_RequestButtonParams = bind(lib, "ISC_RequestButtonParams", [POINTER(c_char)], c_short)
-ISC_GetButtonParams = bind(lib, "ISC_GetButtonParams", [POINTER(c_char), POINTER(MOT_ButtonModes), POINTER(c_int), POINTER(c_int), POINTER(c_short)], c_short)
+ISC_GetButtonParams = bind(lib, "ISC_GetButtonParams", [POINTER(c_char), POINTER(MOT_ButtonModes.ctype), POINTER(c_int), POINTER(c_int), POINTER(c_short)], c_short)
 ISC_SetButtonParams = bind(lib, "ISC_SetButtonParams", [POINTER(c_char), MOT_ButtonModes, c_int, c_int], c_short)
 ISC_RequestPotentiometerParams = bind(lib, "ISC_RequestPotentiometerParams", [POINTER(c_char)], c_short)
 ISC_GetPotentiometerParams = bind(lib, "ISC_GetPotentiometerParams", [POINTER(c_char), c_short, POINTER(c_word), POINTER(c_dword)], c_short)
@@ -339,7 +155,7 @@ ISC_GetStatusBits = bind(lib, "ISC_GetStatusBits", [POINTER(c_char)], c_dword)
 ISC_StartPolling = bind(lib, "ISC_StartPolling", [POINTER(c_char), c_int], c_bool)
 ISC_PollingDuration = bind(lib, "ISC_PollingDuration", [POINTER(c_char)], c_long)
 ISC_StopPolling = bind(lib, "ISC_StopPolling", [POINTER(c_char)])
-# ISC_TimeSinceLastMsgReceived <- TODO: ISC_API bool __cdecl ISC_TimeSinceLastMsgReceived(char const * serialNo, __int64 &lastUpdateTimeMS );
+ISC_TimeSinceLastMsgReceived = bind(lib, "ISC_TimeSinceLastMsgReceived", [POINTER(c_char), POINTER(c_int64)], c_bool)
 ISC_EnableLastMsgTimer = bind(lib, "ISC_EnableLastMsgTimer", [POINTER(c_char), c_bool, c_int32])
 ISC_HasLastMsgTimerOverrun = bind(lib, "ISC_HasLastMsgTimerOverrun", [POINTER(c_char)], c_bool)
 ISC_RequestSettings = bind(lib, "ISC_RequestSettings", [POINTER(c_char)], c_short)
@@ -347,7 +163,7 @@ ISC_GetStageAxisMinPos = bind(lib, "ISC_GetStageAxisMinPos", [POINTER(c_char)],
 ISC_GetStageAxisMaxPos = bind(lib, "ISC_GetStageAxisMaxPos", [POINTER(c_char)], c_int)
 ISC_SetStageAxisLimits = bind(lib, "ISC_SetStageAxisLimits", [POINTER(c_char), c_int, c_int], c_short)
 ISC_SetMotorTravelMode = bind(lib, "ISC_SetMotorTravelMode", [POINTER(c_char), MOT_TravelModes], c_short)
-ISC_GetMotorTravelMode = bind(lib, "ISC_GetMotorTravelMode", [POINTER(c_char)], MOT_TravelModes)
+ISC_GetMotorTravelMode = bind(lib, "ISC_GetMotorTravelMode", [POINTER(c_char)], MOT_TravelModes.ctype)
 ISC_SetMotorParams = bind(lib, "ISC_SetMotorParams", [POINTER(c_char), c_long, c_long, c_float], c_short)
 ISC_GetMotorParams = bind(lib, "ISC_GetMotorParams", [POINTER(c_char), POINTER(c_long), POINTER(c_long), POINTER(c_float)], c_short)
 ISC_SetMotorParamsExt = bind(lib, "ISC_SetMotorParamsExt", [POINTER(c_char), c_double, c_double, c_double], c_short)
@@ -360,3 +176,6 @@ ISC_SetMotorTravelLimits = bind(lib, "ISC_SetMotorTravelLimits", [POINTER(c_char
 ISC_GetMotorTravelLimits = bind(lib, "ISC_GetMotorTravelLimits", [POINTER(c_char), POINTER(c_double), POINTER(c_double)], c_short)
 ISC_GetRealValueFromDeviceUnit = bind(lib, "ISC_GetRealValueFromDeviceUnit", [POINTER(c_char), c_int, POINTER(c_double), c_int], c_short)
 ISC_GetDeviceUnitFromRealValue = bind(lib, "ISC_GetDeviceUnitFromRealValue", [POINTER(c_char), c_double, POINTER(c_int), c_int], c_short)
+
+
+__getattr__, __dir__ = defer_bindings(globals())
@@ -12,171 +12,35 @@ Bindings for Thorlabs KCube DC Servo DLL.
 Implemented with Kinesis Version 1.14.23.16838
 """
 
-import thorlabs_kinesis as tk
-
 from ctypes import (
-    Structure,
-    cdll,
     c_bool,
     c_short,
     c_int,
     c_uint,
     c_int32,
+    c_int64,
     c_char,
     c_byte,
     c_long,
     c_float,
     c_double,
     POINTER,
+    CFUNCTYPE,
 )
 
 from thorlabs_kinesis._utils import (
     c_word,
     c_dword,
     bind,
+    defer_bindings,
     not_implemented,
+    LazyLibrary,
 )
 
-lib = cdll.LoadLibrary("Thorlabs.MotionControl.KCube.DCServo.dll")
-
-
-# enum MOT_MotorTypes
-MOT_NotMotor = c_int(0)
-MOT_DCMotor = c_int(1)
-MOT_StepperMotor = c_int(2)
-MOT_BrushlessMotor = c_int(3)
-MOT_CustomMotor = c_int(100)
-MOT_MotorTypes = c_int
-
-# enum MOT_TravelDirection
-MOT_TravelDirectionDisabled = c_short(0x00)
-MOT_Forwards = c_short(0x01)
-MOT_Reverse = c_short(0x02)
-MOT_TravelDirection = c_short
-
-# enum MOT_JogModes
-MOT_JogModeUndefined = c_short(0x00)
-MOT_Continuous = c_short(0x01)
-MOT_SingleStep = c_short(0x02)
-MOT_JogModes = c_short
-
-# enum MOT_StopModes
-MOT_StopModeUndefined = c_short(0x00)
-MOT_Immediate = c_short(0x01)
-MOT_Profiled = c_short(0x02)
-MOT_StopModes = c_short
-
-# enum MOT_TravelModes
-MOT_TravelModeUndefined = c_int(0)
-MOT_Linear = c_int(1)
-MOT_Rotational = c_int(2)
-MOT_TravelModes = c_int
-
-# enum MOT_LimitsSoftwareApproachPolicy
-DisallowIllegalMoves = c_short(0x00)
-AllowPartialMoves = c_short(0x01)
-AllowAllMoves = c_short(0x02)
-MOT_LimitsSoftwareApproachPolicy = c_short
-
-# enum MOT_HomeLimitSwitchDirection
-MOT_LimitSwitchDirectionUndefined = c_short(0x00)
-MOT_ReverseLimitSwitch = c_short(0x01)
-MOT_ForwardLimitSwitch = c_short(0x02)
-MOT_HomeLimitSwitchDirection = c_short
-
-# enum MOT_LimitSwitchModes
-MOT_LimitSwitchModeUndefined = c_word(0x00)
-MOT_LimitSwitchIgnoreSwitch = c_word(0x01)
-MOT_LimitSwitchMakeOnContact = c_word(0x02)
-MOT_LimitSwitchBreakOnContact = c_word(0x03)
-MOT_LimitSwitchMakeOnHome = c_word(0x04)
-MOT_LimitSwitchBreakOnHome = c_word(0x05)
-MOT_PMD_Reserved = c_word(0x06)
-MOT_LimitSwitchIgnoreSwitchSwapped = c_word(0x81)
-MOT_LimitSwitchMakeOnContactSwapped = c_word(0x82)
-MOT_LimitSwitchBreakOnContactSwapped = c_word(0x83)
-MOT_LimitSwitchMakeOnHomeSwapped = c_word(0x84)
-MOT_LimitSwitchBreakOnHomeSwapped = c_word(0x85)
-MOT_LimitSwitchModes = c_word
-
-# enum MOT_LimitSwitchSWModes
-MOT_LimitSwitchSWModeUndefined = c_word(0)
-MOT_LimitSwitchIgnored = c_word(1)
-MOT_LimitSwitchStopImmediate = c_word(2)
-MOT_LimitSwitchStopProfiled = c_word(3)
-MOT_LimitSwitchIgnored_Rotational = c_word(4)
-MOT_LimitSwitchStopImmediate_Rotational = c_word(5)
-MOT_LimitSwitchStopProfiled_Rotational = c_word(6)
-MOT_LimitSwitchSWModes = c_word
+lib = LazyLibrary("Thorlabs.MotionControl.KCube.DCServo.dll")
 
-# enum MOT_MovementModes
-LinearRange = c_int(0x00)
-RotationalUnlimited = c_int(0x01)
-RotationalWrapping = c_int(0x02)
-MOT_MovementModes = c_int
 
-# enum MOT_MovementDirections
-Quickest = c_int(0x00)
-Forwards = c_int(0x01)
-Reverse = c_int(0x02)
-MOT_MovementDirections = c_int
-
-
-class TLI_DeviceInfo(Structure):
-    _fields_ = [("typeID", c_dword),
-                ("description", (65 * c_char)),
-                ("serialNo", (9 * c_char)),
-                ("PID", c_dword),
-                ("isKnownType", c_bool),
-                ("motorType", MOT_MotorTypes),
-                ("isPiezoDevice", c_bool),
-                ("isLaser", c_bool),
-                ("isCustomType", c_bool),
-                ("isRack", c_bool),
-                ("maxChannels", c_short)]
-
-
-class TLI_HardwareInformation(Structure):
-    _fields_ = [("serialNumber", c_dword),
-                ("modelNumber", (8 * c_char)),
-                ("type", c_word),
-                ("firmwareVersion", c_dword),
-                ("notes", (48 * c_char)),
-                ("deviceDependantData", (12 * c_byte)),
-                ("hardwareVersion", c_word),
-                ("modificationState", c_word),
-                ("numChannels", c_short)]
-
-class MOT_HomingParameters(Structure):
-    _fields_ = [("direction", MOT_TravelDirection),
-                ("limitSwitch", MOT_HomeLimitSwitchDirection),
-                ("offsetDistance", c_uint),
-                ("velocity", c_uint)]
-
-class MOT_VelocityParameters(Structure):
-    _fields_ = [("acceleration", c_int),
-                ("maxVelocity", c_int),
-                ("minVelocity", c_int)]
-
-class MOT_JogParameters(Structure):
-    _fields_ = [("mode", MOT_JogModes),
-                ("stepSize", c_uint),
-                ("stopMode", MOT_StopModes),
-                ("velParams", MOT_VelocityParameters)]
-
-class MOT_DC_PIDParameters(Structure):
-    _fields_ = [("differentialGain", c_int),
-                ("integralGain", c_int),
-                ("integralLimit", c_int),
-                ("parameterFilter", c_word),
-                ("proportionalGain", c_int)]
-
-class MOT_LimitSwitchParameters(Structure):
-    _fields_ = [("anticlockwiseHardwareLimit", MOT_LimitSwitchModes),
-                ("anticlockwisePosition", c_dword),
-                ("clockwiseHardwareLimit", MOT_LimitSwitchModes),
-                ("clockwisePosition", c_dword),
-                ("softLimitMode", MOT_LimitSwitchSWModes)]
+from thorlabs_kinesis._types import *
 
 
 TLI_BuildDeviceList = bind(lib, "TLI_BuildDeviceList", None, c_short)
@@ -212,12 +76,12 @@ CC_GetHardwareInfoBlock = bind(lib, "CC_GetHardwareInfoBlock", [POINTER(c_char),
 CC_GetHomingParamsBlock = bind(lib, "CC_GetHomingParamsBlock", [POINTER(c_char), POINTER(MOT_HomingParameters)], c_short)
 CC_GetHomingVelocity = bind(lib, "CC_GetHomingVelocity", [POINTER(c_char)], c_uint)
 CC_GetHubBay = bind(lib, "CC_GetHubBay", [POINTER(c_char)], c_char)
-CC_GetJogMode = bind(lib, "CC_GetJogMode", [POINTER(c_char), POINTER(MOT_JogModes), POINTER(MOT_StopModes)], c_short)
+CC_GetJogMode = bind(lib, "CC_GetJogMode", [POINTER(c_char), POINTER(MOT_JogModes.ctype), POINTER(MOT_StopModes.ctype)], c_short)
 CC_GetJogParamsBlock = bind(lib, "CC_GetJogParamsBlock", [POINTER(c_char), POINTER(MOT_JogParameters)], c_short)
 CC_GetJogStepSize = bind(lib, "CC_GetJogStepSize", [POINTER(c_char)], c_uint)
 CC_GetJogVelParams = bind(lib, "CC_GetJogVelParams", [POINTER(c_char), POINTER(c_int), POINTER(c_int)], c_short)
 CC_GetLEDswitches = bind(lib, "CC_GetLEDswitches", [POINTER(c_char)], c_word)
-CC_GetLimitSwitchParams = bind(lib, "CC_GetLimitSwitchParams", [POINTER(c_char), POINTER(MOT_LimitSwitchModes), POINTER(MOT_LimitSwitchModes), c_uint, c_uint, POINTER(MOT_LimitSwitchSWModes)], c_short)
+CC_GetLimitSwitchParams = bind(lib, "CC_GetLimitSwitchParams", [POINTER(c_char), POINTER(MOT_LimitSwitchModes.ctype), POINTER(MOT_LimitSwitchModes.ctype), c_uint, c_uint, POINTER(MOT_LimitSwitchSWModes.ctype)], c_short)
 CC_GetLimitSwitchParamsBlock = bind(lib, "CC_GetLimitSwitchParamsBlock", [POINTER(c_char), POINTER(MOT_LimitSwitchParameters)], c_short)
 CC_GetMMIParams = not_implemented # bind(lib, "CC_GetMMIParams", [], )
 CC_GetMMIParamsBlock = not_implemented # bind(lib, "CC_GetMMIParamsBlock", [], )
@@ -225,7 +89,7 @@ CC_GetMMIParamsExt = not_implemented # bind(lib, "CC_GetMMIParamsExt", [], )
 CC_GetMotorParams = bind(lib, "CC_GetMotorParams", [POINTER(c_char), POINTER(c_long), POINTER(c_long), POINTER(c_float)], c_short)
 CC_GetMotorParamsExt = bind(lib, "CC_GetMotorParamsExt", [POINTER(c_char), POINTER(c_double), POINTER(c_double), POINTER(c_double)], c_short)
 CC_GetMotorTravelLimits = bind(lib, "CC_GetMotorTravelLimits", [POINTER(c_char), POINTER(c_double), POINTER(c_double)], c_short)
-CC_GetMotorTravelMode = bind(lib, "CC_GetMotorTravelMode", [POINTER(c_char)], MOT_TravelModes)
+CC_GetMotorTravelMode = bind(lib, "CC_GetMotorTravelMode", [POINTER(c_char)], MOT_TravelModes.ctype)
 CC_GetMotorVelocityLimits = bind(lib, "CC_GetMotorVelocityLimits", [POINTER(c_char), POINTER(c_double), POINTER(c_double)], c_short)
 CC_GetMoveAbsolutePosition = bind(lib, "CC_GetMoveAbsolutePosition", [POINTER(c_char)], c_int)
 CC_GetMoveRelativeDistance = bind(lib, "CC_GetMoveRelativeDistance", [POINTER(c_char)], c_int)
@@ -234,7 +98,7 @@ CC_GetNumberPositions = bind(lib, "CC_GetNumberPositions", [POINTER(c_char)], c_
 CC_GetPosition  = bind(lib, "CC_GetPosition", [POINTER(c_char)], c_int)
 CC_GetPositionCounter = bind(lib, "CC_GetPositionCounter", [POINTER(c_char)], c_long)
 CC_GetRealValueFromDeviceUnit = bind(lib, "CC_GetRealValueFromDeviceUnit", [POINTER(c_char), c_int, POINTER(c_double), c_int], c_short)
-CC_GetSoftLimitMode = bind(lib, "CC_GetSoftLimitMode", [POINTER(c_char)], MOT_LimitsSoftwareApproachPolicy)
+CC_GetSoftLimitMode = bind(lib, "CC_GetSoftLimitMode", [POINTER(c_char)], MOT_LimitsSoftwareApproachPolicy.ctype)
 CC_GetSoftwareVersion = bind(lib, "CC_GetSoftwareVersion", [POINTER(c_char)], c_dword)
 CC_GetStageAxisMaxPos = bind(lib, "CC_GetStageAxisMaxPos", [POINTER(c_char)], c_int)
 CC_GetStageAxisMinPos = bind(lib, "CC_GetStageAxisMinPos", [POINTER(c_char)], c_int)
@@ -261,7 +125,7 @@ CC_NeedsHoming = bind(lib, "CC_NeedsHoming", [POINTER(c_char)], c_bool)
 CC_Open = bind(lib, "CC_Open", [POINTER(c_char)], c_short)
 CC_PersistSettings = bind(lib, "CC_PersistSettings", [POINTER(c_char)], c_bool)
 CC_PollingDuration = bind(lib, "CC_PollingDuration", [POINTER(c_char)], c_long)
-CC_RegisterMessageCallback = not_implemented # bind(lib, "CC_RegisterMessageCallback", [POINTER(c_char), FUNCTION_POINTER?], )
+CC_RegisterMessageCallback = bind(lib, "CC_RegisterMessageCallback", [POINTER(c_char), CFUNCTYPE(None)])
 CC_RequestBacklash = bind(lib, "CC_RequestBacklash", [POINTER(c_char)], c_short)
 CC_RequestDCPIDParams = bind(lib, "CC_RequestDCPIDParams", [POINTER(c_char)], c_short)
 CC_RequestDigitalOutputs = bind(lib, "CC_RequestDigitalOutputs", [POINTER(c_char)], c_short)
@@ -324,5 +188,8 @@ CC_StopImmediate = bind(lib, "CC_StopImmediate", [POINTER(c_char)], c_short)
 CC_StopPolling = bind(lib, "CC_StopPolling", [POINTER(c_char)], None)
 CC_StopProfiled = bind(lib, "CC_StopProfiled",[POINTER(c_char)], c_short)
 CC_SuspendMoveMessages = bind(lib, "CC_SuspendMoveMessages", [POINTER(c_char)], c_short)
-CC_TimeSinceLastMsgReceived = not_implemented # bind(lib, "CC_TimeSinceLastMsgReceived", [POINTER(c_char)], )
+CC_TimeSinceLastMsgReceived = bind(lib, "CC_TimeSinceLastMsgReceived", [POINTER(c_char), POINTER(c_int64)], c_bool)
 CC_WaitForMessage = bind(lib, "CC_WaitForMessage", [POINTER(c_char),POINTER(c_word),POINTER(c_word),POINTER(c_dword)], None)
+
+
+__getattr__, __dir__ = defer_bindings(globals())
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Thorlabs-Kinesis Project Contributors
+# Licensed under the terms of the GNU GPLv3+ License
+# (see thorlabs_kinesis/__init__.py for details)
+
+"""
+Simulator
+---------
+
+Pure-Python simulation of Kinesis controllers, used by the ``sim`` backend.
+Add devices to the shared ``engine`` before building the device list::
+
+    import thorlabs_kinesis
+    thorlabs_kinesis.config.backend = "sim"
+
+    from thorlabs_kinesis.sim import engine
+    engine.add_device("45000001")
+    engine.add_devices(70, 100)
+"""
+
+from thorlabs_kinesis.sim._engine import (
+    MODELS,
+    STAGES,
+    Engine,
+    MotorChannel,
+    PiezoChannel,
+    SimDevice,
+    Stage,
+)
+from thorlabs_kinesis.sim._library import SimulatedLibrary
+
+# Engine shared by every library of the default ``sim`` backend.
+engine = Engine()
+
+__all__ = [
+    "MODELS",
+    "STAGES",
+    "Engine",
+    "MotorChannel",
+    "PiezoChannel",
+    "SimDevice",
+    "Stage",
+    "SimulatedLibrary",
+    "engine",
+]
@@ -0,0 +1,722 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Thorlabs-Kinesis Project Contributors
+# Licensed under the terms of the GNU GPLv3+ License
+# (see thorlabs_kinesis/__init__.py for details)
+
+"""
+Simulation Engine
+-----------------
+
+In-process model of Kinesis controllers. Motion is not stepped in time: a
+move is stored as a trapezoidal velocity profile and positions are evaluated
+from it when they are asked for, so idle and moving axes cost nothing until
+they are queried. A single scheduler thread, started on first use, delivers
+the "moved"/"homed"/"stopped" messages when a profile ends and calls the
+registered message callbacks, like the DLL's own thread does.
+"""
+
+import heapq
+import itertools
+import math
+import re
+import threading
+import time
+import traceback
+from collections import (
+    deque,
+    namedtuple,
+)
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+from thorlabs_kinesis.ext._device import serial_prefix
+
+__all__ = [
+    "Stage",
+    "Engine",
+    "SimDevice",
+    "MotorChannel",
+    "PiezoChannel",
+]
+
+# Number of messages a channel queue holds before the oldest are dropped.
+MESSAGE_QUEUE_SIZE = 1024
+
+# Message types and IDs, see the Kinesis "Messages" documentation.
+GENERIC_DEVICE = 0
+GENERIC_PIEZO = 1
+GENERIC_MOTOR = 2
+SETTINGS_INITIALIZED = 0
+SETTINGS_UPDATED = 1
+HOMED = 0
+MOVED = 1
+STOPPED = 2
+STATUS_CHANGED = 2
+
+# Status bits of motor channels.
+STATUS_FORWARD_LIMIT = 0x00000001
+STATUS_REVERSE_LIMIT = 0x00000002
+STATUS_MOVING_FORWARD = 0x00000010
+STATUS_MOVING_REVERSE = 0x00000020
+STATUS_JOGGING_FORWARD = 0x00000040
+STATUS_JOGGING_REVERSE = 0x00000080
+STATUS_CONNECTED = 0x00000100
+STATUS_HOMING = 0x00000200
+STATUS_HOMED = 0x00000400
+STATUS_ENABLED = 0x80000000
+
+# Status bits of piezo channels.
+PIEZO_CONNECTED = 0x00000001
+PIEZO_ZEROED = 0x00000010
+PIEZO_ZEROING = 0x00000020
+PIEZO_CLOSED_LOOP = 0x00000400
+PIEZO_ENABLED = 0x80000000
+
+# Error codes, see the Kinesis "Error Codes" documentation.
+FT_OK = 0
+FT_DeviceNotFound = 0x02
+FT_DeviceNotOpened = 0x03
+FT_IncorrectDevice = 0x08
+TL_INVALID_POSITION = 0x26
+TL_INVALID_CHANNEL = 0x2B
+
+# Scale factors and limits of a simulated stage. ``position``, ``velocity``
+# and ``acceleration`` are device units per real unit (mm or degrees), per
+# real unit/s and per real unit/s^2.
+Stage = namedtuple("Stage", ["model",
+                             "position",
+                             "velocity",
+                             "acceleration",
+                             "travel",
+                             "max_velocity",
+                             "max_acceleration",
+                             "rotational",
+                             "motor_params"])
+
+STAGES = {
+    "HS DRV001 8mm": Stage("HS DRV001 8mm", 546100, 29320310, 6008,
+                           (0.0, 8.0), 2.0, 2.0, False, (409600, 1.0, 0.75)),
+    "LTS150": Stage("LTS150", 409600, 21987328, 4506,
+                    (0.0, 150.0), 20.0, 10.0, False, (409600, 1.0, 1.0)),
+    "K10CR1": Stage("K10CR1", 136533.33, 7329109.33, 1502,
+                    (0.0, 360.0), 10.0, 10.0, True, (409600, 120.0, 360.0)),
+    "MLJ050": Stage("MLJ050", 409600, 21987328, 4506,
+                    (0.0, 50.0), 3.0, 4.0, False, (409600, 1.0, 1.0)),
+    "Z825B": Stage("Z825B", 34304, 767367.49, 261.93,
+                   (0.0, 25.0), 2.6, 4.0, False, (512, 67.0, 1.0)),
+}
+
+# Family, model, number of channels and stage of the devices that can be
+# simulated, by serial number prefix.
+MODELS = {
+    40: ("SBC", "BSC201", 1, "HS DRV001 8mm"),
+    70: ("SBC", "BSC203", 3, "HS DRV001 8mm"),
+    45: ("ISC", "LTS150", 1, "LTS150"),
+    55: ("ISC", "K10CR1", 1, "K10CR1"),
+    46: ("ISC", "L490MZ", 1, "MLJ050"),
+    49: ("ISC", "MLJ050", 1, "MLJ050"),
+    27: ("CC", "KDC101", 1, "Z825B"),
+    41: ("PBC", "BPC301", 1, None),
+    71: ("PBC", "BPC303", 3, None),
+    73: ("BMC", "BBD201", 1, "LTS150"),
+}
+
+_MOTOR_TYPES = {"SBC": 2, "ISC": 2, "CC": 1, "BMC": 3, "PBC": 0}
+
+
+class _Scheduler:
+    "Calls functions at given monotonic times from one background thread."
+
+    def __init__(self):
+        self._queue = []
+        self._counter = itertools.count()
+        self._wakeup = threading.Condition()
+        self._thread = None
+
+    def schedule(self, when: float, func: Callable, *args):
+        with self._wakeup:
+            entry = (when, next(self._counter), func, args)
+            heapq.heappush(self._queue, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="thorlabs-kinesis-sim", daemon=True)
+                self._thread.start()
+            if self._queue[0] is entry:
+                self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while True:
+                    if not self._queue:
+                        self._wakeup.wait()
+                        continue
+                    delay = self._queue[0][0] - time.monotonic()
+                    if delay <= 0:
+                        _, _, func, args = heapq.heappop(self._queue)
+                        break
+                    self._wakeup.wait(delay)
+            try:
+                func(*args)
+            except Exception:
+                traceback.print_exc()
+
+
+class _Motion:
+    """Move of a channel made of constant acceleration segments, each given
+    as (start time, start position, start velocity, acceleration).
+    """
+
+    __slots__ = ("kind", "segments", "start", "end", "target", "direction")
+
+    def __init__(self, kind: str, segments: list, start: float, end: float,
+                 target: float):
+        self.kind = kind
+        self.segments = segments
+        self.start = start
+        self.end = end
+        self.target = target
+        self.direction = 0
+        for _, _, velocity, acceleration in segments:
+            if velocity or acceleration:
+                self.direction = 1 if (velocity or acceleration) > 0 else -1
+                break
+
+    @classmethod
+    def trapezoid(cls, kind: str, start: float, position: float,
+                  target: float, velocity: float, acceleration: float):
+        "Move from rest to rest with a trapezoidal velocity profile."
+        distance = abs(target - position)
+        sign = 1.0 if target >= position else -1.0
+        if distance == 0 or velocity <= 0 or acceleration <= 0:
+            return cls(kind, [], start, start, target)
+
+        if distance * acceleration <= velocity * velocity:
+            ramp = math.sqrt(distance / acceleration)
+            cruise = 0.0
+            velocity = acceleration * ramp
+        else:
+            ramp = velocity / acceleration
+            cruise = (distance - velocity * ramp) / velocity
+
+        ramp_distance = 0.5 * acceleration * ramp * ramp
+        segments = [
+            (start, position, 0.0, sign * acceleration),
+            (start + ramp, position + sign * ramp_distance,
+             sign * velocity, 0.0),
+            (start + ramp + cruise,
+             position + sign * (ramp_distance + velocity * cruise),
+             sign * velocity, -sign * acceleration),
+        ]
+        return cls(kind, segments, start, start + 2 * ramp + cruise, target)
+
+    @classmethod
+    def deceleration(cls, kind: str, start: float, position: float,
+                     velocity: float, acceleration: float):
+        "Profiled stop from the given velocity."
+        if velocity == 0 or acceleration <= 0:
+            return cls(kind, [], start, start, position)
+
+        sign = 1.0 if velocity > 0 else -1.0
+        duration = abs(velocity) / acceleration
+        target = position + sign * 0.5 * velocity * velocity / acceleration
+        return cls(kind, [(start, position, velocity, -sign * acceleration)],
+                   start, start + duration, target)
+
+    def _segment(self, t: float):
+        for segment in reversed(self.segments):
+            if t >= segment[0]:
+                return segment
+        return None
+
+    def position(self, t: float) -> float:
+        if t >= self.end:
+            return self.target
+        segment = self._segment(t)
+        if segment is None:
+            return self.segments[0][1] if self.segments else self.target
+        start, position, velocity, acceleration = segment
+        dt = t - start
+        return position + velocity * dt + 0.5 * acceleration * dt * dt
+
+    def velocity(self, t: float) -> float:
+        if t >= self.end:
+            return 0.0
+        segment = self._segment(t)
+        if segment is None:
+            return 0.0
+        start, _, velocity, acceleration = segment
+        return velocity + acceleration * (t - start)
+
+
+class _Channel:
+    "State shared by all simulated channels."
+
+    def __init__(self, device: "SimDevice", number: int):
+        self.device = device
+        self.engine = device.engine
+        self.number = number
+        self.lock = device.lock
+        self.enabled = True
+        self.messages = deque(maxlen=MESSAGE_QUEUE_SIZE)
+        self.message_added = threading.Condition(self.lock)
+        self.callback = None
+        self.polling = 0
+        self.polling_since = 0.0
+        self.requested = 0.0
+        self.last_message = 0.0
+        self.last_msg_timeout = None
+        self.params = {}
+
+    def polling_period(self) -> float:
+        "Achieved polling period in seconds, 0 if not polling."
+        if not self.polling:
+            return 0.0
+        return self.polling / 1000.0 * self.engine.bus_load_factor()
+
+    def sample_time(self, now: float) -> float:
+        """Time of the last status update received from the device, which is
+        what the cached position and status bits reflect.
+        """
+        sample = self.requested
+        period = self.polling_period()
+        if period:
+            ticks = math.floor((now - self.polling_since) / period)
+            sample = max(sample, self.polling_since + ticks * period)
+        if not self.device.connected:
+            sample = min(sample, self.device.disconnected_at)
+        return sample
+
+    def request(self):
+        if self.device.connected:
+            self.requested = self.engine.now()
+
+    def start_polling(self, milliseconds: int):
+        with self.lock:
+            self.engine._set_polling(self, milliseconds)
+            self.polling_since = self.engine.now()
+
+    def stop_polling(self):
+        with self.lock:
+            self.engine._set_polling(self, 0)
+
+    def time_since_last_message(self, now: float) -> float:
+        return now - max(self.sample_time(now), self.last_message)
+
+    def push_message(self, message_type: int, message_id: int, data: int):
+        with self.lock:
+            if not self.device.connected:
+                return
+            self.messages.append((message_type, message_id,
+                                  data & 0xFFFFFFFF))
+            self.last_message = self.engine.now()
+            self.message_added.notify_all()
+            callback = self.callback
+        if callback is not None:
+            callback()
+
+    def next_message(self, wait: bool=False):
+        with self.lock:
+            while wait and not self.messages:
+                self.message_added.wait()
+            if self.messages:
+                return self.messages.popleft()
+            return None
+
+
+class MotorChannel(_Channel):
+    "Simulated stepper, DC servo or brushless motor channel."
+
+    def __init__(self, device: "SimDevice", number: int, stage: Stage):
+        super().__init__(device, number)
+        self.stage = stage
+        self.counts = float(stage.position)
+        self.velocity_scale = float(stage.velocity)
+        self.acceleration_scale = float(stage.acceleration)
+        self.motor_params = stage.motor_params
+        self.min_position = stage.travel[0] * self.counts
+        self.max_position = stage.travel[1] * self.counts
+        self.velocity_params = [
+            0,
+            round(stage.max_acceleration * self.acceleration_scale),
+            round(stage.max_velocity * self.velocity_scale),
+        ]
+        self.homing_velocity = round(0.5 * stage.max_velocity
+                                     * self.velocity_scale)
+        self.jog_mode = (2, 2)
+        self.jog_step_size = round(0.1 * self.counts)
+        self.jog_velocity_params = list(self.velocity_params)
+        self.move_absolute_position = 0
+        self.move_relative_distance = 0
+        self.backlash = 0
+        self.bow_index = 0
+        self.rotation_modes = (0, 0)
+        self.encoder_offset = 0
+        self.rest = 0.0
+        self.motion = None
+        self.generation = 0
+        self.homed = False
+
+    def _counts_per_second(self, velocity: int) -> float:
+        return velocity / self.velocity_scale * self.counts
+
+    def _counts_per_second2(self, acceleration: int) -> float:
+        return acceleration / self.acceleration_scale * self.counts
+
+    def position(self, t: float) -> float:
+        motion = self.motion
+        if motion is None:
+            return self.rest
+        return motion.position(t)
+
+    def velocity(self, t: float) -> float:
+        motion = self.motion
+        return 0.0 if motion is None else motion.velocity(t)
+
+    def reported_position(self, now: float) -> int:
+        return int(round(self.position(self.sample_time(now))))
+
+    def status_bits(self, t: float) -> int:
+        bits = STATUS_CONNECTED if self.device.connected else 0
+        if self.enabled:
+            bits |= STATUS_ENABLED
+        if self.homed:
+            bits |= STATUS_HOMED
+
+        motion = self.motion
+        if motion is not None and motion.start <= t < motion.end:
+            if motion.kind == "home":
+                bits |= STATUS_HOMING
+            if motion.kind == "jog":
+                bits |= (STATUS_JOGGING_FORWARD if motion.direction > 0
+                         else STATUS_JOGGING_REVERSE)
+            else:
+                bits |= (STATUS_MOVING_FORWARD if motion.direction > 0
+                         else STATUS_MOVING_REVERSE)
+
+        if not self.stage.rotational:
+            position = self.position(t)
+            if position >= self.max_position:
+                bits |= STATUS_FORWARD_LIMIT
+            elif position <= self.min_position:
+                bits |= STATUS_REVERSE_LIMIT
+        return bits
+
+    def reported_status_bits(self, now: float) -> int:
+        return self.status_bits(self.sample_time(now))
+
+    def in_range(self, position: float) -> bool:
+        if self.stage.rotational:
+            return True
+        return self.min_position <= position <= self.max_position
+
+    def move_to(self, target: float, kind: str="move",
+                velocity: int=None, acceleration: int=None):
+        "Starts a move to the given position in device units."
+        velocity = self.velocity_params[2] if velocity is None else velocity
+        if acceleration is None:
+            acceleration = self.velocity_params[1]
+
+        with self.lock:
+            now = self.engine.now()
+            self._start(_Motion.trapezoid(
+                kind, now, self.position(now), float(target),
+                self._counts_per_second(velocity),
+                self._counts_per_second2(acceleration)))
+
+    def home(self):
+        self.move_to(0.0, "home", velocity=self.homing_velocity)
+
+    def move_at_velocity(self, direction: int, kind: str="velocity"):
+        "Moves in the given direction until a limit or a stop."
+        target = self.max_position if direction > 0 else self.min_position
+        if self.stage.rotational:
+            target = self.position(self.engine.now()) + direction * 1e12
+        velocity, acceleration = (self.jog_velocity_params[2],
+                                  self.jog_velocity_params[1])
+        if kind != "jog":
+            velocity, acceleration = (self.velocity_params[2],
+                                      self.velocity_params[1])
+        self.move_to(target, kind, velocity, acceleration)
+
+    def jog(self, direction: int):
+        if self.jog_mode[0] == 1:
+            self.move_at_velocity(direction, "jog")
+            return
+        with self.lock:
+            start = self.position(self.engine.now())
+            if self.motion is not None:
+                start = self.motion.target
+        self.move_to(start + direction * self.jog_step_size, "jog",
+                     self.jog_velocity_params[2], self.jog_velocity_params[1])
+
+    def stop(self, immediate: bool):
+        with self.lock:
+            now = self.engine.now()
+            if self.motion is None or now >= self.motion.end:
+                return
+            if immediate:
+                self.rest = self.position(now)
+                self.motion = None
+                self.generation += 1
+                self.engine.schedule(now, self._stopped, self.generation)
+            else:
+                self._start(_Motion.deceleration(
+                    "stop", now, self.position(now), self.velocity(now),
+                    self._counts_per_second2(self.velocity_params[1])))
+
+    def _start(self, motion: _Motion):
+        self.generation += 1
+        self.rest = motion.target
+        self.motion = motion
+        self.engine.schedule(motion.end, self._finish, self.generation)
+
+    def _stopped(self, generation: int):
+        if generation == self.generation:
+            self.push_message(GENERIC_MOTOR, STOPPED,
+                              int(round(self.rest)))
+
+    def _finish(self, generation: int):
+        with self.lock:
+            motion = self.motion
+            if generation != self.generation or motion is None:
+                return
+            self.motion = None
+            self.rest = motion.target
+            if motion.kind == "home":
+                self.homed = True
+                message_id = HOMED
+            elif motion.kind in ("move", "jog") and self.in_range(self.rest):
+                message_id = MOVED
+            else:
+                message_id = STOPPED
+            if not self.stage.rotational:
+                self.rest = min(max(self.rest, self.min_position),
+                                self.max_position)
+        self.push_message(GENERIC_MOTOR, message_id, int(round(self.rest)))
+
+    def set_motor_params(self, steps_per_rev: float, gearbox_ratio: float,
+                         pitch: float):
+        "Rescales the device units like *_SetMotorParamsExt does."
+        with self.lock:
+            counts = steps_per_rev * gearbox_ratio / pitch
+            ratio = counts / self.counts
+            self.motor_params = (steps_per_rev, gearbox_ratio, pitch)
+            self.counts = counts
+            self.velocity_scale *= ratio
+            self.acceleration_scale *= ratio
+            self.min_position *= ratio
+            self.max_position *= ratio
+
+    def scale(self, unit_type: int) -> float:
+        "Device units per real unit for distance, velocity or acceleration."
+        return (self.counts, self.velocity_scale,
+                self.acceleration_scale)[unit_type]
+
+
+class PiezoChannel(_Channel):
+    "Simulated piezo controller channel."
+
+    def __init__(self, device: "SimDevice", number: int):
+        super().__init__(device, number)
+        self.position = 0
+        self.output_voltage = 0
+        self.max_output_voltage = 750
+        self.maximum_travel = 200
+        self.control_mode = 1
+        self.zeroed = False
+        self.zeroing_until = 0.0
+
+    def set_position(self, position: int):
+        with self.lock:
+            self.position = position
+            self.output_voltage = position
+        self.engine.schedule(self.engine.now(), self.push_message,
+                             GENERIC_PIEZO, STATUS_CHANGED, position)
+
+    def set_zero(self):
+        with self.lock:
+            self.zeroed = False
+            self.zeroing_until = self.engine.now() + 0.1
+            self.position = 0
+            self.output_voltage = 0
+        self.engine.schedule(self.zeroing_until, self._zeroed)
+
+    def _zeroed(self):
+        with self.lock:
+            self.zeroed = True
+        self.push_message(GENERIC_PIEZO, STATUS_CHANGED, 0)
+
+    def reported_status_bits(self, now: float) -> int:
+        bits = PIEZO_CONNECTED if self.device.connected else 0
+        if self.enabled:
+            bits |= PIEZO_ENABLED
+        if self.zeroed:
+            bits |= PIEZO_ZEROED
+        elif now < self.zeroing_until:
+            bits |= PIEZO_ZEROING
+        if self.control_mode in (2, 4):
+            bits |= PIEZO_CLOSED_LOOP
+        return bits
+
+
+class SimDevice:
+    "Simulated controller with one or more channels."
+
+    def __init__(self, engine: "Engine", serial: str, family: str,
+                 model: str, channels: int, stage: Optional[Stage]):
+        self.engine = engine
+        self.serial = serial
+        self.prefix = int(serial[:2])
+        self.family = family
+        self.model = model
+        self.lock = threading.RLock()
+        self.opened = False
+        self.connected = True
+        self.disconnected_at = 0.0
+        if stage is None:
+            self.channels = {n: PiezoChannel(self, n)
+                             for n in range(1, channels + 1)}
+        else:
+            self.channels = {n: MotorChannel(self, n, stage)
+                             for n in range(1, channels + 1)}
+
+    @property
+    def description(self) -> str:
+        device = serial_prefix.get(self.prefix)
+        return self.model if device is None else device.type
+
+    @property
+    def motor_type(self) -> int:
+        return _MOTOR_TYPES.get(self.family, 0)
+
+    def open(self) -> int:
+        if not self.connected:
+            return FT_DeviceNotFound
+        with self.lock:
+            self.opened = True
+            now = self.engine.now()
+            for channel in self.channels.values():
+                channel.requested = now
+                channel.last_message = now
+        for channel in self.channels.values():
+            channel.push_message(GENERIC_DEVICE, SETTINGS_INITIALIZED, 0)
+        return FT_OK
+
+    def close(self):
+        with self.lock:
+            self.opened = False
+            for channel in self.channels.values():
+                channel.stop_polling()
+                channel.callback = None
+
+
+class Engine:
+    """Collection of simulated devices sharing one clock and one scheduler
+    thread. ``bus_capacity`` optionally limits the total number of status
+    polls per second; when the polling channels ask for more, every polling
+    period is stretched by the same factor, like on a saturated USB hub.
+    ``scan_time`` is how long ``TLI_BuildDeviceList`` takes to enumerate the
+    bus.
+    """
+
+    def __init__(self, bus_capacity: float=None, scan_time: float=0.0):
+        self.bus_capacity = bus_capacity
+        self.scan_time = scan_time
+        self._devices = {}  # type: Dict[str, SimDevice]
+        self._lock = threading.Lock()
+        self._scheduler = _Scheduler()
+        self._poll_load = 0.0
+
+    now = staticmethod(time.monotonic)
+
+    def schedule(self, when: float, func: Callable, *args):
+        self._scheduler.schedule(when, func, *args)
+
+    def add_device(self, serial: str, model: str=None,
+                   channels: int=None, stage: str=None) -> SimDevice:
+        """Adds a device. Its family, model, channel count and stage follow
+        from the first two digits of the serial number unless given.
+        """
+        serial = str(serial)
+        if not re.fullmatch(r"\d{8}", serial):
+            raise ValueError(f"Invalid serial number {serial!r}.")
+
+        prefix = int(serial[:2])
+        if prefix not in MODELS:
+            raise ValueError(f"Can't simulate devices with prefix {prefix}.")
+        family, default_model, default_channels, default_stage = \
+            MODELS[prefix]
+
+        stage = default_stage if stage is None else stage
+        device = SimDevice(self, serial, family, model or default_model,
+                           channels or default_channels,
+                           None if stage is None else STAGES[stage])
+        with self._lock:
+            if serial in self._devices:
+                raise ValueError(f"Device {serial} already exists.")
+            self._devices[serial] = device
+        return device
+
+    def add_devices(self, prefix: int, count: int,
+                    start: int=1, **kwargs) -> List[str]:
+        "Adds ``count`` devices with consecutive serial numbers."
+        serials = [f"{prefix:02d}{n:06d}" for n in range(start, start + count)]
+        for serial in serials:
+            self.add_device(serial, **kwargs)
+        return serials
+
+    def remove_device(self, serial: str):
+        with self._lock:
+            device = self._devices.pop(serial)
+        device.close()
+
+    def reset(self):
+        "Removes all devices."
+        for serial in list(self._devices):
+            self.remove_device(serial)
+
+    def device(self, serial: str) -> SimDevice:
+        return self._devices[serial]
+
+    @property
+    def devices(self) -> List[SimDevice]:
+        return list(self._devices.values())
+
+    def serials(self) -> List[str]:
+        "Serial numbers of the connected devices."
+        return [serial for serial, device in self._devices.items()
+                if device.connected]
+
+    def disconnect(self, serial: str):
+        "Simulates unplugging a device."
+        device = self._devices[serial]
+        with device.lock:
+            device.connected = False
+            device.disconnected_at = self.now()
+
+    def reconnect(self, serial: str):
+        "Simulates plugging a device back in. It has to be opened again."
+        device = self._devices[serial]
+        with device.lock:
+            device.connected = True
+            device.opened = False
+
+    def _set_polling(self, channel: _Channel, milliseconds: int):
+        with self._lock:
+            if channel.polling:
+                self._poll_load -= 1000.0 / channel.polling
+            channel.polling = max(int(milliseconds), 0)
+            if channel.polling:
+                self._poll_load += 1000.0 / channel.polling
+
+    def bus_load_factor(self) -> float:
+        "Factor the requested polling periods are stretched by."
+        if not self.bus_capacity or self._poll_load <= self.bus_capacity:
+            return 1.0
+        return self._poll_load / self.bus_capacity
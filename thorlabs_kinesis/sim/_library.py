@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Thorlabs-Kinesis Project Contributors
+# Licensed under the terms of the GNU GPLv3+ License
+# (see thorlabs_kinesis/__init__.py for details)
+
+"""
+Simulated Library
+-----------------
+
+Stand-in for the Kinesis DLLs. Every bound function is wrapped in a ctypes
+callback with the same prototype as the DLL function, so arguments are
+converted exactly as they would be for the real library.
+"""
+
+import time
+from ctypes import (
+    CFUNCTYPE,
+    Structure,
+    _Pointer,
+    c_bool,
+    c_char_p,
+    c_short,
+    cast,
+    memmove,
+    sizeof,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from thorlabs_kinesis._backend import Library
+from thorlabs_kinesis.sim._engine import (
+    FT_DeviceNotFound,
+    FT_DeviceNotOpened,
+    FT_IncorrectDevice,
+    FT_OK,
+    TL_INVALID_CHANNEL,
+    TL_INVALID_POSITION,
+    Engine,
+    MotorChannel,
+)
+
+# Families whose functions take the channel after the serial number.
+_CHANNEL_FAMILIES = {"SBC", "PBC", "BMC"}
+
+
+def _serial(pointer) -> str:
+    return cast(pointer, c_char_p).value.decode()
+
+
+def _write_string(pointer, size: int, text: str):
+    data = text.encode()[:max(size - 1, 0)] + b"\0"
+    memmove(pointer, data, min(len(data), size))
+
+
+def _set_fields(pointer, **fields):
+    for name, value in fields.items():
+        setattr(pointer[0], name, value)
+
+
+# Operations shared by all channels. Each one is called with the channel and
+# the remaining arguments of the DLL function.
+
+def _open(ch):
+    return ch.device.open()
+
+
+def _close(ch):
+    ch.device.close()
+
+
+def _check_connection(ch):
+    return ch.device.connected
+
+
+def _is_channel_valid(ch):
+    return True
+
+
+def _num_channels(ch, *args):
+    return len(ch.device.channels)
+
+
+def _enable_channel(ch):
+    ch.enabled = True
+
+
+def _disable_channel(ch):
+    ch.enabled = False
+
+
+def _hardware_info(ch, model, model_size, hw_type, channels, notes,
+                   notes_size, firmware, hw_version, mod_state):
+    _write_string(model, model_size, ch.device.model)
+    _write_string(notes, notes_size, ch.device.description)
+    hw_type[0] = 16
+    channels[0] = len(ch.device.channels)
+    firmware[0] = 0x00030000
+    hw_version[0] = 1
+    mod_state[0] = 0
+
+
+def _hardware_info_block(ch, info):
+    if isinstance(info, _Pointer):
+        info = info[0]
+    info.serialNumber = int(ch.device.serial)
+    info.modelNumber = ch.device.model.encode()
+    info.type = 16
+    info.numChannels = len(ch.device.channels)
+    info.notes = ch.device.description.encode()
+    info.firmwareVersion = 0x00030000
+    info.hardwareVersion = 1
+
+
+def _request(ch):
+    ch.request()
+
+
+def _start_polling(ch, milliseconds):
+    ch.start_polling(milliseconds)
+    return True
+
+
+def _stop_polling(ch):
+    ch.stop_polling()
+
+
+def _polling_duration(ch):
+    return int(round(ch.polling_period() * 1000))
+
+
+def _clear_message_queue(ch):
+    with ch.lock:
+        ch.messages.clear()
+
+
+def _message_queue_size(ch):
+    return len(ch.messages)
+
+
+def _register_message_callback(ch, *args):
+    ch.callback = args[-1]
+
+
+def _message(ch, message_type, message_id, data, wait=False):
+    message = ch.next_message(wait)
+    if message is None:
+        return False
+    message_type[0], message_id[0], data[0] = message
+    return True
+
+
+def _wait_for_message(ch, message_type, message_id, data):
+    return _message(ch, message_type, message_id, data, wait=True)
+
+
+def _enable_last_msg_timer(ch, enable, timeout):
+    ch.last_msg_timeout = timeout if enable else None
+
+
+def _has_last_msg_timer_overrun(ch):
+    if ch.last_msg_timeout is None:
+        return False
+    now = ch.engine.now()
+    return ch.time_since_last_message(now) * 1000 > ch.last_msg_timeout
+
+
+def _time_since_last_msg_received(ch, milliseconds):
+    milliseconds[0] = int(ch.time_since_last_message(ch.engine.now()) * 1000)
+    return ch.last_msg_timeout is not None
+
+
+def _status_bits(ch):
+    return ch.reported_status_bits(ch.engine.now())
+
+
+_COMMON = {
+    "Open": _open,
+    "Close": _close,
+    "CheckConnection": _check_connection,
+    "IsChannelValid": _is_channel_valid,
+    "GetNumChannels": _num_channels,
+    "MaxChannelCount": _num_channels,
+    "EnableChannel": _enable_channel,
+    "DisableChannel": _disable_channel,
+    "GetHardwareInfo": _hardware_info,
+    "GetHardwareInfoBlock": _hardware_info_block,
+    "LoadSettings": lambda ch, *args: True,
+    "LoadNamedSettings": lambda ch, *args: True,
+    "PersistSettings": lambda ch: True,
+    "RequestStatus": _request,
+    "RequestStatusBits": _request,
+    "RequestPosition": _request,
+    "GetStatusBits": _status_bits,
+    "StartPolling": _start_polling,
+    "StopPolling": _stop_polling,
+    "PollingDuration": _polling_duration,
+    "ClearMessageQueue": _clear_message_queue,
+    "MessageQueueSize": _message_queue_size,
+    "RegisterMessageCallback": _register_message_callback,
+    "GetNextMessage": _message,
+    "WaitForMessage": _wait_for_message,
+    "EnableLastMsgTimer": _enable_last_msg_timer,
+    "HasLastMsgTimerOverrun": _has_last_msg_timer_overrun,
+    "TimeSinceLastMsgReceived": _time_since_last_msg_received,
+}
+
+
+# Motor channel operations.
+
+def _move_to(ch, position):
+    if not ch.in_range(position):
+        return TL_INVALID_POSITION
+    ch.move_to(position)
+
+
+def _move_relative(ch, distance):
+    with ch.lock:
+        return _move_to(ch, ch.rest + distance)
+
+
+def _set_move_absolute_position(ch, position):
+    ch.move_absolute_position = position
+
+
+def _set_move_relative_distance(ch, distance):
+    ch.move_relative_distance = distance
+
+
+def _direction(direction):
+    return 1 if direction == 1 else -1
+
+
+def _set_vel_params(ch, acceleration, max_velocity):
+    ch.velocity_params[1:] = [acceleration, max_velocity]
+
+
+def _get_vel_params(ch, acceleration, max_velocity):
+    acceleration[0], max_velocity[0] = ch.velocity_params[1:]
+
+
+def _set_vel_params_block(ch, params):
+    ch.velocity_params[:] = [params[0].minVelocity, params[0].acceleration,
+                             params[0].maxVelocity]
+
+
+def _get_vel_params_block(ch, params):
+    minimum, acceleration, maximum = ch.velocity_params
+    _set_fields(params, minVelocity=minimum, acceleration=acceleration,
+                maxVelocity=maximum)
+
+
+def _set_jog_vel_params(ch, acceleration, max_velocity):
+    ch.jog_velocity_params[1:] = [acceleration, max_velocity]
+
+
+def _get_jog_vel_params(ch, acceleration, max_velocity):
+    acceleration[0], max_velocity[0] = ch.jog_velocity_params[1:]
+
+
+def _set_jog_mode(ch, mode, stop_mode):
+    ch.jog_mode = (mode, stop_mode)
+
+
+def _get_jog_mode(ch, mode, stop_mode):
+    mode[0], stop_mode[0] = ch.jog_mode
+
+
+def _set_homing_params_block(ch, params):
+    ch.homing_velocity = params[0].velocity
+
+
+def _get_homing_params_block(ch, params):
+    _set_fields(params, direction=2, limitSwitch=1,
+                velocity=ch.homing_velocity, offsetDistance=0)
+
+
+def _set_motor_params_ext(ch, steps_per_rev, gearbox_ratio, pitch):
+    ch.set_motor_params(steps_per_rev, gearbox_ratio, pitch)
+
+
+def _get_motor_params_ext(ch, steps_per_rev, gearbox_ratio, pitch):
+    steps_per_rev[0], gearbox_ratio[0], pitch[0] = ch.motor_params
+
+
+def _set_stage_axis_limits(ch, minimum, maximum):
+    ch.min_position, ch.max_position = float(minimum), float(maximum)
+
+
+def _real_value_from_device_unit(ch, device_unit, real_unit, unit_type):
+    real_unit[0] = device_unit / ch.scale(unit_type)
+
+
+def _device_unit_from_real_value(ch, real_unit, device_unit, unit_type):
+    device_unit[0] = int(round(real_unit * ch.scale(unit_type)))
+
+
+def _set_rotation_modes(ch, mode, direction):
+    ch.rotation_modes = (mode, direction)
+
+
+_MOTOR = {
+    "Home": lambda ch: ch.home(),
+    "CanHome": lambda ch: True,
+    "NeedsHoming": lambda ch: not ch.homed,
+    "CanMoveWithoutHomingFirst": lambda ch: False,
+    "GetPosition": lambda ch: ch.reported_position(ch.engine.now()),
+    "GetEncoderCounter": lambda ch: (ch.reported_position(ch.engine.now())
+                                     + ch.encoder_offset),
+    "SetEncoderCounter": lambda ch, count: setattr(
+        ch, "encoder_offset",
+        count - ch.reported_position(ch.engine.now())),
+    "GetPositionCounter": lambda ch: ch.reported_position(ch.engine.now()),
+    "MoveToPosition": _move_to,
+    "MoveRelative": _move_relative,
+    "SetMoveAbsolutePosition": _set_move_absolute_position,
+    "GetMoveAbsolutePosition": lambda ch: ch.move_absolute_position,
+    "MoveAbsolute": lambda ch: _move_to(ch, ch.move_absolute_position),
+    "SetMoveRelativeDistance": _set_move_relative_distance,
+    "GetMoveRelativeDistance": lambda ch: ch.move_relative_distance,
+    "MoveRelativeDistance": lambda ch: _move_relative(
+        ch, ch.move_relative_distance),
+    "MoveAtVelocity": lambda ch, direction: ch.move_at_velocity(
+        _direction(direction)),
+    "MoveJog": lambda ch, direction: ch.jog(_direction(direction)),
+    "StopImmediate": lambda ch: ch.stop(True),
+    "StopProfiled": lambda ch: ch.stop(False),
+    "GetVelParams": _get_vel_params,
+    "SetVelParams": _set_vel_params,
+    "GetVelParamsBlock": _get_vel_params_block,
+    "SetVelParamsBlock": _set_vel_params_block,
+    "GetJogVelParams": _get_jog_vel_params,
+    "SetJogVelParams": _set_jog_vel_params,
+    "GetJogMode": _get_jog_mode,
+    "SetJogMode": _set_jog_mode,
+    "GetJogStepSize": lambda ch: ch.jog_step_size,
+    "SetJogStepSize": lambda ch, size: setattr(ch, "jog_step_size", size),
+    "GetHomingVelocity": lambda ch: ch.homing_velocity,
+    "SetHomingVelocity": lambda ch, v: setattr(ch, "homing_velocity", v),
+    "GetHomingParamsBlock": _get_homing_params_block,
+    "SetHomingParamsBlock": _set_homing_params_block,
+    "GetBacklash": lambda ch: ch.backlash,
+    "SetBacklash": lambda ch, distance: setattr(ch, "backlash", distance),
+    "GetBowIndex": lambda ch: ch.bow_index,
+    "SetBowIndex": lambda ch, index: setattr(ch, "bow_index", index),
+    "GetMotorParamsExt": _get_motor_params_ext,
+    "SetMotorParamsExt": _set_motor_params_ext,
+    "GetStageAxisMinPos": lambda ch: int(round(ch.min_position)),
+    "GetStageAxisMaxPos": lambda ch: int(round(ch.max_position)),
+    "SetStageAxisLimits": _set_stage_axis_limits,
+    "GetRealValueFromDeviceUnit": _real_value_from_device_unit,
+    "GetDeviceUnitFromRealValue": _device_unit_from_real_value,
+    "SetRotationModes": _set_rotation_modes,
+}
+
+
+# Piezo channel operations.
+
+def _set_output_voltage(ch, voltage):
+    ch.output_voltage = voltage
+
+
+def _set_position_control_mode(ch, mode):
+    ch.control_mode = mode
+
+
+_PIEZO = {
+    "GetPosition": lambda ch: ch.position,
+    "SetPosition": lambda ch, position: ch.set_position(position),
+    "GetOutputVoltage": lambda ch: ch.output_voltage,
+    "SetOutputVoltage": _set_output_voltage,
+    "GetMaxOutputVoltage": lambda ch: ch.max_output_voltage,
+    "SetMaxOutputVoltage": lambda ch, v: setattr(ch, "max_output_voltage", v),
+    "GetMaximumTravel": lambda ch: ch.maximum_travel,
+    "GetPositionControlMode": lambda ch: ch.control_mode,
+    "SetPositionControlMode": _set_position_control_mode,
+    "SetZero": lambda ch: ch.set_zero(),
+    "Disconnect": lambda ch: ch.device.close(),
+}
+
+
+def _generic(op: str) -> Callable:
+    """Fallback for operations without a model: ``Set*`` stores the given
+    values and the matching ``Get*`` hands them back, through the pointers it
+    is called with or as its return value.
+    """
+    if op.startswith("Set"):
+        key = op[3:]
+
+        def setter(ch, *args):
+            ch.params[key] = [bytes(arg[0]) if isinstance(arg, _Pointer)
+                              and isinstance(arg[0], Structure)
+                              else arg for arg in args]
+        return setter
+
+    if op.startswith("Get"):
+        key = op[3:]
+
+        def getter(ch, *args):
+            stored = ch.params.get(key)
+            pointers = [arg for arg in args if isinstance(arg, _Pointer)]
+            if not pointers:
+                return stored[0] if stored else 0
+            for pointer, value in zip(pointers, stored or ()):
+                if isinstance(value, bytes):
+                    memmove(pointer, value, min(len(value),
+                                                sizeof(pointer[0])))
+                else:
+                    pointer[0] = value
+        return getter
+
+    return lambda ch, *args: None
+
+
+class SimulatedLibrary(Library):
+    "One of the Kinesis DLLs served by a simulation ``Engine``."
+
+    def __init__(self, engine: Engine, name: str):
+        self.engine = engine
+        self.name = name
+        self._device_list = []
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+    def bind(self, func: str,
+             argtypes: List[Any]=None, restype: Any=None) -> CFUNCTYPE:
+        argtypes = list(argtypes or [])
+        family, _, op = func.partition("_")
+        if family == "TLI":
+            impl = getattr(self, "_" + op, lambda *args: 0)
+        else:
+            impl = self._device_function(family, op, argtypes, restype)
+
+        if restype is None:
+            call = impl
+
+            def impl(*args):
+                call(*args)
+        # Enums of thorlabs_kinesis._types only provide from_param, the
+        # callback needs their C type.
+        prototype = [getattr(argtype, "ctype", argtype)
+                     for argtype in argtypes]
+        return CFUNCTYPE(restype, *prototype)(impl)
+
+    def _device_function(self, family: str, op: str,
+                         argtypes: List[Any], restype: Any) -> Callable:
+        has_channel = (family in _CHANNEL_FAMILIES and len(argtypes) > 1
+                       and argtypes[1] is c_short)
+        needs_open = op != "Open"
+        operations = {}  # type: Dict[str, Callable]
+        engine = self.engine
+
+        def error(code: int):
+            if restype is c_bool:
+                return False
+            return code if restype is c_short else 0
+
+        def function(serial, *args):
+            try:
+                device = engine.device(_serial(serial))
+            except KeyError:
+                return error(FT_DeviceNotFound)
+            if device.family != family:
+                return error(FT_IncorrectDevice)
+            if needs_open and not device.opened:
+                return error(FT_DeviceNotOpened)
+
+            number = 1
+            if has_channel:
+                number, args = args[0], args[1:]
+            channel = device.channels.get(number)
+            if channel is None:
+                return error(TL_INVALID_CHANNEL)
+
+            kind = type(channel)
+            operation = operations.get(kind)
+            if operation is None:
+                table = dict(_COMMON, **(_MOTOR if kind is MotorChannel
+                                         else _PIEZO))
+                operation = operations[kind] = table.get(op) or _generic(op)
+
+            result = operation(channel, *args)
+            if result is None:
+                return True if restype is c_bool else FT_OK
+            return result
+
+        return function
+
+    def _BuildDeviceList(self):
+        if self.engine.scan_time:
+            time.sleep(self.engine.scan_time)
+        self._device_list = self.engine.serials()
+        return FT_OK
+
+    def _GetDeviceListSize(self):
+        return len(self._device_list)
+
+    def _write_device_list(self, buffer, size, serials):
+        _write_string(buffer, size, "".join(s + "," for s in serials))
+        return FT_OK
+
+    def _GetDeviceListExt(self, buffer, size):
+        return self._write_device_list(buffer, size, self._device_list)
+
+    def _GetDeviceListByTypeExt(self, buffer, size, type_id):
+        return self._write_device_list(
+            buffer, size,
+            [s for s in self._device_list if int(s[:2]) == type_id])
+
+    def _GetDeviceListByTypesExt(self, buffer, size, type_ids, length):
+        wanted = {type_ids[i] for i in range(length)}
+        return self._write_device_list(
+            buffer, size,
+            [s for s in self._device_list if int(s[:2]) in wanted])
+
+    def _GetDeviceInfo(self, serial, info):
+        try:
+            device = self.engine.device(_serial(serial))
+        except KeyError:
+            return 0
+        _set_fields(info, typeID=device.prefix,
+                    description=device.description.encode()[:64],
+                    serialNo=device.serial.encode(),
+                    PID=0xFAF0,
+                    isKnownType=True,
+                    motorType=device.motor_type,
+                    isPiezoDevice=device.family == "PBC",
+                    maxChannels=len(device.channels))
+        return 1
+
+
+__all__ = [
+    "SimulatedLibrary",
+]